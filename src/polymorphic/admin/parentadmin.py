@@ -6,15 +6,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Generic, cast
 
+from django.apps import apps
 from django.contrib import admin
 from django.contrib.admin.helpers import AdminErrorList, AdminForm
 from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.db import models
+from django.db.models import ProtectedError, RestrictedError
 from django.http import Http404, HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.utils.encoding import force_str
+from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
 from typing_extensions import TypeVar
 
@@ -73,6 +76,11 @@ class PolymorphicParentModelAdmin(_ModelAdminBase, Generic[_ModelT]):
     #: If your primary key consists of string values, update this regular expression.
     pk_regex = r"(\d+|__fk__)"
 
+    #: The number of selected objects above which the delete confirmation page shows the
+    #: number of rows per model from :meth:`~polymorphic.query.PolymorphicQuerySet.delete_preview`
+    #: instead of collecting and listing every object. Set to ``None`` to always list them.
+    delete_preview_threshold: int | None = 100
+
     def __init__(self, model: type[_ModelT], admin_site: Any, *args: Any, **kwargs: Any) -> None:
         super().__init__(model, admin_site, *args, **kwargs)
         self._is_setup = False
@@ -229,6 +237,36 @@ class PolymorphicParentModelAdmin(_ModelAdminBase, Generic[_ModelT]):
         real_admin = self._get_real_admin(object_id)
         return real_admin.delete_view(request, object_id, extra_context)
 
+    def get_deleted_objects(self, objs, request):
+        """
+        Summarize the deletion of large selections with the number of rows per model
+        instead of collecting every object that would be deleted, see
+        :attr:`delete_preview_threshold`.
+        """
+        if (
+            self.delete_preview_threshold is None
+            or not isinstance(objs, PolymorphicQuerySet)
+            or objs.count() <= self.delete_preview_threshold
+        ):
+            return super().get_deleted_objects(objs, request)
+        try:
+            _total, counts = objs.delete_preview()
+        except (ProtectedError, RestrictedError):
+            # let Django list the objects that prevent the deletion
+            return super().get_deleted_objects(objs, request)
+
+        deleted_objects = []
+        model_count = {}
+        perms_needed = set()
+        for label, count in counts.items():
+            opts = apps.get_model(label)._meta
+            model_count[opts.verbose_name_plural] = count
+            deleted_objects.append(f"{capfirst(opts.verbose_name_plural)}: {count}")
+            model_admin = self.admin_site._registry.get(opts.model)
+            if model_admin is not None and not model_admin.has_delete_permission(request):
+                perms_needed.add(opts.verbose_name)
+        return deleted_objects, model_count, perms_needed, []
+
     def get_urls(self):
         """
         Expose the custom URLs for the subclasses and the URL resolver.
@@ -2,7 +2,10 @@ from typing import Any, Iterable, Sequence
 
 from django.apps import AppConfig, apps
 from django.core.checks import CheckMessage, Error, Tags, Warning, register
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, models
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 @register(Tags.models)
@@ -25,6 +28,55 @@ def check_reserved_field_names(
     return findings
 
 
+@register(Tags.models)
+def check_content_type_registry_entries(
+    app_configs: Sequence[AppConfig] | None, **kwargs: Any
+) -> Iterable[CheckMessage]:
+    """
+    System check that reports polymorphic models missing from the content type registry.
+    """
+    from .registry import get_registry, missing_from_registry
+
+    registry = get_registry()
+    if registry is None:
+        return []
+    return [
+        Warning(
+            f"The content type registry for the {using!r} database is missing "
+            f"{', '.join('.'.join(key) for key in keys)}, their content types are looked "
+            "up in the database.",
+            hint="Run the polymorphic_ctype_registry command to update the registry.",
+            id="polymorphic.W003",
+        )
+        for using, keys in sorted(missing_from_registry(registry).items())
+    ]
+
+
+@register(Tags.database)
+def check_content_type_registry(
+    app_configs: Sequence[AppConfig] | None,
+    databases: Sequence[str] | None = None,
+    **kwargs: Any,
+) -> Iterable[CheckMessage]:
+    """
+    System check that compares the content type registry with the databases.
+    """
+    from .registry import check_registry, get_registry
+
+    registry = get_registry()
+    if registry is None:
+        return []
+    return [
+        Error(
+            problem,
+            hint="Run the polymorphic_ctype_registry command to update the registry.",
+            id="polymorphic.E003",
+        )
+        for using in databases or ()
+        for problem in check_registry(registry, using=using, include_missing=False)
+    ]
+
+
 def _check_polymorphic_managers(model: type[models.Model]) -> list[CheckMessage]:
     from polymorphic.managers import PolymorphicManager
     from polymorphic.query import PolymorphicQuerySet
@@ -86,9 +138,66 @@ def _check_model_reserved_field_names(model: type[models.Model]) -> list[CheckMe
     return errors
 
 
+def _warm_content_types_enabled(using: str) -> bool:
+    from django.conf import settings
+
+    aliases = getattr(settings, "POLYMORPHIC_WARM_CONTENT_TYPES", False)
+    return aliases is True or bool(aliases and using in aliases)
+
+
+def _warm_content_types_after_migrate(
+    app_config: AppConfig, using: str = DEFAULT_DB_ALIAS, **kwargs: Any
+) -> None:
+    """
+    Load the content types of the polymorphic models of every migrated app into a
+    database listed in the ``POLYMORPHIC_WARM_CONTENT_TYPES`` setting, after
+    :mod:`django.contrib.contenttypes` has created them.
+    """
+    from .models import PolymorphicModel
+    from .utils import warm_content_type_cache
+
+    if not _warm_content_types_enabled(using):
+        return
+    models = [model for model in app_config.get_models() if issubclass(model, PolymorphicModel)]
+    if models:
+        warm_content_type_cache(*models, using=using)
+
+
+def _warm_content_types_on_connect(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Load the content types of all polymorphic models when the first connection of the
+    process to a database listed in the ``POLYMORPHIC_WARM_CONTENT_TYPES`` setting is
+    opened.
+    """
+    from .utils import warm_content_type_cache
+
+    if connection.alias in _warmed_aliases or not _warm_content_types_enabled(connection.alias):
+        return
+    try:
+        warm_content_type_cache(using=connection.alias)
+    except DatabaseError:
+        # the content types table may not exist yet, e.g. before the first migrate
+        return
+    _warmed_aliases.add(connection.alias)
+
+
+_warmed_aliases: set[str] = set()
+
+
 class PolymorphicConfig(AppConfig):
     name: str = "polymorphic"
     verbose_name: str = "Django Polymorphic"
 
     def ready(self) -> None:
-        pass
+        from .registry import check_registry_on_connect, load_registry
+
+        load_registry()
+        connection_created.connect(
+            check_registry_on_connect, dispatch_uid="polymorphic_check_content_type_registry"
+        )
+        post_migrate.connect(
+            _warm_content_types_after_migrate, dispatch_uid="polymorphic_warm_content_types"
+        )
+        connection_created.connect(
+            _warm_content_types_on_connect, dispatch_uid="polymorphic_warm_content_types"
+        )
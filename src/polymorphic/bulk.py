@@ -0,0 +1,570 @@
+"""
+Set based bulk operations for polymorphic model hierarchies.
+
+Django's bulk operations work on a single table. Polymorphic models are usually
+multi-table models so these helpers work on each table of the inheritance chain
+separately, issuing one statement per table and batch instead of one per object.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Sequence
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.color import no_style
+from django.core.serializers.base import DeserializedObject
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    DatabaseError,
+    IntegrityError,
+    connections,
+    models,
+    transaction,
+)
+from django.db.models import NOT_PROVIDED, Case, Exists, F, OuterRef, QuerySet, Value, When
+from django.db.models.functions import Cast
+from django.db.models.signals import post_save, pre_save
+
+from .utils import _type_path_update
+
+__all__ = ["bulk_load"]
+
+
+def _batches(objs: Sequence[Any], batch_size: int) -> Iterable[Sequence[Any]]:
+    for idx in range(0, len(objs), batch_size):
+        yield objs[idx : idx + batch_size]
+
+
+def _insert_rows(
+    model: type[models.Model],
+    objs: Sequence[models.Model],
+    using: str = DEFAULT_DB_ALIAS,
+    batch_size: int | None = None,
+    raw: bool = False,
+) -> None:
+    """
+    Insert the rows of ``objs`` into the local table of ``model`` only. Parent tables
+    are not touched, so for multi-table models the parent rows must be inserted first
+    and the parent link set on ``objs``.
+
+    Objects without a primary key have it assigned from the database. This uses
+    ``RETURNING`` on backends that support it and falls back to one insert per object
+    otherwise.
+
+    :param raw: If True, field values are inserted as they are, otherwise
+        :meth:`~django.db.models.Field.pre_save` is called on each field first (e.g. to
+        apply ``auto_now``).
+    """
+    opts = model._meta
+    connection = connections[using]
+    manager = model._base_manager
+    fields = [
+        field for field in opts.local_concrete_fields if not getattr(field, "generated", False)
+    ]
+
+    with_pk = [obj for obj in objs if obj._get_pk_val(opts) is not None]
+    without_pk = [obj for obj in objs if obj._get_pk_val(opts) is None]
+
+    def batch_size_for(insert_fields: list[models.Field[Any, Any]], rows: Sequence[Any]) -> int:
+        max_batch_size = max(connection.ops.bulk_batch_size(insert_fields, rows), 1)
+        return min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+    if with_pk:
+        for batch in _batches(with_pk, batch_size_for(fields, with_pk)):
+            manager._insert(batch, fields=fields, using=using, raw=raw)  # type: ignore[attr-defined]
+
+    if without_pk:
+        returning_fields = opts.db_returning_fields
+        insert_fields = [field for field in fields if field not in returning_fields]
+        size = (
+            batch_size_for(insert_fields, without_pk)
+            if connection.features.can_return_rows_from_bulk_insert
+            else 1
+        )
+        for batch in _batches(without_pk, size):
+            rows = manager._insert(  # type: ignore[attr-defined]
+                batch,
+                fields=insert_fields,
+                returning_fields=returning_fields,
+                using=using,
+                raw=raw,
+            )
+            for obj, row in zip(batch, rows):
+                for field, value in zip(returning_fields, row):
+                    setattr(obj, field.attname, value)
+
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
+
+
+def _table_order(model: type[models.Model]) -> int:
+    """Sort key that puts parent tables before the tables of their children."""
+    return len(model._meta.get_parent_list())
+
+
+def _shares_pk(table: type[models.Model], ancestor: type[models.Model]) -> bool:
+    """
+    Whether the rows of ``table`` have the primary keys of the rows of ``ancestor`` they
+    belong to, i.e. every parent link between them is the primary key of its table.
+    """
+    return all(
+        (field is None or field.primary_key) and _shares_pk(parent, ancestor)
+        for parent, field in table._meta.parents.items()
+        if issubclass(parent, ancestor)
+    )
+
+
+def _table_pks(
+    table: type[models.Model],
+    ancestor: type[models.Model],
+    pks: Sequence[Any],
+    using: str = DEFAULT_DB_ALIAS,
+) -> Sequence[Any]:
+    """
+    Return the primary keys of the rows of ``table`` that belong to the rows of
+    ``ancestor`` with the primary keys ``pks``.
+    """
+    if _shares_pk(table, ancestor):
+        return pks
+    return list(
+        QuerySet(model=table, using=using)
+        .filter(**{f"{ancestor._meta.pk.name}__in": pks})
+        .values_list("pk", flat=True)
+    )
+
+
+def _sync_parent_links(model: type[models.Model], obj: models.Model) -> None:
+    """
+    Copy parent links that were set explicitly to the primary keys of the parents, as
+    :meth:`~django.db.models.Model.save` does.
+    """
+    for parent, link in model._meta.parents.items():
+        if (
+            link
+            and getattr(obj, parent._meta.pk.attname) is None
+            and getattr(obj, link.attname) is not None
+        ):
+            setattr(obj, parent._meta.pk.attname, getattr(obj, link.attname))
+        _sync_parent_links(parent, obj)
+
+
+def _bulk_create_multi_table(
+    objs: Sequence[models.Model],
+    using: str = DEFAULT_DB_ALIAS,
+    batch_size: int | None = None,
+) -> None:
+    """
+    Insert multi-table model instances of any mix of classes with one ``INSERT`` per
+    table and batch. Tables are filled parents first and the primary keys of the
+    inserted parent rows are copied to the parent links of the child rows.
+    """
+    tables: defaultdict[type[models.Model], list[models.Model]] = defaultdict(list)
+    for obj in objs:
+        concrete_model = obj._meta.concrete_model
+        assert concrete_model is not None
+        _sync_parent_links(concrete_model, obj)
+        for model in (concrete_model, *concrete_model._meta.get_parent_list()):
+            tables[model].append(obj)
+
+    with transaction.atomic(using=using, savepoint=False):
+        for model in sorted(tables, key=_table_order):
+            table_objs = tables[model]
+            for parent, link in model._meta.parents.items():
+                if link:
+                    for obj in table_objs:
+                        setattr(obj, link.attname, getattr(obj, parent._meta.pk.attname))
+            _insert_rows(model, table_objs, using=using, batch_size=batch_size)
+
+
+def _ctype_model(model: type[models.Model]) -> type[models.Model]:
+    """The concrete model whose table holds the ``polymorphic_ctype`` column."""
+    return model._meta.get_field("polymorphic_ctype").model  # type: ignore[return-value]
+
+
+def _insert_from_select(
+    model: type[models.Model],
+    pks: Sequence[Any],
+    template: models.Model,
+    explicit: Collection[str] = (),
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Insert a row into the local table of ``model`` for each of ``pks`` that does not
+    have one yet with a single ``INSERT ... SELECT``. The parent links are set to the
+    primary key and the other columns to the values of ``template``. Columns with a
+    database default are left to the database unless they are named in ``explicit``.
+    """
+    links = set(model._meta.parents.values())
+    columns: list[str] = []
+    select: list[str] = []
+    values: dict[str, Any] = {}
+    for idx, field in enumerate(model._meta.local_concrete_fields):
+        if getattr(field, "generated", False):
+            continue
+        if field in links:
+            values[f"_polymorphic_value_{idx}"] = F("pk")
+            select.append(f"_polymorphic_value_{idx}")
+        elif getattr(field, "db_default", NOT_PROVIDED) is not NOT_PROVIDED and not (
+            {field.name, field.attname} & set(explicit)
+        ):
+            continue  # leave it to the database
+        else:
+            alias = f"_polymorphic_value_{idx}"
+            value = Value(field.pre_save(template, add=True), output_field=field)
+            values[alias] = Cast(value, output_field=field)
+            select.append(alias)
+        columns.append(field.column)
+
+    source = (
+        QuerySet(model=_ctype_model(model), using=using)
+        .filter(pk__in=pks)
+        .exclude(Exists(QuerySet(model=model, using=using).filter(pk=OuterRef("pk"))))
+        .annotate(**values)
+        .values_list(*select)
+    )
+    _execute_insert_select(model, columns, source, using)
+
+
+def _execute_insert_select(
+    model: type[models.Model],
+    columns: Sequence[str],
+    source: QuerySet[Any],
+    using: str = DEFAULT_DB_ALIAS,
+) -> int:
+    """
+    Run ``INSERT INTO <table of model> (columns) <source>``. The columns of ``source``
+    must all be annotations, so they are selected in the order they were added.
+    """
+    sql, params = source.query.get_compiler(using=using).as_sql()
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {qn(model._meta.db_table)} ({', '.join(map(qn, columns))}) {sql}",
+            params,
+        )
+        return cursor.rowcount
+
+
+def _convert_rows(
+    model: type[models.Model],
+    pks: Sequence[Any],
+    defaults: dict[str, Any] | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+    chunk_size: int = 1000,
+) -> None:
+    """
+    Promote the rows of ``pks`` to ``model`` by inserting the missing rows of the
+    tables down to ``model``, parents first, and setting their content type.
+    """
+    defaults = defaults or {}
+    template = model(**defaults)
+    ctype = ContentType.objects.db_manager(using).get_for_model(model, for_concrete_model=False)
+    tables = sorted(
+        (table for table in (model, *model._meta.get_parent_list()) if table._meta.parents),
+        key=_table_order,
+    )
+    with transaction.atomic(using=using, savepoint=False):
+        for chunk in _batches(pks, chunk_size):
+            for table in tables:
+                _insert_from_select(table, chunk, template, explicit=defaults, using=using)
+            QuerySet(model=_ctype_model(model), using=using).filter(pk__in=chunk).update(
+                polymorphic_ctype=ctype, **_type_path_update(model)
+            )
+
+
+def _demote_rows(
+    model: type[models.Model],
+    tables: Sequence[type[models.Model]],
+    pks: Sequence[Any],
+    using: str = DEFAULT_DB_ALIAS,
+    chunk_size: int = 1000,
+) -> None:
+    """
+    Demote the rows of ``pks``, the primary keys of the table that holds the content
+    type, to ``model`` by deleting their rows in ``tables``, children first, and
+    setting their content type.
+    """
+    ctype = ContentType.objects.db_manager(using).get_for_model(model, for_concrete_model=False)
+    root = _ctype_model(model)
+    tables = sorted(tables, key=_table_order, reverse=True)
+    with transaction.atomic(using=using, savepoint=False):
+        for chunk in _batches(pks, chunk_size):
+            # the rows are looked up before their parent rows are gone
+            table_pks = [(table, _table_pks(table, root, chunk, using)) for table in tables]
+            for table, table_chunk in table_pks:
+                QuerySet(model=table, using=using).filter(pk__in=table_chunk)._raw_delete(using)  # type: ignore[attr-defined]
+            QuerySet(model=root, using=using).filter(pk__in=chunk).update(
+                polymorphic_ctype=ctype, **_type_path_update(model)
+            )
+
+
+def _clone_rows(
+    rows: Sequence[tuple[Any, type[models.Model], type[models.Model]]],
+    overrides: dict[tuple[type[models.Model], type[models.Model] | None], dict[str, Any]],
+    using: str = DEFAULT_DB_ALIAS,
+    batch_size: int | None = None,
+) -> dict[Any, Any]:
+    """
+    Copy the rows of every table of the given objects, given as their primary key, the
+    concrete model of their real class and their real class, and return the primary keys
+    of the copies by the primary keys of the originals.
+
+    The rows of the root table are inserted with ``RETURNING`` (one ``INSERT`` per
+    batch) to learn the new primary keys. The rows of every other table are copied
+    with one ``INSERT ... SELECT`` per table and batch, in which a ``CASE`` expression
+    maps the parent link to the new primary key. ``overrides`` holds the values to
+    set instead of the copied ones per table and the class whose instances they are
+    restricted to, or None for all objects.
+    """
+    tables: defaultdict[type[models.Model], list[Any]] = defaultdict(list)
+    for pk, model, _ in rows:
+        for table in (model, *model._meta.get_parent_list()):
+            tables[table].append(pk)
+
+    # the overrides per table with the primary keys they apply to, or None for all
+    table_overrides: defaultdict[type[models.Model], list[tuple[set[Any] | None, dict[str, Any]]]]
+    table_overrides = defaultdict(list)
+    for (table, restrict), values in overrides.items():
+        pks = (
+            None
+            if restrict is None
+            else {pk for pk, _, real_model in rows if issubclass(real_model, restrict)}
+        )
+        table_overrides[table].append((pks, values))
+
+    mapping: dict[Any, Any] = {}
+    with transaction.atomic(using=using, savepoint=False):
+        for table in sorted(tables, key=_table_order):
+            copy_rows = _copy_child_rows if table._meta.parents else _copy_root_rows
+            copy_rows(table, tables[table], mapping, table_overrides[table], using, batch_size)
+    return mapping
+
+
+def _copy_root_rows(
+    model: type[models.Model],
+    pks: Sequence[Any],
+    mapping: dict[Any, Any],
+    overrides: Sequence[tuple[set[Any] | None, dict[str, Any]]],
+    using: str,
+    batch_size: int | None,
+) -> None:
+    pk_field = model._meta.pk
+    assert pk_field is not None
+    for batch in _batches(pks, batch_size or 1000):
+        objs = list(QuerySet(model=model, using=using).filter(pk__in=batch))
+        old_pks = [obj.pk for obj in objs]
+        for obj in objs:
+            # the restricted overrides are applied last, so they win
+            for applies, values in sorted(overrides, key=lambda item: item[0] is not None):
+                if applies is None or obj.pk in applies:
+                    for name, value in values.items():
+                        setattr(obj, name, value)
+            obj.pk = pk_field.get_default()
+            obj._state.adding = True
+        _insert_rows(model, objs, using=using, batch_size=batch_size)
+        mapping.update(zip(old_pks, (obj.pk for obj in objs)))
+
+
+def _copy_child_rows(
+    model: type[models.Model],
+    pks: Sequence[Any],
+    mapping: dict[Any, Any],
+    overrides: Sequence[tuple[set[Any] | None, dict[str, Any]]],
+    using: str,
+    batch_size: int | None,
+) -> None:
+    links = set(model._meta.parents.values())
+    overrides = sorted(overrides, key=lambda item: item[0] is not None)
+    templates = [(applies, model(**values), values) for applies, values in overrides]
+    # every row takes three parameters: one in the filter and two in the CASE, and one
+    # more in every restricted override
+    per_row = 3 + sum(1 for applies, _ in overrides if applies is not None)
+    size = batch_size or 1000
+    max_query_params = connections[using].features.max_query_params
+    if max_query_params:
+        num_values = sum(len(values) for _, values in overrides)
+        size = min(size, max((max_query_params - num_values) // per_row, 1))
+    for batch in _batches(pks, size):
+        columns: list[str] = []
+        select: dict[str, Any] = {}
+        for idx, field in enumerate(model._meta.local_concrete_fields):
+            if getattr(field, "generated", False):
+                continue
+            alias = f"_polymorphic_value_{idx}"
+            if field in links:
+                select[alias] = Cast(
+                    Case(
+                        *(
+                            When(pk=pk, then=Value(mapping[pk], output_field=field))
+                            for pk in batch
+                        ),
+                        output_field=field,
+                    ),
+                    output_field=field,
+                )
+                columns.append(field.column)
+                continue
+            value: Any = F(field.attname)
+            for applies, template, values in templates:
+                if field.name not in values:
+                    continue
+                new_value = Cast(
+                    Value(field.pre_save(template, add=True), output_field=field),
+                    output_field=field,
+                )
+                if applies is None:
+                    value = new_value
+                elif matched := [pk for pk in batch if pk in applies]:
+                    value = Case(
+                        When(pk__in=matched, then=new_value), default=value, output_field=field
+                    )
+            select[alias] = value
+            columns.append(field.column)
+        source = (
+            QuerySet(model=model, using=using)
+            .filter(pk__in=batch)
+            .annotate(**select)
+            .values_list(*select)
+        )
+        _execute_insert_select(model, columns, source, using)
+
+
+class _BulkLoader:
+    """
+    Buffer deserialized objects per table and insert them in batches, parent tables
+    first.
+    """
+
+    def __init__(
+        self, using: str = DEFAULT_DB_ALIAS, batch_size: int = 1000, send_signals: bool = True
+    ) -> None:
+        self.using = using
+        self.batch_size = batch_size
+        self.send_signals = send_signals
+        self.buffered = 0
+        self.pending: defaultdict[type[models.Model], list[Any]] = defaultdict(list)
+        self.models: set[type[models.Model]] = set()
+
+    def add(self, obj: DeserializedObject | models.Model) -> None:
+        instance = obj.object if isinstance(obj, DeserializedObject) else obj
+        model = type(instance)
+        self.models.add(model)
+        self.pending[model._meta.concrete_model].append(obj)  # type: ignore[index]
+        self.buffered += 1
+        if self.buffered >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for model in sorted(self.pending, key=_table_order):
+            objs = self.pending[model]
+            instances = [
+                obj.object if isinstance(obj, DeserializedObject) else obj for obj in objs
+            ]
+            send = self.send_signals and not model._meta.auto_created
+            if send:
+                for instance in instances:
+                    pre_save.send(
+                        sender=type(instance),
+                        instance=instance,
+                        raw=True,
+                        using=self.using,
+                        update_fields=None,
+                    )
+            try:
+                _insert_rows(
+                    model, instances, using=self.using, batch_size=self.batch_size, raw=True
+                )
+            # psycopg raises ValueError if data contains NUL chars.
+            except (DatabaseError, IntegrityError, ValueError) as e:
+                # the failing row of a multi-row INSERT is unknown, name the whole batch
+                pks = [str(instance.pk) for instance in instances]
+                if len(pks) > 10:
+                    pks[5:-1] = [f"... {len(pks) - 6} more ..."]
+                e.args = (
+                    "Could not load %(object_label)s(pk=%(pk)s): %(error_msg)s"
+                    % {
+                        "object_label": model._meta.label,
+                        "pk": ", ".join(pks),
+                        "error_msg": e,
+                    },
+                )
+                raise
+            if send:
+                for instance in instances:
+                    post_save.send(
+                        sender=type(instance),
+                        instance=instance,
+                        created=True,
+                        update_fields=None,
+                        raw=True,
+                        using=self.using,
+                    )
+            for obj in objs:
+                if isinstance(obj, DeserializedObject) and obj.m2m_data:
+                    for accessor_name, object_list in obj.m2m_data.items():
+                        getattr(obj.object, accessor_name).set(object_list)
+                    obj.m2m_data = None
+        self.pending.clear()
+        self.buffered = 0
+
+
+def bulk_load(
+    objects: Iterable[DeserializedObject | models.Model],
+    using: str = DEFAULT_DB_ALIAS,
+    batch_size: int = 1000,
+    send_signals: bool = True,
+) -> int:
+    """
+    Insert deserialized fixture objects with one ``INSERT`` per table and batch instead
+    of one :meth:`~django.db.models.Model.save` per object and table.
+
+    ``objects`` are the per-table objects produced by
+    :func:`django.core.serializers.deserialize` (or model instances that hold the
+    fields of their local table, like the ``object`` attribute of the deserialized
+    objects). They are grouped by table and inserted parent tables first. The objects
+    are inserted in a transaction with constraint checks disabled, as
+    :django-admin:`loaddata` does. The objects must not exist in the database yet.
+
+    .. code-block:: python
+
+        from django.core import serializers
+        from polymorphic.bulk import bulk_load
+
+        with open("projects.json") as fixture:
+            bulk_load(serializers.deserialize("json", fixture), batch_size=5000)
+
+    :param objects: The objects to insert. They may be a generator, at most
+        ``batch_size`` objects are buffered at once.
+    :param using: The database to insert into.
+    :param batch_size: The number of objects to buffer before inserting.
+    :param send_signals: Send :data:`~django.db.models.signals.pre_save` and
+        :data:`~django.db.models.signals.post_save` for each object with ``raw=True``.
+        Pass False to skip signals for the duration of the load.
+    :return: The number of objects inserted.
+    """
+    connection = connections[using]
+    loader = _BulkLoader(using=using, batch_size=batch_size, send_signals=send_signals)
+    deferred: list[DeserializedObject] = []
+    count = 0
+    with transaction.atomic(using=using):
+        with connection.constraint_checks_disabled():
+            for obj in objects:
+                loader.add(obj)
+                count += 1
+                if isinstance(obj, DeserializedObject) and obj.deferred_fields:
+                    deferred.append(obj)
+            loader.flush()
+            for obj in deferred:
+                obj.save_deferred_fields(using=using)
+        connection.check_constraints(table_names=[m._meta.db_table for m in loader.models])
+        if count:
+            sequence_sql = connection.ops.sequence_reset_sql(no_style(), list(loader.models))
+            if sequence_sql:
+                with connection.cursor() as cursor:
+                    for line in sequence_sql:
+                        cursor.execute(line)
+    return count
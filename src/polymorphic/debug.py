@@ -0,0 +1,218 @@
+"""
+Detection of per-object downcasting (N+1 queries) in development and CI.
+
+Polymorphic objects are fetched with one query per type, unless they are downcast one by
+one: with :meth:`~polymorphic.models.PolymorphicModel.get_real_instance`, by following a
+foreign key to a polymorphic model without
+:meth:`~django.db.models.query.QuerySet.select_related`, or by following the link from a
+parent object to its child. The detector counts these per call site and warns or raises
+when a call site exceeds a threshold.
+"""
+
+from __future__ import annotations
+
+import sys
+import warnings
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import ContextDecorator
+from contextvars import ContextVar, Token
+from types import FrameType, TracebackType
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import models
+from django.http import HttpRequest, HttpResponse
+
+from .query import PolymorphicStats
+from .signals import polymorphic_downcast
+
+__all__ = (
+    "PolymorphicNPlusOneError",
+    "PolymorphicNPlusOneWarning",
+    "PolymorphicNPlusOneMiddleware",
+    "detect_n_plus_one",
+)
+
+GET_REAL_INSTANCE = "get_real_instance()"
+RELATED_OBJECT = "related object access"
+CHILD_LINK = "parent to child link access"
+
+_SUGGESTIONS = {
+    GET_REAL_INSTANCE: (
+        "Fetch the objects with a polymorphic queryset or downcast them together with "
+        "get_real_instances()."
+    ),
+    RELATED_OBJECT: "Use select_related() or prefetch_related() for this relation.",
+    CHILD_LINK: (
+        "Fetch the objects with a polymorphic queryset of the parent model instead of "
+        "following the link to the child for each object."
+    ),
+}
+
+
+class PolymorphicNPlusOneWarning(RuntimeWarning):
+    """Warning emitted when a call site downcasts more objects one by one than allowed."""
+
+
+class PolymorphicNPlusOneError(RuntimeError):
+    """Raised instead of :class:`PolymorphicNPlusOneWarning` if the detector should raise."""
+
+
+class detect_n_plus_one(ContextDecorator):
+    """
+    A context manager and decorator that counts the objects downcast one by one per call
+    site, and warns or raises once a call site reaches ``threshold``:
+
+    .. code-block:: python
+
+        from polymorphic.debug import detect_n_plus_one
+
+        with detect_n_plus_one(threshold=5, action="raise"):
+            render_project_list()
+
+    :param threshold: The number of objects a call site may downcast one by one. Defaults
+        to the ``POLYMORPHIC_N_PLUS_ONE_THRESHOLD`` setting or 10.
+    :param action: ``"warn"`` to emit a :class:`PolymorphicNPlusOneWarning` or
+        ``"raise"`` to raise a :class:`PolymorphicNPlusOneError`. Defaults to the
+        ``POLYMORPHIC_N_PLUS_ONE_ACTION`` setting or ``"warn"``.
+    """
+
+    def __init__(self, threshold: int | None = None, action: str | None = None) -> None:
+        self.threshold = (
+            getattr(settings, "POLYMORPHIC_N_PLUS_ONE_THRESHOLD", 10)
+            if threshold is None
+            else threshold
+        )
+        self.action = (
+            getattr(settings, "POLYMORPHIC_N_PLUS_ONE_ACTION", "warn")
+            if action is None
+            else action
+        )
+        if self.action not in ("warn", "raise"):
+            raise ValueError("action must be 'warn' or 'raise'.")
+        self.counts: Counter[tuple[str, str, str, int]] = Counter()
+        self._tokens: list[Token[detect_n_plus_one | None]] = []
+
+    def __enter__(self) -> detect_n_plus_one:
+        self.counts = Counter()
+        self._tokens.append(_detector.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _detector.reset(self._tokens.pop())
+
+    def record(self, kind: str, label: str, frame: FrameType | None) -> None:
+        """
+        Count an object of ``label`` downcast one by one by ``kind`` at the call site that
+        ``frame`` was called from.
+        """
+        filename, lineno, module = _call_site(frame)
+        key = (kind, label, filename, lineno)
+        self.counts[key] += 1
+        if self.counts[key] != self.threshold:
+            return
+        message = (
+            f"{label}: {kind} downcast {self.threshold} objects one by one at "
+            f"{filename}:{lineno}. {_SUGGESTIONS[kind]}"
+        )
+        if self.action == "raise":
+            raise PolymorphicNPlusOneError(message)
+        warnings.warn_explicit(message, PolymorphicNPlusOneWarning, filename, lineno, module)
+
+
+_detector: ContextVar[detect_n_plus_one | None] = ContextVar(
+    "polymorphic_n_plus_one_detector", default=None
+)
+
+
+def _call_site(frame: FrameType | None) -> tuple[str, int, str]:
+    """
+    Return the file name, line number and module of the first frame outside of Django and
+    django-polymorphic.
+    """
+    last = frame
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(("django.", "polymorphic.", "asgiref.")) or module.startswith(
+            "polymorphic.tests"
+        ):
+            return frame.f_code.co_filename, frame.f_lineno, module
+        last = frame
+        frame = frame.f_back
+    if last is None:  # pragma: no cover
+        return "<unknown>", 0, ""
+    return last.f_code.co_filename, last.f_lineno, last.f_globals.get("__name__", "")
+
+
+def record_get_real_instance(obj: models.Model) -> None:
+    """Called by :meth:`~polymorphic.models.PolymorphicModel.get_real_instance`."""
+    detector = _detector.get()
+    if detector is not None:
+        detector.record(GET_REAL_INSTANCE, obj._meta.label, sys._getframe(2))
+
+
+def record_child_link(descriptor: Any, instance: models.Model) -> None:
+    """Called when a parent to child link that is not cached is followed."""
+    detector = _detector.get()
+    if detector is not None:
+        detector.record(CHILD_LINK, str(descriptor.related.field), sys._getframe(2))
+
+
+def _record_related_object(
+    sender: type[models.Model], stats: PolymorphicStats, **kwargs: Any
+) -> None:
+    detector = _detector.get()
+    if detector is None or stats.base_rows > 1:
+        return
+    # find the related object descriptor that evaluated the queryset, if any
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module == "polymorphic.models" and frame.f_code.co_name == "get_real_instance":
+            return
+        if module == "django.db.models.fields.related_descriptors":
+            descriptor = frame.f_locals.get("self")
+            field = getattr(descriptor, "field", None) or getattr(
+                getattr(descriptor, "related", None), "field", None
+            )
+            if field is not None:
+                detector.record(RELATED_OBJECT, str(field), frame)
+            return
+        frame = frame.f_back
+
+
+polymorphic_downcast.connect(_record_related_object, dispatch_uid="polymorphic_n_plus_one")
+
+
+class PolymorphicNPlusOneMiddleware:
+    """
+    Run every request in :class:`detect_n_plus_one`. Only add it to the middleware of
+    development and CI settings.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self, get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]]
+    ) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with detect_n_plus_one():
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with detect_n_plus_one():
+            return await self.get_response(request)  # type: ignore[misc]
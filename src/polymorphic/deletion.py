@@ -4,16 +4,31 @@ Classes and utilities for handling deletions in polymorphic models.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
 from functools import cached_property
 from typing import Any, cast
 
-from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
 from django.db.migrations.serializer import BaseSerializer, serializer_factory
 from django.db.migrations.writer import MigrationWriter
-from django.db.models.deletion import Collector
+from django.db.models import Q, signals
+from django.db.models.deletion import (
+    CASCADE,
+    DO_NOTHING,
+    PROTECT,
+    RESTRICT,
+    Collector,
+    ProtectedError,
+    RestrictedError,
+    get_candidate_relations_to_delete,
+)
+from django.db.models.functions import Cast
 
+from .bulk import _table_order
 from .query import PolymorphicQuerySet
+from .utils import _type_path_update, concrete_descendants, lazy_ctype
 
 
 def migration_fingerprint(value: Any) -> Any:
@@ -133,3 +148,348 @@ class PolymorphicGuardSerializer(BaseSerializer):
 
 
 MigrationWriter.register_serializer(PolymorphicGuard, PolymorphicGuardSerializer)
+
+
+def _has_delete_listeners(model: type[models.Model]) -> bool:
+    return signals.pre_delete.has_listeners(model) or signals.post_delete.has_listeners(model)
+
+
+def _fast_delete_plan(
+    model: type[models.Model], keep_parents: bool = False
+) -> tuple[list[type[models.Model]], list[models.Field[Any, Any]]] | None:
+    """
+    Return the tables to delete from, leaf tables first, and the foreign keys of the
+    automatically created many to many tables that point at them if objects of
+    ``model`` can be deleted without collecting them. Returns None if any model involved
+    has delete signal receivers, or if a relation to it has an ``on_delete`` handler
+    other than :data:`~django.db.models.DO_NOTHING`, or if a parent link between the
+    tables is not the primary key of its table. If ``keep_parents`` is True only
+    the table of ``model`` and the tables below it are deleted from.
+    """
+    concrete_model = cast(type[models.Model], model._meta.concrete_model)
+    if keep_parents:
+        hierarchy = {concrete_model, *concrete_descendants(concrete_model)}
+    else:
+        # the tables of the siblings of the ancestors are included because Django
+        # cascades along their parent links as well
+        hierarchy = {concrete_model, *concrete_model._meta.get_parent_list()}
+        for table in list(hierarchy):
+            hierarchy.update(concrete_descendants(table))
+    if any(
+        field is not None and not field.primary_key and parent in hierarchy
+        for table in hierarchy
+        for parent, field in table._meta.parents.items()
+    ):
+        return None  # the rows of a table can not be found by the primary keys of another
+    tables = sorted(hierarchy, key=_table_order, reverse=True)
+    if any(
+        _has_delete_listeners(table)
+        for table in (*tables, *concrete_descendants(concrete_model, include_proxy=True))
+    ):
+        return None
+
+    through_fields: list[models.Field[Any, Any]] = []
+    for table in tables:
+        if any(hasattr(field, "bulk_related_objects") for field in table._meta.private_fields):
+            return None  # generic relations
+        for related in get_candidate_relations_to_delete(table._meta):
+            field = related.field
+            on_delete = field.remote_field.on_delete
+            if isinstance(on_delete, PolymorphicGuard):
+                on_delete = on_delete.action
+            if field.remote_field.parent_link and field.model in hierarchy:
+                continue
+            if on_delete is DO_NOTHING:
+                continue
+            through = related.related_model
+            if (
+                on_delete is CASCADE
+                and through._meta.auto_created
+                and not _has_delete_listeners(through)
+                and not any(
+                    rel.field.remote_field.on_delete is not DO_NOTHING
+                    for rel in get_candidate_relations_to_delete(through._meta)
+                )
+            ):
+                through_fields.append(field)
+                continue
+            return None
+    return tables, through_fields
+
+
+def fast_delete(queryset: PolymorphicQuerySet[Any, Any]) -> tuple[int, dict[str, int]] | None:
+    """
+    Delete the objects of a polymorphic queryset with set based ``DELETE`` statements
+    instead of collecting them with Django's :class:`~django.db.models.deletion.Collector`.
+
+    For every chunk of objects one ``DELETE ... WHERE pk IN (...)`` is issued per table
+    of the hierarchy, leaf tables first, after clearing the rows of automatically
+    created many to many tables that refer to them. The primary keys of each chunk are
+    selected up front because the filters of the queryset may involve the tables that
+    are deleted from.
+
+    :return: The number of deleted rows and the number of deleted rows per model like
+        :meth:`~django.db.models.query.QuerySet.delete`, or None if the objects can not
+        be deleted this way because signal receivers or ``on_delete`` handlers other
+        than :data:`~django.db.models.DO_NOTHING` apply, or because the tables do not
+        share their primary keys.
+    """
+    plan = _fast_delete_plan(queryset.model)
+    if plan is None:
+        return None
+    tables, through_fields = plan
+    using = queryset.db
+    counter: Counter[str] = Counter()
+    with transaction.atomic(using=using, savepoint=False):
+        for pks in _pk_chunks(queryset):
+            _delete_rows(tables, through_fields, pks, using, counter)
+    return sum(counter.values()), {label: count for label, count in counter.items() if count}
+
+
+def delete_keep_parents(
+    queryset: PolymorphicQuerySet[Any, Any], fast: bool = False
+) -> tuple[int, dict[str, int]]:
+    """
+    Delete the rows of the objects of a polymorphic queryset in the table of its model
+    and the tables below it, but keep the rows in the tables of its parent models. This
+    is the queryset equivalent of :meth:`~polymorphic.models.PolymorphicModel.delete`
+    with ``keep_parents=True``: the objects are upcast to the parent models and the
+    ``polymorphic_ctype`` of the parent rows is updated with one ``UPDATE`` per
+    polymorphic parent model and chunk of objects, in the same transaction as the
+    deletion.
+
+    :param fast: If True the child rows are deleted set based like
+        :func:`fast_delete` does if possible. Otherwise, or if signal receivers or
+        ``on_delete`` handlers apply, they are deleted with Django's
+        :class:`~django.db.models.deletion.Collector`.
+    :return: The number of deleted rows and the number of deleted rows per model like
+        :meth:`~django.db.models.query.QuerySet.delete`.
+    """
+    from .models import PolymorphicModel
+
+    model = cast(type[models.Model], queryset.model._meta.concrete_model)
+    parent_links = [
+        (parent, field)
+        for parent, field in model._meta.parents.items()
+        if issubclass(parent, PolymorphicModel) and field is not None
+    ]
+    plan = _fast_delete_plan(model, keep_parents=True) if fast else None
+    using = queryset.db
+    counter: Counter[str] = Counter()
+    with transaction.atomic(using=using):
+        for pks in _pk_chunks(queryset):
+            # the parent links are read before the child rows are gone
+            parent_pks = {
+                parent: pks
+                if field.primary_key
+                else list(
+                    models.QuerySet(model=model, using=using)
+                    .filter(pk__in=pks)
+                    .values_list(field.attname, flat=True)
+                )
+                for parent, field in parent_links
+            }
+            if plan is None:
+                collector = Collector(using=using, origin=queryset)
+                collector.collect(
+                    models.QuerySet(model=model, using=using).filter(pk__in=pks),
+                    keep_parents=True,
+                )
+                counter.update(collector.delete()[1])
+            else:
+                _delete_rows(*plan, pks, using, counter)
+            for parent, field in parent_links:
+                models.QuerySet(model=parent, using=using).filter(
+                    pk__in=parent_pks[parent]
+                ).update(
+                    polymorphic_ctype=lazy_ctype(parent, using=using), **_type_path_update(parent)
+                )
+    return sum(counter.values()), {label: count for label, count in counter.items() if count}
+
+
+def delete_preview(
+    queryset: PolymorphicQuerySet[Any, Any], keep_parents: bool = False
+) -> tuple[int, dict[str, int]]:
+    """
+    Count the rows that deleting the objects of a polymorphic queryset would delete,
+    without deleting or loading them.
+
+    The graph Django's :class:`~django.db.models.deletion.Collector` walks is followed
+    with querysets instead of objects: the parent and child tables of the hierarchy,
+    the relations with :data:`~django.db.models.CASCADE` handlers, including those
+    wrapped in :class:`PolymorphicGuard`, many to many tables and generic relations.
+    Every model reached this way is counted with one ``COUNT(*)`` over the union of
+    the subqueries that lead to it. Relations that lead back to a model on the same
+    path, like self referential foreign keys, are followed as long as they reach new
+    rows.
+
+    :param keep_parents: Count the rows deleted by
+        :meth:`~polymorphic.query.PolymorphicQuerySet.delete` with
+        ``keep_parents=True``.
+    :return: The number of rows and the number of rows per model that would be deleted,
+        like :meth:`~django.db.models.query.QuerySet.delete` returns them.
+    :raises ~django.db.models.ProtectedError: If rows that refer to the objects through
+        a :data:`~django.db.models.PROTECT` foreign key exist.
+    :raises ~django.db.models.RestrictedError: If rows that refer to the objects through
+        a :data:`~django.db.models.RESTRICT` foreign key exist and would not be deleted
+        as well.
+    """
+    using = queryset.db
+    model = cast(type[models.Model], queryset.model._meta.concrete_model)
+    sources: defaultdict[type[models.Model], list[models.QuerySet[Any]]] = defaultdict(list)
+    protected: list[tuple[models.Field[Any, Any], models.QuerySet[Any]]] = []
+    restricted: list[tuple[models.Field[Any, Any], models.QuerySet[Any]]] = []
+
+    def rows_of(model: type[models.Model]) -> Q:
+        return Q.create(  # type: ignore[attr-defined]
+            [("pk__in", rows.values("pk")) for rows in sources[model]], connector=Q.OR
+        )
+
+    def walk(
+        model: type[models.Model],
+        rows: models.QuerySet[Any],
+        path: frozenset[models.Field[Any, Any]],
+        keep_parents: bool = False,
+        source: models.Field[Any, Any] | None = None,
+    ) -> None:
+        sources[model].append(rows)
+        edges: list[tuple[type[models.Model], models.Field[Any, Any], models.QuerySet[Any]]] = []
+        if not keep_parents:
+            for parent, ptr in model._meta.parents.items():
+                if ptr is not None and ptr is not source:
+                    edges.append(
+                        (
+                            parent,
+                            ptr,
+                            models.QuerySet(model=parent, using=using).filter(
+                                pk__in=rows.values(ptr.attname)
+                            ),
+                        )
+                    )
+        for related in get_candidate_relations_to_delete(model._meta):
+            field = related.field
+            # relations to the parent tables are followed from the parents, and the
+            # parent link that was just followed is not followed back
+            if related.model._meta.concrete_model is not model or field is source:
+                continue
+            on_delete = field.remote_field.on_delete
+            if isinstance(on_delete, PolymorphicGuard):
+                on_delete = on_delete.action
+            related_rows = models.QuerySet(model=field.model, using=using).filter(
+                **{f"{field.name}__in": rows.values(field.target_field.attname)}
+            )
+            if on_delete is CASCADE:
+                edges.append((field.model, field, related_rows))
+            elif on_delete is PROTECT:
+                protected.append((field, related_rows))
+            elif on_delete is RESTRICT:
+                restricted.append((field, related_rows))
+            # SET_NULL, SET_DEFAULT and SET() update the referring rows instead
+        for field in model._meta.private_fields:
+            if hasattr(field, "bulk_related_objects"):
+                related_model = field.remote_field.model
+                object_id = related_model._meta.get_field(field.object_id_field_name)
+                edges.append(
+                    (
+                        related_model,
+                        field,
+                        models.QuerySet(model=related_model, using=using).filter(
+                            **{
+                                field.content_type_field_name: ContentType.objects.db_manager(
+                                    using
+                                ).get_for_model(
+                                    model, for_concrete_model=field.for_concrete_model
+                                ),
+                                f"{field.object_id_field_name}__in": rows.annotate(
+                                    _object_id=Cast("pk", object_id)
+                                ).values("_object_id"),
+                            }
+                        ),
+                    )
+                )
+
+        for related_model, field, related_rows in edges:
+            related_model = cast(type[models.Model], related_model._meta.concrete_model)
+            if field in path:
+                related_rows = related_rows.exclude(rows_of(related_model))
+                if not related_rows.exists():
+                    continue
+            walk(
+                related_model,
+                related_rows,
+                path | {field},
+                source=field if field.remote_field.parent_link else None,
+            )
+
+    walk(model, queryset.non_polymorphic().order_by(), frozenset(), keep_parents=keep_parents)
+
+    for field, related_rows in protected:
+        if related_rows.exists():
+            raise ProtectedError(
+                f"Cannot delete some instances of model {model.__name__!r} because they are "
+                f"referenced through a protected foreign key: "
+                f"'{field.model.__name__}.{field.name}'",
+                related_rows,
+            )
+    for field, related_rows in restricted:
+        related_model = cast(type[models.Model], field.model._meta.concrete_model)
+        if related_model in sources:
+            related_rows = related_rows.exclude(rows_of(related_model))
+        if related_rows.exists():
+            raise RestrictedError(
+                f"Cannot delete some instances of model {model.__name__!r} because they are "
+                f"referenced through a restricted foreign key: "
+                f"'{field.model.__name__}.{field.name}'",
+                related_rows,
+            )
+
+    counts = {}
+    for counted_model in sources:
+        count = (
+            models.QuerySet(model=counted_model, using=using)
+            .filter(rows_of(counted_model))
+            .count()
+        )
+        if count:
+            counts[counted_model._meta.label] = count
+    return sum(counts.values()), counts
+
+
+def _pk_chunks(queryset: PolymorphicQuerySet[Any, Any]) -> Iterator[list[Any]]:
+    """
+    Yield the primary keys of the objects of the queryset in chunks, selected in primary
+    key order with keyset pagination, so each chunk can be deleted before the next is
+    selected. The primary keys are selected up front because the filters of the
+    queryset may involve the tables that are deleted from.
+    """
+    base = queryset.non_polymorphic().order_by("pk")
+    chunk_size = queryset._polymorphic_chunk_size()
+    last = None
+    while True:
+        chunk = base if last is None else base.filter(pk__gt=last)
+        pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return
+        last = pks[-1]
+        yield pks
+        if len(pks) < chunk_size:
+            return
+
+
+def _delete_rows(
+    tables: list[type[models.Model]],
+    through_fields: list[models.Field[Any, Any]],
+    pks: list[Any],
+    using: str,
+    counter: Counter[str],
+) -> None:
+    for field in through_fields:
+        counter[field.model._meta.label] += (
+            models.QuerySet(model=field.model, using=using)
+            .filter(**{f"{field.name}__in": pks})
+            ._raw_delete(using)
+        )  # type: ignore[attr-defined]
+    for table in tables:
+        counter[table._meta.label] += (
+            models.QuerySet(model=table, using=using).filter(pk__in=pks)._raw_delete(using)
+        )  # type: ignore[attr-defined]
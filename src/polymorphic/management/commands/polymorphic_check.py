@@ -0,0 +1,244 @@
+"""
+Scan polymorphic model hierarchies for rows with a missing or wrong ``polymorphic_ctype``
+or ``polymorphic_type_path``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Exists, OuterRef, QuerySet
+
+from polymorphic.models import PolymorphicModel
+from polymorphic.utils import (
+    concrete_descendants,
+    get_base_polymorphic_model,
+    get_polymorphic_type_path,
+    reset_polymorphic_ctype,
+    reset_polymorphic_type_path,
+)
+
+SAMPLE_SIZE = 10
+
+
+class Command(BaseCommand):
+    help = (
+        "Check polymorphic model hierarchies for rows without a polymorphic_ctype, with a "
+        "polymorphic_ctype of an unknown model, without a row in the table of their "
+        "polymorphic_ctype or with rows in the tables below it, and for rows with a "
+        "polymorphic_type_path that does not match their polymorphic_ctype. The tables are "
+        "checked in primary key pages with set based queries and can optionally be repaired."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help=(
+                "The polymorphic models to check in the form app_label.ModelName. The "
+                "whole hierarchy of each model is checked. Defaults to all polymorphic models."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to check.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="The number of base rows checked per query (default: 10000).",
+        )
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help=(
+                "Set the polymorphic_ctype of the broken rows to the deepest model they have a "
+                "row for and their polymorphic_type_path to the one of their "
+                "polymorphic_ctype. Every page is repaired in its own transaction."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        problems = repaired = 0
+        for base_model in self.get_base_models(options["models"]):
+            found, fixed = self.check_hierarchy(
+                base_model, options["database"], options["batch_size"], options["repair"]
+            )
+            problems += found
+            repaired += fixed
+
+        if options["repair"]:
+            if options["verbosity"] >= 1:
+                self.stdout.write(f"Repaired {repaired} of {problems} broken rows.")
+        elif problems:
+            raise CommandError(f"Found {problems} broken rows, use --repair to fix them.")
+        elif options["verbosity"] >= 1:
+            self.stdout.write("No problems found.")
+
+    def get_base_models(self, labels: list[str]) -> list[type[models.Model]]:
+        if not labels:
+            candidates = [
+                model
+                for model in apps.get_models()
+                if issubclass(model, PolymorphicModel) and not model._meta.proxy
+            ]
+        else:
+            candidates = []
+            for label in labels:
+                try:
+                    model = apps.get_model(label)
+                except (LookupError, ValueError) as err:
+                    raise CommandError(f"Unknown model: {label}") from err
+                if not issubclass(model, PolymorphicModel):
+                    raise CommandError(f"{model._meta.label} is not a polymorphic model.")
+                candidates.append(model)
+
+        base_models: dict[type[models.Model], None] = {}
+        for model in candidates:
+            base_model = get_base_polymorphic_model(model)
+            if base_model is not None:
+                base_models[base_model] = None
+        return list(base_models)
+
+    def check_hierarchy(
+        self, base_model: type[models.Model], using: str, batch_size: int, repair: bool
+    ) -> tuple[int, int]:
+        """
+        Check the hierarchy of ``base_model`` page by page and return the number of broken
+        and repaired rows.
+        """
+        hierarchy = [base_model, *concrete_descendants(base_model, include_proxy=True)]
+        ctypes = ContentType.objects.db_manager(using).get_for_models(
+            *hierarchy, for_concrete_models=False
+        )
+        concrete_ctypes: defaultdict[type[models.Model], list[int]] = defaultdict(list)
+        for model, ctype in ctypes.items():
+            concrete_ctypes[model._meta.concrete_model].append(ctype.pk)  # type: ignore[index]
+        children: defaultdict[type[models.Model], list[type[models.Model]]] = defaultdict(list)
+        for model in concrete_descendants(base_model):
+            for parent in model._meta.parents:
+                children[parent].append(model)
+
+        def checks(
+            page: QuerySet[Any],
+        ) -> list[tuple[str, QuerySet[Any]]]:
+            found = [
+                ("rows without a polymorphic_ctype", page.filter(polymorphic_ctype__isnull=True)),
+                (
+                    f"rows with a polymorphic_ctype that is not a model derived from "
+                    f"{base_model._meta.label}",
+                    page.filter(polymorphic_ctype__isnull=False).exclude(
+                        polymorphic_ctype__in=[ctype.pk for ctype in ctypes.values()]
+                    ),
+                ),
+            ]
+            for model, ctype_ids in concrete_ctypes.items():
+                rows = page.filter(polymorphic_ctype__in=ctype_ids)
+                if model is not base_model:
+                    found.append(
+                        (
+                            f"{model._meta.label} rows without a row in {model._meta.db_table}",
+                            rows.exclude(
+                                Exists(
+                                    QuerySet(model=model, using=using).filter(pk=OuterRef("pk"))
+                                )
+                            ),
+                        )
+                    )
+                for child in children[model]:
+                    found.append(
+                        (
+                            f"{model._meta.label} rows with a row in {child._meta.db_table}",
+                            rows.filter(
+                                Exists(
+                                    QuerySet(model=child, using=using).filter(pk=OuterRef("pk"))
+                                )
+                            ),
+                        )
+                    )
+            return found
+
+        def path_checks(page: QuerySet[Any]) -> list[tuple[str, QuerySet[Any]]]:
+            if get_polymorphic_type_path(base_model) is None:
+                return []
+            return [
+                (
+                    f"{model._meta.label} rows with a wrong polymorphic_type_path",
+                    page.filter(polymorphic_ctype=ctype).exclude(
+                        polymorphic_type_path=get_polymorphic_type_path(model)
+                    ),
+                )
+                for model, ctype in ctypes.items()
+            ]
+
+        counts: defaultdict[str, int] = defaultdict(int)
+        samples: defaultdict[str, list[Any]] = defaultdict(list)
+        stale: set[int] = set()
+        total = repaired = 0
+        pks_qs = QuerySet(model=base_model, using=using).order_by("pk")
+        checkpoint = None
+        while True:
+            page_qs = pks_qs if checkpoint is None else pks_qs.filter(pk__gt=checkpoint)
+            pks = list(page_qs.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            checkpoint = pks[-1]
+            page = QuerySet(model=base_model, using=using).filter(
+                pk__gte=pks[0], pk__lte=checkpoint
+            )
+            broken: set[Any] = set()
+            for problem, queryset in checks(page):
+                for pk, ctype_id in queryset.values_list("pk", "polymorphic_ctype"):
+                    counts[problem] += 1
+                    if len(samples[problem]) < SAMPLE_SIZE:
+                        samples[problem].append(pk)
+                    if ctype_id is not None:
+                        stale.add(ctype_id)
+                    broken.add(pk)
+            # rows with a wrong type path only need their path to be reset
+            wrong_paths: set[Any] = set()
+            for problem, queryset in path_checks(page):
+                for pk in queryset.values_list("pk", flat=True):
+                    counts[problem] += 1
+                    if len(samples[problem]) < SAMPLE_SIZE:
+                        samples[problem].append(pk)
+                    wrong_paths.add(pk)
+            wrong_paths -= broken
+            total += len(broken) + len(wrong_paths)
+            if repair and (broken or wrong_paths):
+                with transaction.atomic(using=using):
+                    if broken:
+                        reset_polymorphic_ctype(
+                            *concrete_descendants(base_model),
+                            base_model,
+                            using=using,
+                            pk__in=broken,
+                        )
+                    reset_polymorphic_type_path(
+                        base_model, using=using, pk__in=broken | wrong_paths
+                    )
+                repaired += len(broken) + len(wrong_paths)
+            if len(pks) < batch_size:
+                break
+
+        stale -= {ctype.pk for ctype in ctypes.values()}
+        for problem, count in counts.items():
+            example = ", ".join(str(pk) for pk in samples[problem])
+            self.stdout.write(f"{base_model._meta.label}: {count} {problem} (e.g. pk {example})")
+        for ctype in ContentType.objects.db_manager(using).filter(pk__in=stale):
+            model_class = ctype.model_class()
+            self.stdout.write(
+                f"{base_model._meta.label}: content type {ctype.app_label}.{ctype.model} "
+                + ("no longer exists" if model_class is None else "is not part of the hierarchy")
+            )
+        return total, repaired
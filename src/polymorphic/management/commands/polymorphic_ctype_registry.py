@@ -0,0 +1,60 @@
+"""
+Generate a module with the content type ids of the polymorphic models.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from polymorphic import registry
+from polymorphic.registry import build_registry, render_registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the content type ids of all polymorphic models per database to a Python "
+        "module. Name the module in the POLYMORPHIC_CONTENT_TYPE_REGISTRY setting to fill "
+        "the content type cache from it instead of the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--database",
+            action="append",
+            dest="databases",
+            help="A database to read the content types from, can be repeated (default: default).",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="The file to write the module to. Defaults to stdout.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if the output file is missing or out of date.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # the registry is rebuilt here, so a stale one must not stop the command
+        registry._checked_aliases.update(connections)
+        source = render_registry(build_registry(*(options["databases"] or [DEFAULT_DB_ALIAS])))
+        output = Path(options["output"]) if options["output"] else None
+
+        if options["check"]:
+            if output is None:
+                raise CommandError("--check requires --output.")
+            if not output.exists() or output.read_text() != source:
+                raise CommandError(f"The content type registry {output} is out of date.")
+            return
+
+        if output is None:
+            self.stdout.write(source, ending="")
+            return
+        output.write_text(source)
+        if options["verbosity"] >= 1:
+            self.stdout.write(f"Wrote the content type registry to {output}.")
@@ -0,0 +1,242 @@
+"""
+Stream a polymorphic model and all of its subclasses to JSON Lines or CSV files.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.models import Max, Min
+from django.db.utils import load_backend
+
+from polymorphic.models import PolymorphicModel
+from polymorphic.query import PolymorphicQuerySet
+
+
+def _export_partition(label: str, options: dict[str, Any], settings_dict: dict[str, Any]) -> None:
+    """
+    Export one primary key range in a worker process. The worker connects with the
+    ``settings_dict`` of the connection of the parent process, which may differ from the
+    settings, e.g. for a test database.
+    """
+    import django
+
+    django.setup()
+    alias = options["database"]
+    connections[alias] = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(
+        settings_dict, alias
+    )
+    call_command("polymorphic_export", label, **options)
+
+
+class Command(BaseCommand):
+    help = (
+        "Export a polymorphic model and all of its subclasses as JSON Lines or as one CSV "
+        "file per model type. Rows are streamed in chunks so memory use is constant."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "model", help="The polymorphic model to export in the form app_label.ModelName."
+        )
+        parser.add_argument(
+            "--format",
+            choices=["jsonl", "csv"],
+            default="jsonl",
+            help="Output format (default: jsonl).",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            help=(
+                "The file to write JSON Lines to (default: stdout). For CSV this is the "
+                "directory that receives one <app_label>.<model>.csv file per model type."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to export from.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="The number of base rows fetched and downcast at once.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="use_base_manager",
+            help="Use the base manager instead of the default manager.",
+        )
+        parser.add_argument(
+            "--pk-min", default=None, help="Only export rows with a primary key >= this value."
+        )
+        parser.add_argument(
+            "--pk-max", default=None, help="Only export rows with a primary key <= this value."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Export with this many processes, each handling a primary key range. "
+                "Requires integer primary keys and --output."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as err:
+            raise CommandError(f"Unknown model: {options['model']}") from err
+        if not issubclass(model, PolymorphicModel):
+            raise CommandError(f"{model._meta.label} is not a polymorphic model.")
+        if options["format"] == "csv" and not options["output"]:
+            raise CommandError("--output is required for the csv format.")
+
+        queryset = self.get_queryset(model, options)
+        if options["workers"] > 1:
+            self.export_parallel(model, queryset, options)
+        elif options["format"] == "csv":
+            self.export_csv(queryset, Path(options["output"]), options["chunk_size"])
+        elif options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as stream:
+                self.export_jsonl(queryset, stream, options["chunk_size"])
+        else:
+            self.export_jsonl(queryset, self.stdout, options["chunk_size"])
+
+    def get_queryset(
+        self, model: type[PolymorphicModel], options: dict[str, Any]
+    ) -> PolymorphicQuerySet[Any, Any]:
+        manager = model._base_manager if options["use_base_manager"] else model._default_manager
+        queryset = manager.db_manager(options["database"]).all()
+        if not isinstance(queryset, PolymorphicQuerySet):
+            raise CommandError(
+                f"The manager {model._meta.label}.{manager.name} does not return a "
+                "PolymorphicQuerySet."
+            )
+        if options["pk_min"] is not None:
+            queryset = queryset.filter(pk__gte=options["pk_min"])
+        if options["pk_max"] is not None:
+            queryset = queryset.filter(pk__lte=options["pk_max"])
+        return queryset.order_by("pk")
+
+    def export_jsonl(
+        self, queryset: PolymorphicQuerySet[Any, Any], stream: IO[str], chunk_size: int | None
+    ) -> None:
+        for model, columns in queryset.to_columns(batch_size=chunk_size):
+            label = model._meta.label_lower
+            pk_name = model._meta.pk.attname
+            names = list(columns)
+            for values in zip(*columns.values()):
+                fields = dict(zip(names, values))
+                record = {"model": label, "pk": fields[pk_name], "fields": fields}
+                stream.write(json.dumps(record, cls=DjangoJSONEncoder) + "\n")
+
+    def export_csv(
+        self, queryset: PolymorphicQuerySet[Any, Any], directory: Path, chunk_size: int | None
+    ) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        streams: dict[type[models.Model], tuple[IO[str], Any]] = {}
+        try:
+            for model, columns in queryset.to_columns(batch_size=chunk_size):
+                if model not in streams:
+                    stream = open(
+                        directory / f"{model._meta.label_lower}.csv",
+                        "w",
+                        encoding="utf-8",
+                        newline="",
+                    )
+                    writer = csv.writer(stream)
+                    writer.writerow(columns.keys())
+                    streams[model] = (stream, writer)
+                streams[model][1].writerows(zip(*columns.values()))
+        finally:
+            for stream, _ in streams.values():
+                stream.close()
+
+    def export_parallel(
+        self,
+        model: type[PolymorphicModel],
+        queryset: PolymorphicQuerySet[Any, Any],
+        options: dict[str, Any],
+    ) -> None:
+        """
+        Partition the base table into primary key ranges, export each range in its own
+        process and merge the partial outputs in primary key order.
+        """
+        if not options["output"]:
+            raise CommandError("--output is required when using --workers.")
+        pk_field: Any = model._meta.pk
+        while pk_field.is_relation:
+            pk_field = pk_field.target_field
+        if not isinstance(pk_field, models.IntegerField):
+            raise CommandError("--workers requires an integer primary key.")
+
+        bounds = queryset.non_polymorphic().aggregate(low=Min("pk"), high=Max("pk"))
+        if bounds["low"] is None:
+            bounds["low"] = bounds["high"] = 0
+        workers = options["workers"]
+        step = (bounds["high"] - bounds["low"]) // workers + 1
+
+        output = Path(options["output"])
+        parts = [output.with_name(f"{output.name}.part{idx}") for idx in range(workers)]
+        partitions = [
+            (
+                options["model"],
+                {
+                    "format": options["format"],
+                    "output": str(part),
+                    "database": options["database"],
+                    "chunk_size": options["chunk_size"],
+                    "use_base_manager": options["use_base_manager"],
+                    "pk_min": bounds["low"] + idx * step,
+                    "pk_max": bounds["low"] + (idx + 1) * step - 1,
+                },
+            )
+            for idx, part in enumerate(parts)
+        ]
+
+        settings_dict = dict(connections[options["database"]].settings_dict)
+        # connections must not be shared with forked workers
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_export_partition, *args, settings_dict) for args in partitions
+            ]
+            for future in futures:
+                future.result()
+
+        if options["format"] == "csv":
+            output.mkdir(parents=True, exist_ok=True)
+            # files of an earlier export are replaced, not appended to
+            written: set[Path] = set()
+            for part in parts:
+                for partial in sorted(part.glob("*.csv")):
+                    target = output / partial.name
+                    with open(partial, encoding="utf-8", newline="") as src:
+                        if target in written:
+                            src.readline()  # skip the header
+                        mode = "a" if target in written else "w"
+                        with open(target, mode, encoding="utf-8", newline="") as dst:
+                            shutil.copyfileobj(src, dst)
+                    written.add(target)
+                shutil.rmtree(part)
+        else:
+            with open(output, "w", encoding="utf-8") as dst:
+                for part in parts:
+                    with open(part, encoding="utf-8") as src:
+                        shutil.copyfileobj(src, dst)
+                    part.unlink()
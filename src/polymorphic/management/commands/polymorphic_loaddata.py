@@ -0,0 +1,72 @@
+"""
+A :django-admin:`loaddata` variant that inserts fixture objects in bulk, one table at a
+time.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import CommandError, CommandParser
+from django.core.management.commands import loaddata
+from django.db import router
+
+from polymorphic.bulk import _BulkLoader
+
+
+class Command(loaddata.Command):
+    help = (
+        "Installs the named fixture(s) in the database like loaddata, but inserts the "
+        "objects with one INSERT per table and batch. The fixture objects must not exist "
+        "in the database yet."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of objects to buffer before inserting them (default: 1000).",
+        )
+        parser.add_argument(
+            "--no-signals",
+            action="store_false",
+            dest="send_signals",
+            help="Do not send pre_save and post_save signals for the loaded objects.",
+        )
+
+    def handle(self, *fixture_labels: str, **options: Any) -> None:
+        self.loader = _BulkLoader(
+            using=options["database"],
+            batch_size=options["batch_size"],
+            send_signals=options["send_signals"],
+        )
+        super().handle(*fixture_labels, **options)
+
+    def save_obj(self, obj: Any) -> bool:
+        """Buffer an object for insertion if permitted."""
+        if (
+            obj.object._meta.app_config in self.excluded_apps
+            or type(obj.object) in self.excluded_models
+        ):
+            return False
+        saved = False
+        if router.allow_migrate_model(self.using, obj.object.__class__):
+            saved = True
+            self.models.add(obj.object.__class__)
+            self.loader.add(obj)
+        if obj.deferred_fields:
+            self.objs_with_deferred_fields.append(obj)
+        return saved
+
+    def load_label(self, fixture_label: str) -> None:
+        super().load_label(fixture_label)
+        # deferred fields are saved after all labels are loaded, so every buffered
+        # object must be in the database by then
+        try:
+            self.loader.flush()
+        except Exception as e:
+            if not isinstance(e, CommandError):
+                e.args = ("Problem installing fixture '%s': %s" % (fixture_label, e),)
+            raise
@@ -0,0 +1,119 @@
+"""
+Backfill the ``polymorphic_ctype`` of a polymorphic model hierarchy in batches.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from polymorphic.models import PolymorphicModel
+from polymorphic.utils import concrete_descendants, reset_polymorphic_ctype
+
+
+class Command(BaseCommand):
+    help = (
+        "Set the polymorphic_ctype of the given polymorphic models and all of their concrete "
+        "subclasses from their tables. Rows are updated in primary key order in batches that "
+        "are committed separately, so the command can run on a live database and be resumed."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "models",
+            nargs="+",
+            help="The polymorphic models to reset in the form app_label.ModelName.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to update.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of rows to update per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="The number of seconds to wait between batches.",
+        )
+        parser.add_argument(
+            "--ignore-existing",
+            action="store_true",
+            help="Only update rows that do not have a polymorphic_ctype yet.",
+        )
+        parser.add_argument(
+            "--resume-from",
+            default=None,
+            help="Only update rows with a primary key greater than this value.",
+        )
+        parser.add_argument(
+            "--checkpoint-file",
+            default=None,
+            help=(
+                "A file the last updated primary key is written to after every batch. If it "
+                "exists the backfill resumes from it. It is removed when the backfill completes."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be a positive integer.")
+        if connections[options["database"]].in_atomic_block:
+            raise CommandError("The backfill can not commit its batches in an atomic block.")
+
+        reset_models: dict[type[models.Model], None] = {}
+        for label in options["models"]:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as err:
+                raise CommandError(f"Unknown model: {label}") from err
+            if not issubclass(model, PolymorphicModel):
+                raise CommandError(f"{model._meta.label} is not a polymorphic model.")
+            if model._meta.proxy:
+                raise CommandError(
+                    f"{model._meta.label} is a proxy model, its rows can not be told apart "
+                    "from the rows of its concrete model."
+                )
+            reset_models[model] = None
+            reset_models.update(dict.fromkeys(concrete_descendants(model)))
+
+        pk_field = next(iter(reset_models))._meta.pk
+        checkpoint_file = Path(options["checkpoint_file"]) if options["checkpoint_file"] else None
+        resume_from = options["resume_from"]
+        if resume_from is None and checkpoint_file and checkpoint_file.exists():
+            resume_from = checkpoint_file.read_text().strip()
+        if resume_from is not None:
+            resume_from = pk_field.to_python(resume_from)
+            if options["verbosity"] >= 1:
+                self.stdout.write(f"Resuming after primary key {resume_from}.")
+
+        def progress(checkpoint: Any, processed: int) -> None:
+            if checkpoint_file:
+                checkpoint_file.write_text(str(checkpoint))
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"{processed} rows processed, checkpoint: {checkpoint}")
+
+        reset_polymorphic_ctype(
+            *reset_models,
+            using=options["database"],
+            ignore_existing=options["ignore_existing"],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            resume_from=resume_from,
+            progress=progress,
+        )
+        if checkpoint_file and checkpoint_file.exists():
+            checkpoint_file.unlink()
+        if options["verbosity"] >= 1:
+            self.stdout.write(
+                f"Reset the polymorphic_ctype of {', '.join(m._meta.label for m in reset_models)}."
+            )
@@ -4,7 +4,7 @@ The manager class for use in the models.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, cast, overload
 
 from django.contrib.contenttypes.models import ContentType
@@ -144,6 +144,11 @@ class PolymorphicManager(models.Manager[_All], Generic[_All, _Base]):
     def get_real_instances(self, base_result_objects: Iterable[_All] | None = None) -> list[_All]:
         return self.all().get_real_instances(base_result_objects=base_result_objects)
 
+    def bulk_update_counts(
+        self, objs: Iterable[_All], fields: Sequence[str], batch_size: int | None = None
+    ) -> dict[type[models.Model], int]:
+        return self.all().bulk_update_counts(objs, fields, batch_size=batch_size)
+
     def create_from_super(self, obj: models.Model, **kwargs: Any) -> _Base:
         """
         Create an instance of this manager's model class from the given instance of a
@@ -189,6 +194,69 @@ class PolymorphicManager(models.Manager[_All], Generic[_All, _Base]):
             nobj.refresh_from_db()  # cast to cls
             return nobj
 
+    def convert_from(
+        self, queryset: PolymorphicQuerySet[Any, Any], defaults: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Promote all objects of the given queryset to this manager's model class. This is
+        the set based version of :meth:`create_from_super`.
+
+        The objects may be instances of any parent class of the model. The missing rows
+        of the child tables are inserted with one ``INSERT ... SELECT`` per table and the
+        ``polymorphic_ctype`` of the objects is updated with one ``UPDATE``, for every
+        chunk of objects. Objects that already are instances of the model are skipped.
+        No model instances are created and ``save()`` is not called, so no signals are
+        sent.
+
+        .. code-block:: python
+
+            ModelC.objects.convert_from(
+                ModelA.objects.filter(field1__startswith="c"), defaults={"field3": "x"}
+            )
+
+        :param queryset: A queryset of a parent class of the manager's model class.
+        :param defaults: Values for the fields of the inserted rows. Fields that are not
+            given use their default. Callable defaults are evaluated once, so they are
+            shared by all of the inserted rows.
+        :return: The number of converted objects.
+        :raises TypeError: If the queryset contains objects that are not instances of a
+            parent class of the model.
+        """
+        from .bulk import _convert_rows
+        from .models import PolymorphicModel
+
+        if not issubclass(self.model, queryset.model):
+            raise TypeError(f"{queryset.model.__name__} is not a parent of {self.model.__name__}")
+        using = queryset.db
+        ctypes = ContentType.objects.db_manager(using)
+        ctype = ctypes.get_for_model(self.model, for_concrete_model=False)
+        parents = ctypes.get_for_models(
+            *(
+                parent
+                for parent in self.model._meta.get_parent_list()
+                if issubclass(parent, PolymorphicModel)
+            ),
+            for_concrete_models=False,
+        )
+        base = queryset.non_polymorphic().order_by().exclude(polymorphic_ctype=ctype)
+        with transaction.atomic(using=using):
+            if base.exclude(polymorphic_ctype__in=parents.values()).exists():
+                raise TypeError(
+                    f"Only instances of the parents of {self.model.__name__} can be converted "
+                    f"to {self.model.__name__}."
+                )
+            # the rows are selected first because the filters of the queryset may
+            # involve the tables that are changed
+            pks = list(base.values_list("pk", flat=True))
+            _convert_rows(
+                self.model,
+                pks,
+                defaults=defaults,
+                using=using,
+                chunk_size=base._polymorphic_chunk_size(),
+            )
+        return len(pks)
+
 
 if TYPE_CHECKING:
     from django.db.models.fields.related_descriptors import (
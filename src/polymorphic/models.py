@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Iterable
-from typing import ClassVar, cast
+from typing import Any, ClassVar, cast
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import models, router, transaction
@@ -19,7 +19,12 @@ from typing_extensions import Self
 from .base import PolymorphicModelBase
 from .managers import PolymorphicManager
 from .query_translate import translate_polymorphic_Q_object
-from .utils import get_base_polymorphic_model, lazy_ctype
+from .utils import (
+    _type_path_update,
+    get_base_polymorphic_model,
+    get_polymorphic_type_path,
+    lazy_ctype,
+)
 
 ###################################################################################
 # PolymorphicModel
@@ -31,6 +36,31 @@ class PolymorphicTypeUndefined(LookupError): ...
 class PolymorphicTypeInvalid(RuntimeError): ...
 
 
+class PolymorphicTypePathField(models.CharField):  # type: ignore[type-arg]
+    """
+    An indexed column with the materialized type path of the real class of an object,
+    e.g. ``/app.modela/app.modelb/``. Add it as ``polymorphic_type_path`` to the base
+    model of a hierarchy to filter :meth:`~polymorphic.query.PolymorphicQuerySet.instance_of`
+    with a prefix match instead of a list of content types:
+
+    .. code-block:: python
+
+        class Project(PolymorphicModel):
+            polymorphic_type_path = PolymorphicTypePathField()
+
+    The path is maintained by :meth:`PolymorphicModel.pre_save_polymorphic` and the set
+    based operations that change the ``polymorphic_ctype``. Existing rows are filled in
+    with :func:`~polymorphic.utils.reset_polymorphic_type_path`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("max_length", 255)
+        kwargs.setdefault("db_index", True)
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("default", "")
+        super().__init__(*args, **kwargs)
+
+
 class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
     """
     Abstract base class that provides polymorphic behaviour
@@ -61,7 +91,10 @@ class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
     )
 
     # some applications want to know the name of the fields that are added to its models
-    polymorphic_internal_model_fields: ClassVar[list[str]] = ["polymorphic_ctype"]
+    polymorphic_internal_model_fields: ClassVar[list[str]] = [
+        "polymorphic_ctype",
+        "polymorphic_type_path",
+    ]
 
     objects: ClassVar[PolymorphicManager[Self]] = PolymorphicManager()
 
@@ -97,6 +130,9 @@ class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
         - The object is being saved to a different database than it was loaded from
 
         This ensures cross-database saves work correctly without ForeignKeyViolation.
+
+        If the hierarchy has a :class:`PolymorphicTypePathField`, it is set to the type
+        path of the ``polymorphic_ctype``.
         """
         # This function may be called manually in special use-cases. When the object
         # is saved for the first time, we store its real class in polymorphic_ctype.
@@ -119,6 +155,21 @@ class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
             )
             self.polymorphic_ctype_id = ctype.pk
 
+        if get_polymorphic_type_path(type(self)) is not None:
+            # the content type may have been changed by hand, e.g. to upcast the object
+            model: type[models.Model] | None = type(self)
+            if not needs_update:
+                try:
+                    model = (
+                        ContentType.objects.db_manager(using)
+                        .get_for_id(self.polymorphic_ctype_id)
+                        .model_class()
+                    )
+                except ContentType.DoesNotExist:
+                    model = None
+            if model is not None:
+                self.polymorphic_type_path = get_polymorphic_type_path(model)  # type: ignore[attr-defined]
+
     def save(
         self,
         force_insert: bool | tuple[ModelBase, ...] = False,
@@ -237,6 +288,9 @@ class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
                 f"ContentType {self.polymorphic_ctype_id} for {self.__class__} "
                 f"#{self.pk} does not have a corresponding model!"
             )
+        from .debug import record_get_real_instance
+
+        record_get_real_instance(self)
         return self.__class__.objects.db_manager(self._state.db).get(pk=self.pk)
 
     def delete(
@@ -268,7 +322,10 @@ class PolymorphicModel(models.Model, metaclass=PolymorphicModelBase):
                     parent_model.objects.db_manager(using=using).non_polymorphic().filter(
                         pk=pk
                     ).update(
-                        polymorphic_ctype=lazy_ctype(parent_model, using=using or DEFAULT_DB_ALIAS)
+                        polymorphic_ctype=lazy_ctype(
+                            parent_model, using=using or DEFAULT_DB_ALIAS
+                        ),
+                        **_type_path_update(parent_model),
                     )
                 return ret
         return super().delete(using=using, keep_parents=keep_parents)
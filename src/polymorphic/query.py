@@ -5,25 +5,33 @@ QuerySet for PolymorphicModel
 from __future__ import annotations
 
 import copy
+import dataclasses
 import heapq
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from itertools import islice
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Generic, cast, overload
 
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import FieldDoesNotExist
-from django.db import connections, models
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, FieldError
+from django.db import connections, models, transaction
 from django.db.models import FilteredRelation, Q
 from django.db.models.expressions import Combinable
 from django.db.models.query import ModelIterable, QuerySet
 from typing_extensions import Self, TypeVar
 
+from .bulk import _bulk_create_multi_table, _ctype_model, _demote_rows, _shares_pk
 from .query_translate import (
+    resolve_polymorphic_field_name,
     translate_polymorphic_field_path,
     translate_polymorphic_filter_definitions_in_args,
     translate_polymorphic_filter_definitions_in_kwargs,
     translate_polymorphic_Q_object,
 )
+from .signals import polymorphic_downcast
+from .tracing import Span, get_tracer
 from .utils import concrete_descendants, route_to_ancestor
 
 if TYPE_CHECKING:
@@ -62,6 +70,166 @@ class _Inconsistent:
     ...
 
 
+@dataclasses.dataclass
+class PolymorphicStats:
+    """
+    Statistics about the downcasting of the rows of a polymorphic queryset, available as
+    ``queryset.polymorphic_stats`` once it has been evaluated and sent with the
+    :data:`~polymorphic.signals.polymorphic_downcast` signal.
+    """
+
+    model: type[models.Model]
+    """The model of the queryset."""
+
+    using: str
+    """The database alias the queryset was evaluated on."""
+
+    base_queries: int = 0
+    """The number of base queries, 0 for :meth:`PolymorphicQuerySet.get_real_instances`."""
+
+    base_rows: int = 0
+    """The number of rows returned by the base query."""
+
+    chunks: int = 0
+    """The number of chunks the base rows were downcast in."""
+
+    subclass_queries: int = 0
+    """The number of queries issued to fetch the rows of subclasses."""
+
+    subclass_queries_per_model: Counter[type[models.Model]] = dataclasses.field(
+        default_factory=Counter
+    )
+    """The number of subclass queries issued for each concrete model."""
+
+    rows_per_type: Counter[type[models.Model]] = dataclasses.field(default_factory=Counter)
+    """The number of returned objects of each model."""
+
+    stale_rows: int = 0
+    """Rows dropped because their content type does not belong to a model."""
+
+    retried_rows: int = 0
+    """
+    Rows without a row in the table of their content type, which were fetched as one of
+    their parents instead.
+    """
+
+    timings: defaultdict[str, float] = dataclasses.field(
+        default_factory=lambda: defaultdict(float)
+    )
+    """
+    The seconds spent in each phase: ``base_query``, ``classify``, ``subclass_queries``
+    and ``annotation_copy``.
+    """
+
+    @property
+    def types(self) -> int:
+        """The number of distinct models returned."""
+        return len(self.rows_per_type)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the block to the given phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] += perf_counter() - start
+
+
+@dataclasses.dataclass
+class PolymorphicPlanQuery:
+    """
+    A subclass query of a :class:`PolymorphicPlan`.
+    """
+
+    model: type[models.Model]
+    """The concrete model whose table is queried."""
+
+    rows: int
+    """The number of rows of the queryset that are fetched from this model."""
+
+    queries: int
+    """The maximum number of queries issued for this model, one per chunk containing its rows."""
+
+    joins: list[str]
+    """The tables of the parent models the query joins, from the nearest parent upwards."""
+
+    sql: str
+    """The query for the first chunk of rows."""
+
+    explain: str | None = None
+    """The output of ``EXPLAIN`` for :attr:`sql`, if requested."""
+
+
+@dataclasses.dataclass
+class PolymorphicPlan:
+    """
+    The queries a polymorphic queryset will issue, as returned by
+    :meth:`PolymorphicQuerySet.polymorphic_plan`.
+    """
+
+    model: type[models.Model]
+    """The model of the queryset."""
+
+    using: str
+    """The database alias of the queryset."""
+
+    sql: str
+    """The base query."""
+
+    rows: int
+    """The number of rows the base query returns."""
+
+    chunk_size: int
+    """The number of base rows downcast at once."""
+
+    subclass_queries: list[PolymorphicPlanQuery]
+    """The subclass queries in the order they are issued for each chunk."""
+
+    stale_rows: int = 0
+    """Rows with a content type that does not belong to a model of the queryset."""
+
+    explain: str | None = None
+    """The output of ``EXPLAIN`` for the base query, if requested."""
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.model._meta.label}: {self.rows} rows in chunks of {self.chunk_size} "
+            f"on {self.using!r}",
+            f"  base query: {self.sql}",
+        ]
+        if self.explain:
+            lines.extend(f"    {line}" for line in self.explain.splitlines())
+        if self.stale_rows:
+            lines.append(f"  {self.stale_rows} rows with stale content types are skipped")
+        for query in self.subclass_queries:
+            joins = ", ".join(query.joins) or "no joins"
+            lines.append(
+                f"  {query.model._meta.label}: {query.rows} rows in up to {query.queries} "
+                f"queries joining {joins}"
+            )
+            lines.append(f"    {query.sql}")
+            if query.explain:
+                lines.extend(f"      {line}" for line in query.explain.splitlines())
+        return "\n".join(lines)
+
+
+def _set_span_attributes(span: Span, queryset: QuerySet[Any], rows: int) -> None:
+    """
+    Describe the query of ``queryset`` and the number of rows it returned on ``span``.
+    """
+    if not span.is_recording():
+        return
+    span.set_attribute("db.system", connections[queryset.db].vendor)
+    try:
+        span.set_attribute("db.statement", queryset.query.sql_with_params()[0])
+    except EmptyResultSet:
+        pass
+    span.set_attribute("polymorphic.db_alias", queryset.db)
+    span.set_attribute("polymorphic.model", queryset.model._meta.label)
+    span.set_attribute("polymorphic.rows", rows)
+
+
 class PolymorphicModelIterable(BasePolymorphicModelIterable, Generic[_All, _Base]):
     """
     ModelIterable for PolymorphicModel
@@ -92,33 +260,44 @@ class PolymorphicModelIterable(BasePolymorphicModelIterable, Generic[_All, _Base
         # some databases have a limit on the number of query parameters, we must
         # respect this for generating get_real_instances queries because those
         # queries do a large WHERE IN clause with primary keys
-        max_chunk = connections[self.queryset.db].features.max_query_params
-        sql_chunk = self.chunk_size if self.chunked_fetch else None
-        if max_chunk:
-            sql_chunk = (
-                max_chunk
-                if not self.chunked_fetch  # chunk_size was not provided
-                else min(max_chunk, self.chunk_size or max_chunk)
-            )
-
-        sql_chunk = sql_chunk or Polymorphic_QuerySet_objects_per_request
+        sql_chunk = self.queryset._polymorphic_chunk_size(
+            self.chunk_size if self.chunked_fetch else None
+        )
+        stats = self.queryset.polymorphic_stats = PolymorphicStats(
+            self.queryset.model, self.queryset.db, base_queries=1
+        )
+        tracer = get_tracer()
 
         while True:
             base_result_objects = []
             reached_end = False
 
             # Fetch in chunks
-            for _ in range(sql_chunk):
-                try:
-                    o = next(base_iter)
-                    base_result_objects.append(o)
-                except StopIteration:
-                    reached_end = True
-                    break
-
-            yield from self.queryset._get_real_instances(base_result_objects)
+            with (
+                stats.measure("base_query"),
+                tracer.start_as_current_span("polymorphic base query") as span,
+            ):
+                for _ in range(sql_chunk):
+                    try:
+                        o = next(base_iter)
+                        base_result_objects.append(o)
+                    except StopIteration:
+                        reached_end = True
+                        break
+                _set_span_attributes(span, self.queryset, len(base_result_objects))
+
+            real_results = self.queryset._get_real_instances(base_result_objects, stats)
+            # drop the base objects, and each real object once it has been handed out, so
+            # that consumers of iterator() do not keep a whole chunk alive
+            base_result_objects = []
+            real_results.reverse()
+            while real_results:
+                yield real_results.pop()
 
             if reached_end:
+                polymorphic_downcast.send(
+                    sender=self.queryset.model, queryset=self.queryset, stats=stats
+                )
                 return
 
 
@@ -139,6 +318,17 @@ def transmogrify(cls: type[_All], obj: models.Model) -> _All:
         return new
 
 
+def _f_names(expression: Any) -> Iterator[str]:
+    """
+    Yield the field names referenced by the ``F()`` objects of an expression.
+    """
+    if isinstance(expression, models.F):
+        yield expression.name
+    elif hasattr(expression, "get_source_expressions"):
+        for source_expression in expression.get_source_expressions():
+            yield from _f_names(source_expression)
+
+
 ###################################################################################
 # PolymorphicQuerySet
 
@@ -155,6 +345,7 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
 
     polymorphic_disabled: bool
     polymorphic_deferred_loading: tuple[set[str], bool]
+    polymorphic_stats: PolymorphicStats | None
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -167,6 +358,8 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
         # retrieving the real instance (so that the deferred fields apply
         # to that queryset as well).
         self.polymorphic_deferred_loading = (set(), True)
+        # The statistics of the last evaluation, they are not copied to clones.
+        self.polymorphic_stats = None
 
     def _clone(self, *args: Any, **kwargs: Any) -> Self:
         # Django's _clone only copies its own variables, so we need to copy ours here
@@ -202,10 +395,274 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
         update_fields: Collection[str] | None = None,
         unique_fields: Collection[str] | None = None,
     ) -> list[_All]:
+        """
+        Extends Django's :meth:`~django.db.models.query.QuerySet.bulk_create` with
+        support for multi-table inheritance. The ``polymorphic_ctype`` of each object is
+        set before it is inserted.
+
+        The objects may be instances of any mix of classes in the hierarchy. Each table
+        of the inheritance chains is filled with one ``INSERT`` per batch, parent tables
+        first. On backends that can return rows from bulk inserts (e.g. PostgreSQL,
+        SQLite, MariaDB) the parent primary keys are returned with ``RETURNING`` and
+        propagated to the parent links of the child rows. Otherwise the parent rows of
+        objects without a primary key are inserted one at a time.
+
+        ``ignore_conflicts`` and ``update_conflicts`` are only supported when all
+        objects are stored in a single table.
+        """
         objs = list(objs)
+        # Resolve self.db to the write database before content types are looked up.
+        self._for_write = True
         for obj in objs:
-            obj.pre_save_polymorphic()
-        return super().bulk_create(objs, batch_size, ignore_conflicts=ignore_conflicts)
+            obj.pre_save_polymorphic(using=self.db)
+
+        if not any(
+            obj._meta.concrete_model._meta.get_parent_list()  # type: ignore[union-attr]
+            for obj in (self.model, *objs)
+        ):
+            return super().bulk_create(
+                objs,
+                batch_size,
+                ignore_conflicts=ignore_conflicts,
+                update_conflicts=update_conflicts,
+                update_fields=update_fields,
+                unique_fields=unique_fields,
+            )
+
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        if ignore_conflicts or update_conflicts:
+            raise ValueError(
+                "ignore_conflicts and update_conflicts are not supported when bulk creating "
+                "multi-table inherited models."
+            )
+        if objs:
+            for obj in objs:
+                obj._prepare_related_fields_for_save(operation_name="bulk_create")
+            _bulk_create_multi_table(objs, using=self.db, batch_size=batch_size)
+        return objs
+
+    def bulk_update(  # type: ignore[override]
+        self,
+        objs: Iterable[_All],
+        fields: Sequence[str],
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Update the given fields of a mixed list of polymorphic objects, as Django's
+        :meth:`~django.db.models.query.QuerySet.bulk_update` does for a single table.
+
+        ``fields`` may contain ``ClassName___field`` paths, which are only updated on
+        objects that are instances of ``ClassName``, and plain field names, which are
+        resolved on the real class of each object and skipped for objects that do not
+        have the field. The objects are grouped by the table each field is stored in and
+        one ``UPDATE`` with a ``CASE`` expression is issued per table and batch, all in
+        one transaction.
+
+        :return: The number of objects matched, like Django. Use
+            :meth:`bulk_update_counts` for the number of rows matched per table.
+        """
+        return self._bulk_update(objs, fields, batch_size)[0]
+
+    def bulk_update_counts(
+        self,
+        objs: Iterable[_All],
+        fields: Sequence[str],
+        batch_size: int | None = None,
+    ) -> dict[type[models.Model], int]:
+        """
+        Same as :meth:`bulk_update`, but return a dictionary mapping the concrete model
+        of each updated table to the number of rows matched in it.
+        """
+        return self._bulk_update(objs, fields, batch_size)[1]
+
+    def _bulk_update(
+        self,
+        objs: Iterable[_All],
+        fields: Sequence[str],
+        batch_size: int | None,
+    ) -> tuple[int, dict[type[models.Model], int]]:
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        if not fields:
+            raise ValueError("Field names must be given to bulk_update().")
+        objs = tuple(objs)
+        if any(obj.pk is None for obj in objs):
+            raise ValueError("All bulk_update() objects must have a primary key set.")
+
+        specs = [resolve_polymorphic_field_name(self.model, name) for name in fields]
+        for model, name in specs:
+            if model is not None:
+                model._meta.get_field(name)  # raises FieldDoesNotExist
+
+        # Each object is counted once, in the updated table closest to the base model.
+        tables: defaultdict[tuple[type[models.Model], tuple[str, ...], bool], list[_All]]
+        tables = defaultdict(list)
+        unused = set(fields)
+        for obj in objs:
+            obj_tables: defaultdict[type[models.Model], dict[str, None]] = defaultdict(dict)
+            for field_name, (model, name) in zip(fields, specs):
+                if model is not None and not isinstance(obj, model):
+                    continue
+                try:
+                    field = obj._meta.get_field(name)
+                except FieldDoesNotExist:
+                    continue
+                if not field.concrete or field.many_to_many:
+                    raise ValueError("bulk_update() can only be used with concrete fields.")
+                if field.primary_key:
+                    raise ValueError("bulk_update() cannot be used with primary key fields.")
+                unused.discard(field_name)
+                obj_tables[field.model._meta.concrete_model][field.name] = None
+            if not obj_tables:
+                continue
+            counted = min(obj_tables, key=lambda table: len(table._meta.get_parent_list()))
+            for table, names in obj_tables.items():
+                # Django matches the rows by obj.pk, which is not the primary key of the
+                # tables above a parent link that is not the primary key
+                row = obj
+                table_pk = getattr(obj, table._meta.pk.attname)
+                if table_pk != obj.pk:
+                    row = copy.copy(obj)
+                    setattr(row, obj._meta.pk.attname, table_pk)
+                tables[table, tuple(names), table is counted].append(row)
+
+        for field_name in fields:
+            if objs and field_name in unused and "___" not in field_name:
+                raise FieldDoesNotExist(
+                    f"None of the objects passed to bulk_update() have a field named "
+                    f"'{field_name}'."
+                )
+
+        total = 0
+        counts: dict[type[models.Model], int] = {}
+        with transaction.atomic(using=self.db, savepoint=False):
+            for (table, names, is_counted), table_objs in tables.items():
+                # a plain queryset for the table updates only the table's own columns
+                updated = QuerySet(model=table, using=self.db).bulk_update(
+                    table_objs, names, batch_size=batch_size
+                )
+                counts[table] = counts.get(table, 0) + updated
+                if is_counted:
+                    total += updated
+        return total, counts
+
+    def update(self, **kwargs: Any) -> int:
+        """
+        Extends Django's :meth:`~django.db.models.query.QuerySet.update` to accept
+        ``ClassName___field`` paths, e.g. ``ModelA.objects.filter(...).update(
+        ModelB___field2="x")``. A path only updates the matched rows that are instances
+        of ``ClassName``.
+
+        The assignments are split by the table their field is stored in and one
+        ``UPDATE ... WHERE pk IN (subquery)`` is issued per table, where the subquery is
+        the filtered base query. The rows of each table are found through the primary
+        key of the base table, which is followed through the parent links of tables whose
+        parent link is not their primary key. All updates run in one transaction. If
+        more than one table is updated, or the backend cannot select from the table being
+        updated in a subquery, the matching primary keys are selected first so every
+        table is updated for the same rows, as Django does for updates of parent fields.
+
+        ``F("ClassName___field")`` expressions in the values are translated as well. As
+        with Django's own updates, they can only refer to fields stored in the table
+        that is updated.
+
+        :return: The number of rows matched by the queryset.
+        """
+        if not any("___" in name for name in kwargs) and not any(
+            "___" in name for value in kwargs.values() for name in _f_names(value)
+        ):
+            return super().update(**kwargs)
+        if self.query.is_sliced:
+            raise TypeError("Cannot update a query once a slice has been taken.")
+
+        # the assignments per table and the class whose instances they are restricted to
+        tables: defaultdict[tuple[type[models.Model], type[models.Model] | None], dict[str, Any]]
+        tables = defaultdict(dict)
+        for name, value in kwargs.items():
+            model, field_name = resolve_polymorphic_field_name(self.model, name)
+            field = (model or self.model)._meta.get_field(field_name)
+            if not field.concrete or field.many_to_many or field.primary_key:
+                raise FieldError(
+                    f"Cannot update model field {field!r} (only non-relations and foreign "
+                    "keys permitted)."
+                )
+            table = cast(type[models.Model], field.model._meta.concrete_model)
+            # the rows of a table below ClassName and the rows matched by a queryset of a
+            # subclass of ClassName are all instances of it
+            if model is None or issubclass(table, model) or issubclass(self.model, model):
+                model = None
+            tables[table, model][field.name] = self._translate_update_value(table, value)
+
+        root = _ctype_model(self.model)
+        root_pk = root._meta.pk.name
+
+        def table_rows(table: type[models.Model], rows: Any) -> QuerySet[Any]:
+            # the rows of a table are found by the primary key of the base table
+            if not issubclass(table, root):
+                # Django follows the parent links of a table above the base table
+                return QuerySet(model=root, using=self.db).filter(pk__in=rows)
+            lookup = "pk__in" if _shares_pk(table, root) else f"{root_pk}__in"
+            return QuerySet(model=table, using=self.db).filter(**{lookup: rows})
+
+        self._for_write = True
+        base = self.non_polymorphic().order_by()
+        connection = connections[self.db]
+        with transaction.atomic(using=self.db, savepoint=False):
+            if len(tables) == 1 and connection.features.update_can_self_select:
+                (((table, model), values),) = tables.items()
+                # the rows of a subclass table are not all rows matched by the queryset
+                count = (
+                    None
+                    if table is self.model._meta.concrete_model and model is None
+                    else base.count()
+                )
+                rows = base if model is None else base.instance_of(model)
+                updated = table_rows(table, rows.values(root_pk)).update(**values)
+                return updated if count is None else count
+
+            pks = list(base.values_list(root_pk, flat=True))
+            instances = {
+                model: set(base.instance_of(model).values_list(root_pk, flat=True))
+                for _, model in tables
+                if model is not None
+            }
+            chunk_size = self._polymorphic_chunk_size()
+            for (table, model), values in tables.items():
+                table_pks = pks if model is None else [pk for pk in pks if pk in instances[model]]
+                for idx in range(0, len(table_pks), chunk_size):
+                    table_rows(table, table_pks[idx : idx + chunk_size]).update(**values)
+            return len(pks)
+
+    update.alters_data = True  # type: ignore[attr-defined]
+
+    def _translate_update_value(self, table: type[models.Model], value: Any) -> Any:
+        """
+        Translate the ``F("ClassName___field")`` objects of an update value into the
+        names of the fields of ``table``.
+        """
+        if isinstance(value, models.F):
+            model, field_name = resolve_polymorphic_field_name(self.model, value.name)
+            if model is None:
+                return value
+            field = model._meta.get_field(field_name)
+            if field.model._meta.concrete_model is not table:
+                raise FieldError(
+                    f"Cannot update {table._meta.label} from F({value.name!r}), it is not "
+                    f"stored in the same table."
+                )
+            return models.F(field.name)
+        elif hasattr(value, "get_source_expressions") and any(
+            "___" in name for name in _f_names(value)
+        ):
+            value = value.copy()
+            value.set_source_expressions(
+                [
+                    self._translate_update_value(table, source_expression)
+                    for source_expression in value.get_source_expressions()
+                ]
+            )
+        return value
 
     def non_polymorphic(self) -> PolymorphicQuerySet[_Base, _Base]:
         """switch off polymorphic behaviour for this query.
@@ -422,7 +879,9 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
     # The "polymorphic" keyword argument is not supported anymore.
     # def extra(self, *args, **kwargs):
 
-    def _get_real_instances(self, base_result_objects: Sequence[_All]) -> list[_All]:
+    def _get_real_instances(
+        self, base_result_objects: Sequence[_All], stats: PolymorphicStats | None = None
+    ) -> list[_All]:
         """
         Polymorphic object loader
 
@@ -449,7 +908,21 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
 
         Finally we re-sort the resulting objects into the correct order and
         return them as a list.
+
+        The counters and timings are added to ``stats``, if given, and the subclass
+        queries are traced with the tracer of :mod:`polymorphic.tracing`.
         """
+        if stats is None:
+            stats = PolymorphicStats(self.model, self.db)
+        tracer = get_tracer()
+        # the number of rows queued per class after their row was missing from the
+        # table of their content type
+        retried: Counter[type[models.Model]] = Counter()
+        if base_result_objects:
+            stats.base_rows += len(base_result_objects)
+            stats.chunks += 1
+        start = perf_counter()
+
         resultlist: list[Any] = []  # polymorphic list of result-objects
 
         # dict contains one entry per unique model type occurring in result,
@@ -479,10 +952,7 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
             self.model, for_concrete_model=True
         ).pk
 
-        class_priorities = {
-            mdl: idx + 1
-            for idx, mdl in enumerate((*reversed(concrete_descendants(self.model)), self.model))
-        }
+        class_priorities = self._polymorphic_class_priorities()
 
         for i, base_object in enumerate(base_result_objects):
             if base_object.polymorphic_ctype_id == self_model_class_id:
@@ -494,6 +964,7 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
 
                 if real_concrete_class_id is None:
                     # Dealing with a stale content type
+                    stats.stale_rows += 1
                     continue
                 elif real_concrete_class_id == self_concrete_model_class_id:
                     # Real and base classes share the same concrete ancestor,
@@ -524,7 +995,10 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
                             )
                         idlist_per_model[real_concrete_class].append(getattr(base_object, pk_name))
                         indexlist_per_model[real_concrete_class].append((i, len(resultlist)))
+                    else:
+                        stats.stale_rows += 1
                     resultlist.append(None)
+        stats.timings["classify"] += perf_counter() - start
 
         # For each model in "idlist_per_model" request its objects (the real model)
         # from the db and store them in results[].
@@ -537,47 +1011,27 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
             assert real_concrete_class is not None  # Ensured by guard at line 467
             idlist = idlist_per_model.pop(real_concrete_class)
             indices = indexlist_per_model.pop(real_concrete_class)
-            real_objects = real_concrete_class._base_objects.db_manager(self.db).filter(
-                **{(f"{pk_name}__in"): idlist}
-            )
-            # copy select related configuration to new qs
-            real_objects.query.select_related = self.query.select_related
-
-            # Copy deferred fields configuration to the new queryset
-            deferred_loading_fields = []
-            existing_fields = self.polymorphic_deferred_loading[0]
-            for field in existing_fields:
-                try:
-                    translated_field_name = translate_polymorphic_field_path(
-                        real_concrete_class, field
-                    )
-                except AssertionError:
-                    if "___" in field:
-                        # The originally passed argument to .defer() or .only()
-                        # was in the form Model2B___field2, where Model2B is
-                        # now a superclass of real_concrete_class. Thus it's
-                        # sufficient to just use the field name.
-                        translated_field_name = field.rpartition("___")[-1]
-
-                        # Check if the field does exist.
-                        # Ignore deferred fields that don't exist in this subclass type.
-                        try:
-                            real_concrete_class._meta.get_field(translated_field_name)
-                        except FieldDoesNotExist:
-                            continue
-                    else:
-                        raise
-
-                deferred_loading_fields.append(translated_field_name)
-            real_objects.query.deferred_loading = (
-                set(deferred_loading_fields),
-                self.query.deferred_loading[1],
+            span_name = (
+                "polymorphic stale retry"
+                if retried.pop(real_concrete_class, 0) == len(idlist)
+                else "polymorphic subclass fetch"
             )
-
-            real_objects_dict = {
-                getattr(real_object, pk_name): real_object for real_object in real_objects
-            }
-
+            real_objects = self._polymorphic_subclass_queryset(real_concrete_class, idlist)
+
+            with (
+                stats.measure("subclass_queries"),
+                tracer.start_as_current_span(
+                    f"{span_name} {real_concrete_class._meta.label}"
+                ) as span,
+            ):
+                real_objects_dict = {
+                    getattr(real_object, pk_name): real_object for real_object in real_objects
+                }
+                _set_span_attributes(span, real_objects, len(real_objects_dict))
+            stats.subclass_queries += 1
+            stats.subclass_queries_per_model[real_concrete_class] += 1
+
+            copies = []
             for base_idx, result_idx in indices:
                 base_object = base_result_objects[base_idx]
                 o_pk = getattr(base_object, pk_name)
@@ -585,6 +1039,7 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
                 if real_object is None:
                     # Our content type is pointing to a row that does not exist anymore
                     # We try to find the next best available parent row
+                    stats.retried_rows += 1
                     inheritance_path = route_to_ancestor(real_concrete_class, self.model)
                     if not inheritance_path or inheritance_path[0].model is self.model:
                         resultlist[result_idx] = base_object
@@ -598,6 +1053,7 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
                             )
                         idlist_per_model[next_best_class].append(o_pk)
                         indexlist_per_model[next_best_class].append((base_idx, result_idx))
+                        retried[next_best_class] += 1
                         resultlist[result_idx] = _Inconsistent
                     continue
 
@@ -615,25 +1071,21 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
                         cast("type[PolymorphicModel]", real_class), real_object
                     )
 
-                if self.query.annotations:
-                    # New in Django 3.2+: annotation_select contains only the selected annotations
-                    # (excluding aliases). Fallback for older Django versions if needed.
-                    annotation_select = getattr(
-                        self.query, "annotation_select", self.query.annotations
-                    )
-                    for anno_field_name in annotation_select.keys():
-                        if hasattr(base_object, anno_field_name):
-                            attr = getattr(base_object, anno_field_name)
-                            setattr(real_object, anno_field_name, attr)
-
-                if self.query.extra_select:
-                    for select_field_name in self.query.extra_select.keys():
-                        attr = getattr(base_object, select_field_name)
-                        setattr(real_object, select_field_name, attr)
-
+                copies.append((base_object, real_object))
                 resultlist[result_idx] = real_object
 
+            if copies and (self.query.annotations or self.query.extra_select):
+                with (
+                    stats.measure("annotation_copy"),
+                    tracer.start_as_current_span("polymorphic annotation copy") as span,
+                ):
+                    self._copy_polymorphic_annotations(copies)
+                    if span.is_recording():
+                        span.set_attribute("polymorphic.model", real_concrete_class._meta.label)
+                        span.set_attribute("polymorphic.rows", len(copies))
+
         resultlist = [i for i in resultlist if i and i is not _Inconsistent]
+        stats.rows_per_type.update(type(real_object) for real_object in resultlist)
 
         # set polymorphic_annotate_names in all objects (currently just used for debugging/printing)
         if self.query.annotations:
@@ -652,6 +1104,248 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
 
         return resultlist
 
+    def _polymorphic_subclass_queryset(
+        self, real_concrete_class: type[models.Model], idlist: list[Any]
+    ) -> QuerySet[Any]:
+        """
+        Return the query _get_real_instances uses to fetch the rows of the given
+        concrete class, with the select_related() and deferred fields of this queryset.
+        """
+        pk_name = self.model._meta.pk.attname
+        real_objects = real_concrete_class._base_objects.db_manager(self.db).filter(  # type: ignore[attr-defined]
+            **{(f"{pk_name}__in"): idlist}
+        )
+        # copy select related configuration to new qs
+        real_objects.query.select_related = self.query.select_related
+
+        # Copy deferred fields configuration to the new queryset
+        deferred_loading_fields = []
+        existing_fields = self.polymorphic_deferred_loading[0]
+        for field in existing_fields:
+            try:
+                translated_field_name = translate_polymorphic_field_path(
+                    real_concrete_class, field
+                )
+            except AssertionError:
+                if "___" in field:
+                    # The originally passed argument to .defer() or .only()
+                    # was in the form Model2B___field2, where Model2B is
+                    # now a superclass of real_concrete_class. Thus it's
+                    # sufficient to just use the field name.
+                    translated_field_name = field.rpartition("___")[-1]
+
+                    # Check if the field does exist.
+                    # Ignore deferred fields that don't exist in this subclass type.
+                    try:
+                        real_concrete_class._meta.get_field(translated_field_name)
+                    except FieldDoesNotExist:
+                        continue
+                else:
+                    raise
+
+            deferred_loading_fields.append(translated_field_name)
+        real_objects.query.deferred_loading = (
+            set(deferred_loading_fields),
+            self.query.deferred_loading[1],
+        )
+        return real_objects
+
+    def _copy_polymorphic_annotations(
+        self, copies: Iterable[tuple[models.Model, models.Model]]
+    ) -> None:
+        """
+        Copy the annotations and extra() select fields of the base objects to the real
+        objects fetched for them.
+        """
+        # New in Django 3.2+: annotation_select contains only the selected annotations
+        # (excluding aliases). Fallback for older Django versions if needed.
+        annotation_select = getattr(self.query, "annotation_select", self.query.annotations)
+        for base_object, real_object in copies:
+            if self.query.annotations:
+                for anno_field_name in annotation_select.keys():
+                    if hasattr(base_object, anno_field_name):
+                        attr = getattr(base_object, anno_field_name)
+                        setattr(real_object, anno_field_name, attr)
+
+            if self.query.extra_select:
+                for select_field_name in self.query.extra_select.keys():
+                    attr = getattr(base_object, select_field_name)
+                    setattr(real_object, select_field_name, attr)
+
+    def _polymorphic_class_priorities(self) -> dict[type[models.Model], int]:
+        """
+        Return the fetch priority of each concrete class in the hierarchy of the
+        queryset model. Leaves have the lowest values so that they are fetched first and
+        rows missing from a child table can be retried as one of their parents.
+        """
+        return {
+            mdl: idx + 1
+            for idx, mdl in enumerate((*reversed(concrete_descendants(self.model)), self.model))
+        }
+
+    def _polymorphic_chunk_size(self, chunk_size: int | None = None) -> int:
+        """
+        Return the number of base rows to downcast at once, respecting the parameter
+        limit of the database backend.
+        """
+        max_chunk = connections[self.db].features.max_query_params
+        if max_chunk:
+            return min(max_chunk, chunk_size or max_chunk)
+        return chunk_size or Polymorphic_QuerySet_objects_per_request
+
+    def _real_classes_for_ctype(
+        self, ctype_id: int | None, pk: Any
+    ) -> tuple[type[models.Model], type[models.Model]] | None:
+        """
+        Resolve a raw ``polymorphic_ctype_id`` value of a row of the queryset model to
+        its real class and the concrete class that holds its data. This performs the same
+        checks as :meth:`~polymorphic.models.PolymorphicModel.get_real_instance_class`
+        without requiring a model instance.
+
+        Returns None if the content type is stale.
+        """
+        from .models import PolymorphicTypeInvalid, PolymorphicTypeUndefined
+
+        if ctype_id is None:
+            raise PolymorphicTypeUndefined(
+                f"The model {self.model.__name__}#{pk} does not have a `polymorphic_ctype_id` value defined.\n"
+                f"If you created models outside polymorphic, e.g. through an import or migration, "
+                f"make sure the `polymorphic_ctype_id` field points to the ContentType ID of the model subclass."
+            )
+        model = ContentType.objects.db_manager(self.db).get_for_id(ctype_id).model_class()
+        if model is None:
+            return None
+        if not issubclass(model, self.model) and (
+            self.model._meta.proxy_for_model is None
+            or not issubclass(model, self.model._meta.proxy_for_model)
+        ):
+            raise PolymorphicTypeInvalid(
+                f"ContentType {ctype_id} for {model} #{pk} does not point to a subclass!"
+            )
+        return model, cast(type[models.Model], model._meta.concrete_model)
+
+    def to_columns(
+        self, batch_size: int | None = None, numpy: bool = False
+    ) -> Iterator[tuple[type[_All], dict[str, Any]]]:
+        """
+        Stream the queryset as columnar blocks grouped by real model class.
+
+        For every chunk of ``batch_size`` base rows one ``(model_class, columns)`` tuple
+        is yielded per model class present in the chunk. ``columns`` maps the
+        :attr:`~django.db.models.Field.attname` of every concrete field of that class to
+        the values of its rows, in queryset order. The values are taken directly from the
+        database rows of one query per subclass table, no model instances are created:
+
+        .. code-block:: python
+
+            for model, columns in ModelA.objects.filter(...).to_columns(batch_size=5000):
+                write_batch(model._meta.label, columns)
+
+        :param batch_size: The number of base rows to process at once. Defaults to
+            :attr:`~polymorphic.query.Polymorphic_QuerySet_objects_per_request` and is
+            limited by the ``max_query_params`` of the database backend.
+        :param numpy: If True, columns are :class:`numpy.ndarray` objects instead of lists.
+            Requires :pypi:`numpy`.
+        """
+        if numpy:
+            try:
+                import numpy as np
+            except ImportError as err:  # pragma: no cover
+                raise ImportError(
+                    "to_columns(numpy=True) requires numpy to be installed."
+                ) from err
+
+        def to_block(
+            model: type[models.Model], attnames: list[str], rows: list[Sequence[Any]]
+        ) -> tuple[type[_All], dict[str, Any]]:
+            columns: dict[str, Any] = {
+                attname: [row[idx] for row in rows] for idx, attname in enumerate(attnames)
+            }
+            if numpy:
+                columns = {attname: np.asarray(values) for attname, values in columns.items()}
+            return cast("type[_All]", model), columns
+
+        base_fields = [field.attname for field in self.model._meta.concrete_fields]
+        pk_name = self.model._meta.pk.attname
+        pk_idx = base_fields.index(pk_name)
+        ctype_idx = base_fields.index("polymorphic_ctype_id")
+        chunk_size = self._polymorphic_chunk_size(batch_size)
+        base_iter = iter(
+            self.non_polymorphic().values_list(*base_fields).iterator(chunk_size=chunk_size)
+        )
+        class_priorities = self._polymorphic_class_priorities()
+        base_concrete = self.model._meta.concrete_model
+
+        while chunk := list(islice(base_iter, chunk_size)):
+            if self.polymorphic_disabled:
+                yield to_block(self.model, base_fields, chunk)
+                continue
+
+            # model class -> list of (position in chunk, row)
+            blocks: dict[type[models.Model], list[tuple[int, Sequence[Any]]]] = {}
+            # concrete class -> list of (position in chunk, real class, pk)
+            pending: defaultdict[type[models.Model], list[tuple[int, Any, Any]]] = defaultdict(
+                list
+            )
+            classes_to_query: list[tuple[int, Any]] = []
+
+            for pos, row in enumerate(chunk):
+                classes = self._real_classes_for_ctype(row[ctype_idx], row[pk_idx])
+                if classes is None:
+                    # Dealing with a stale content type
+                    continue
+                real_class, concrete_class = classes
+                if concrete_class is base_concrete:
+                    blocks.setdefault(real_class, []).append((pos, row))
+                    continue
+                if concrete_class not in pending:
+                    heapq.heappush(
+                        classes_to_query,
+                        (class_priorities.get(concrete_class, 0), concrete_class),
+                    )
+                pending[concrete_class].append((pos, real_class, row[pk_idx]))
+
+            while classes_to_query:
+                _, concrete_class = heapq.heappop(classes_to_query)
+                entries = pending.pop(concrete_class)
+                attnames = [field.attname for field in concrete_class._meta.concrete_fields]
+                # the rows are matched by the primary key of the base model, which is not
+                # the primary key of a table whose parent link is not its primary key
+                row_pk_idx = attnames.index(pk_name)
+                rows = {
+                    row[row_pk_idx]: row
+                    for row in concrete_class._base_objects.db_manager(self.db)  # type: ignore[attr-defined]
+                    .filter(**{f"{pk_name}__in": [pk for _, _, pk in entries]})
+                    .values_list(*attnames)
+                }
+                for pos, real_class, pk in entries:
+                    if pk in rows:
+                        blocks.setdefault(real_class, []).append((pos, rows[pk]))
+                        continue
+                    # The content type points to a child row that does not exist anymore,
+                    # fall back to the next best parent as _get_real_instances does
+                    inheritance_path = route_to_ancestor(concrete_class, self.model)
+                    if not inheritance_path or inheritance_path[0].model is self.model:
+                        blocks.setdefault(self.model, []).append((pos, chunk[pos]))
+                        continue
+                    next_best_class = inheritance_path[0].model
+                    if next_best_class not in pending:
+                        heapq.heappush(
+                            classes_to_query,
+                            (class_priorities.get(next_best_class, 0), next_best_class),
+                        )
+                    pending[next_best_class].append((pos, next_best_class, pk))
+
+            for entries in blocks.values():
+                entries.sort(key=lambda entry: entry[0])
+            # emit the blocks in the order their first row appears in the chunk
+            for model, entries in sorted(blocks.items(), key=lambda item: item[1][0][0]):
+                yield to_block(
+                    model,
+                    [field.attname for field in model._meta.concrete_fields],
+                    [row for _, row in entries],
+                )
+
     def __repr__(self, *args, **kwargs):
         if self.model.polymorphic_query_multiline_output:
             result = ",\n  ".join(repr(o) for o in self.all())
@@ -685,17 +1379,270 @@ class PolymorphicQuerySet(QuerySet[_All], Generic[_All, _Base]):
             base_result_list = list(base_result_objects)
         else:
             base_result_list = base_result_objects
-        olist = self._get_real_instances(base_result_list)
+        stats = self.polymorphic_stats = PolymorphicStats(self.model, self.db)
+        olist = self._get_real_instances(base_result_list, stats)
+        polymorphic_downcast.send(sender=self.model, queryset=self, stats=stats)
         if not self.model.polymorphic_query_multiline_output:
             return olist
         clist = PolymorphicQuerySet._p_list_class(olist)
         return clist
 
-    def delete(self) -> tuple[int, dict[str, int]]:
+    def polymorphic_plan(
+        self, explain: bool = False, chunk_size: int | None = None, **explain_options: Any
+    ) -> PolymorphicPlan:
+        """
+        Describe the queries evaluating this queryset will issue, without fetching its
+        objects. The number of rows of each type is counted with one
+        ``GROUP BY polymorphic_ctype`` query and the first chunk of primary keys of each
+        subclass is fetched to build its query:
+
+        .. code-block:: python
+
+            print(ModelA.objects.filter(...).polymorphic_plan(explain=True))
+
+        :param explain: Also run ``EXPLAIN`` on the base query and every subclass query.
+        :param chunk_size: The ``chunk_size`` the queryset would be iterated with.
+        :param explain_options: Options passed to
+            :meth:`~django.db.models.query.QuerySet.explain`.
+        :rtype: PolymorphicPlan
+        """
+        from .models import PolymorphicTypeInvalid, PolymorphicTypeUndefined
+
+        self._not_support_combined_queries("polymorphic_plan")  # type: ignore[attr-defined]
+        chunk_size = self._polymorphic_chunk_size(chunk_size)
+        base = self.non_polymorphic()
+        if self.query.is_sliced:
+            base = self.model._base_objects.db_manager(self.db).filter(  # type: ignore[attr-defined]
+                pk__in=list(self.values_list("pk", flat=True))
+            )
+
+        ctype_ids: defaultdict[type[models.Model], list[int]] = defaultdict(list)
+        rows: Counter[type[models.Model]] = Counter()
+        stale_rows = 0
+        counts = base.order_by().values_list("polymorphic_ctype").annotate(n=models.Count("pk"))
+        for ctype_id, count in counts:
+            try:
+                classes = self._real_classes_for_ctype(ctype_id, None)
+            except (PolymorphicTypeInvalid, PolymorphicTypeUndefined):
+                classes = None
+            if classes is None:
+                stale_rows += count
+                continue
+            ctype_ids[classes[1]].append(ctype_id)
+            rows[classes[1]] += count
+
+        plan = PolymorphicPlan(
+            model=self.model,
+            using=self.db,
+            sql=str(self.query),
+            rows=sum(rows.values()) + stale_rows,
+            chunk_size=chunk_size,
+            subclass_queries=[],
+            stale_rows=stale_rows,
+            explain=self.explain(**explain_options) if explain else None,
+        )
+        if self.polymorphic_disabled:
+            return plan
+
+        chunks = -(-plan.rows // chunk_size)
+        class_priorities = self._polymorphic_class_priorities()
+        base_concrete = self.model._meta.concrete_model
+        for model in sorted(rows, key=lambda model: class_priorities.get(model, 0)):
+            if model is base_concrete:
+                continue
+            idlist = list(
+                base.filter(polymorphic_ctype__in=ctype_ids[model]).values_list("pk", flat=True)[
+                    :chunk_size
+                ]
+            )
+            real_objects = self._polymorphic_subclass_queryset(model, idlist)
+            plan.subclass_queries.append(
+                PolymorphicPlanQuery(
+                    model=model,
+                    rows=rows[model],
+                    queries=min(rows[model], chunks),
+                    joins=[parent._meta.db_table for parent in model._meta.get_parent_list()],
+                    sql=str(real_objects.query),
+                    explain=real_objects.explain(**explain_options) if explain else None,
+                )
+            )
+        return plan
+
+    def demote_to(self, model: type[PolymorphicModel]) -> int:
+        """
+        Demote all objects of this queryset to the given parent class, the reverse of
+        :meth:`~polymorphic.managers.PolymorphicManager.convert_from`.
+
+        The rows of the tables below ``model`` are deleted with one ``DELETE`` per table,
+        children first, and the ``polymorphic_ctype`` of the objects is updated with one
+        ``UPDATE``, for every chunk of objects. Objects that already are ``model``
+        instances are skipped. The deletes do not cascade and no signals are sent, so
+        the removed rows must not be referenced by other rows.
+
+        :param model: The class to demote the objects to. It must be the model of the
+            queryset or one of its parent classes.
+        :return: The number of demoted objects.
+        """
+        from .models import PolymorphicModel
+
+        if not (issubclass(model, PolymorphicModel) and issubclass(self.model, model)):
+            raise TypeError(f"{model.__name__} is not a parent of {self.model.__name__}")
+        ctype = ContentType.objects.db_manager(self.db).get_for_model(
+            model, for_concrete_model=False
+        )
+        base = self.non_polymorphic().order_by().exclude(polymorphic_ctype=ctype)
+        self._for_write = True
+        concrete_model = cast(type[models.Model], model._meta.concrete_model)
+        # the rows are identified by the primary keys of the table of the content type,
+        # which differ from those of the model if a parent link is not its primary key
+        root_pk = _ctype_model(model)._meta.pk.name
+        with transaction.atomic(using=self.db):
+            rows = list(base.values_list(root_pk, "polymorphic_ctype_id"))
+            # only the tables of the real classes of the objects need to be cleared
+            tables: set[type[models.Model]] = set()
+            for ctype_id in {ctype_id for _, ctype_id in rows}:
+                real_model = (
+                    ContentType.objects.db_manager(self.db).get_for_id(ctype_id).model_class()
+                )
+                if real_model is None:
+                    tables.update(concrete_descendants(concrete_model))
+                    continue
+                real_concrete = cast(type[models.Model], real_model._meta.concrete_model)
+                tables.update(
+                    table
+                    for table in (real_concrete, *real_concrete._meta.get_parent_list())
+                    if issubclass(table, concrete_model) and table is not concrete_model
+                )
+            pks = [pk for pk, _ in rows]
+            _demote_rows(
+                model,
+                list(tables),
+                pks,
+                using=self.db,
+                chunk_size=self._polymorphic_chunk_size(),
+            )
+        return len(pks)
+
+    demote_to.alters_data = True  # type: ignore[attr-defined]
+
+    def clone(
+        self, overrides: dict[str, Any] | None = None, batch_size: int | None = None
+    ) -> dict[Any, Any]:
+        """
+        Copy all objects of this queryset with all of their tables, whatever their
+        real class, and return the primary keys of the copies by the primary keys of
+        the originals.
+
+        The root table rows are inserted with one ``INSERT ... RETURNING`` per batch and
+        the rows of every other table are copied in the database with one
+        ``INSERT ... SELECT`` per table and batch, all in one transaction. Like
+        :meth:`bulk_create` no signals are sent and
+        :meth:`~django.db.models.Model.save` is not called. Many to many relations
+        and related objects are not copied.
+
+        :param overrides: Values to set on the copies instead of the copied ones, by
+            field name or ``ClassName___field`` path. A path only applies to the objects
+            that are instances of ``ClassName``.
+        :param batch_size: The number of objects to copy per statement.
+        :return: A dictionary mapping the primary key of every copied object to the
+            primary key of its copy.
+        :raises TypeError: If a table of the objects has more than one concrete parent
+            model or a parent link that is not its primary key.
+        """
+        from .bulk import _clone_rows
+
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        if self.query.is_sliced:
+            raise TypeError("Cannot clone a query once a slice has been taken.")
+
+        # the overrides per table and the class whose instances they are restricted to
+        tables: defaultdict[tuple[type[models.Model], type[models.Model] | None], dict[str, Any]]
+        tables = defaultdict(dict)
+        for name, value in (overrides or {}).items():
+            model, field_name = resolve_polymorphic_field_name(self.model, name)
+            field = (model or self.model)._meta.get_field(field_name)
+            if not field.concrete or field.many_to_many or field.primary_key:
+                raise FieldError(f"Cannot override model field {field!r} in clone().")
+            table = cast(type[models.Model], field.model._meta.concrete_model)
+            if model is None or issubclass(table, model) or issubclass(self.model, model):
+                model = None
+            tables[table, model][field.name] = value
+
+        concrete_model = cast(type[models.Model], self.model._meta.concrete_model)
+        self._for_write = True
+        rows = []
+        checked: set[type[models.Model]] = set()
+        with transaction.atomic(using=self.db, savepoint=False):
+            # the primary keys are selected up front so the copies are not matched again
+            for pk, ctype_id in (
+                self.non_polymorphic().order_by("pk").values_list("pk", "polymorphic_ctype_id")
+            ):
+                classes = self._real_classes_for_ctype(ctype_id, pk)
+                real_model, model = (concrete_model,) * 2 if classes is None else classes
+                if model not in checked:
+                    for table in (model, *model._meta.get_parent_list()):
+                        links = [link for link in table._meta.parents.values() if link]
+                        if len(links) > 1:
+                            raise TypeError(
+                                f"clone() does not support {table.__name__}, it has more "
+                                "than one concrete parent model."
+                            )
+                        # the copies of the child rows get the primary keys of the copied
+                        # root rows, which only works if the parent link is the primary key
+                        if links and not links[0].primary_key:
+                            raise TypeError(
+                                f"clone() does not support {table.__name__}, its parent "
+                                "link is not its primary key."
+                            )
+                    checked.add(model)
+                rows.append((pk, model, real_model))
+            return _clone_rows(rows, tables, using=self.db, batch_size=batch_size)
+
+    clone.alters_data = True  # type: ignore[attr-defined]
+
+    def delete(self, fast: bool = False, keep_parents: bool = False) -> tuple[int, dict[str, int]]:
         """
         Deletion will be done non-polymorphically because Django's multi-table deletion
         mechanism is already walking the class hierarchy and producing a correct
         deletion graph. Introducing polymorphic querysets into the deletion process
         disrupts the model hierarchy/relationship traversal.
+
+        :param fast: If True and no delete signal receivers or ``on_delete`` handlers
+            other than :data:`~django.db.models.DO_NOTHING` apply to the models of the
+            hierarchy, the objects are deleted with one ``DELETE`` per table and chunk
+            without loading them. See :func:`polymorphic.deletion.fast_delete`.
+            Otherwise Django's regular deletion is used.
+        :param keep_parents: If True only the rows in the table of the queryset's model
+            and the tables below it are deleted, and the objects are upcast to the
+            parent models like :meth:`~polymorphic.models.PolymorphicModel.delete`
+            does. See :func:`polymorphic.deletion.delete_keep_parents`.
         """
+        if fast or keep_parents:
+            from .deletion import delete_keep_parents, fast_delete
+
+            self._not_support_combined_queries("delete")  # type: ignore[attr-defined]
+            if self.query.is_sliced:
+                raise TypeError("Cannot use 'limit' or 'offset' with delete().")
+            self._for_write = True
+            deleted = delete_keep_parents(self, fast=fast) if keep_parents else fast_delete(self)
+            if deleted is not None:
+                self._result_cache = None
+                return deleted
         return QuerySet.delete(self.non_polymorphic())
+
+    delete.alters_data = True  # type: ignore[attr-defined]
+    delete.queryset_only = True  # type: ignore[attr-defined]
+
+    def delete_preview(self, keep_parents: bool = False) -> tuple[int, dict[str, int]]:
+        """
+        Return the number of rows and the number of rows per model that :meth:`delete`
+        would delete, counted with one ``COUNT(*)`` query per model without loading any
+        objects. See :func:`polymorphic.deletion.delete_preview`.
+        """
+        from .deletion import delete_preview
+
+        self._not_support_combined_queries("delete_preview")  # type: ignore[attr-defined]
+        if self.query.is_sliced:
+            raise TypeError("Cannot use 'limit' or 'offset' with delete_preview().")
+        return delete_preview(self, keep_parents=keep_parents)
@@ -3,11 +3,13 @@ PolymorphicQuerySet support functions
 """
 
 import copy
-from functools import reduce
+from collections.abc import Iterator
+from functools import lru_cache, reduce
 from operator import or_
 from typing import Any
 
 from django.apps import apps
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import models
@@ -15,7 +17,12 @@ from django.db.models import Q, Subquery
 from django.db.models.fields.related import ForeignObjectRel, RelatedField
 from django.db.utils import DEFAULT_DB_ALIAS
 
-from .utils import _lazy_ctype, _map_queryname_to_class, concrete_descendants
+from .utils import (
+    _lazy_ctype,
+    _map_queryname_to_class,
+    concrete_descendants,
+    get_polymorphic_type_path,
+)
 
 # These functions implement the additional filter- and Q-object functionality.
 # They form a kind of small framework for easily adding more
@@ -63,7 +70,21 @@ def translate_polymorphic_filter_definitions_in_kwargs(
 def translate_polymorphic_Q_object(
     queryset_model: type[models.Model], potential_q_object: Q, using: str = DEFAULT_DB_ALIAS
 ) -> Q:
-    def tree_node_correct_field_specs(my_model: type[models.Model], node: Q) -> Q:
+    """
+    Translate the ``ClassName___field`` paths and ``instance_of`` filters in a Q object tree.
+
+    The translation of the lookups of a tree is cached per structure, so a tree that needs
+    no translation is returned as is, without copying it.
+    """
+    if not isinstance(potential_q_object, models.Q):
+        return potential_q_object  # type: ignore[unreachable]
+
+    translated = _translate_q_lookups(queryset_model, tuple(_q_lookups(potential_q_object)))
+    if translated is None:
+        return potential_q_object
+    lookups = iter(translated)
+
+    def tree_node_correct_field_specs(node: Q) -> Q:
         "process all children of this Q node"
         cpy = copy.copy(node)
         cpy.children = []
@@ -71,21 +92,54 @@ def translate_polymorphic_Q_object(
             if isinstance(child, (tuple, list)):
                 # this Q object child is a tuple => a kwarg like Q( instance_of=ModelB )
                 key, val = child
-                new_expr = _translate_polymorphic_filter_definition(
-                    my_model, key, val, using=using
-                )
-                cpy.children.append(new_expr or child)
+                new_key = next(lookups)
+                if new_key in ("instance_of", "not_instance_of"):
+                    cpy.children.append(
+                        create_instanceof_q(
+                            val, not_instance_of=new_key == "not_instance_of", using=using
+                        )
+                        or child
+                    )
+                else:
+                    cpy.children.append((new_key, val) if new_key != key else child)
             elif isinstance(child, models.Q):
                 # this Q object child is another Q object, recursively process
-                cpy.children.append(tree_node_correct_field_specs(my_model, child))
+                cpy.children.append(tree_node_correct_field_specs(child))
             else:
                 cpy.children.append(child)
         return cpy
 
-    if isinstance(potential_q_object, models.Q):
-        return tree_node_correct_field_specs(queryset_model, potential_q_object)
+    return tree_node_correct_field_specs(potential_q_object)
 
-    return potential_q_object  # type: ignore[unreachable]
+
+def _q_lookups(node: Q) -> Iterator[str]:
+    """Yield the lookups of the keyword children of a Q object tree, depth first."""
+    for child in node.children:
+        if isinstance(child, (tuple, list)):
+            yield child[0]
+        elif isinstance(child, models.Q):
+            yield from _q_lookups(child)
+
+
+@lru_cache(maxsize=1024)
+def _translate_q_lookups(
+    queryset_model: type[models.Model], lookups: tuple[str, ...]
+) -> tuple[str, ...] | None:
+    """
+    Translate the lookups of a Q object tree, or return None if none of them need to be
+    translated. ``instance_of`` and ``not_instance_of`` are kept, as they depend on the
+    value.
+    """
+    if not any(
+        "___" in lookup or lookup in ("instance_of", "not_instance_of") for lookup in lookups
+    ):
+        return None
+    return tuple(
+        lookup
+        if lookup in ("instance_of", "not_instance_of")
+        else translate_polymorphic_field_path(queryset_model, lookup)
+        for lookup in lookups
+    )
 
 
 def translate_polymorphic_filter_definitions_in_args(
@@ -146,7 +200,17 @@ def translate_polymorphic_field_path(queryset_model: type[models.Model], field_p
     E.g.: if queryset_model is ModelA, then "ModelC___field3" is translated
     into modela__modelb__modelc__field3.
     Returns: translated path (unchanged, if no translation needed)
+
+    The translations are cached per model and path, and cleared with the other
+    utility caches when a polymorphic model is created.
     """
+    if "___" not in field_path:
+        return field_path
+    return _translate_polymorphic_field_path(queryset_model, field_path)
+
+
+@lru_cache(maxsize=1024)
+def _translate_polymorphic_field_path(queryset_model: type[models.Model], field_path: str) -> str:
     classname, sep, pure_field_path = field_path.partition("___")
     if not sep or not classname:
         return field_path
@@ -156,22 +220,7 @@ def translate_polymorphic_field_path(queryset_model: type[models.Model], field_p
         negated = True
         classname = classname.lstrip("-")
 
-    if "__" in classname:
-        # the user has app label prepended to class name via __ => use Django's get_model function
-        appname, sep, classname = classname.partition("__")
-        try:
-            model = apps.get_model(appname, classname)
-        except LookupError as le:
-            raise FieldError(f"Model {appname}.{classname} does not exist") from le
-        if not issubclass(model, queryset_model):
-            raise FieldError(
-                f"{model._meta.label} is not derived from {queryset_model._meta.label}"
-            )
-
-    else:
-        # the user has only given us the class name via ___
-        # => select the model from the sub models of the queryset base model
-
+    if "__" not in classname:
         # Test whether it's actually a regular relation__ _fieldname (the field starting with an _)
         # so no tripple ClassName___field was intended.
         try:
@@ -185,7 +234,7 @@ def translate_polymorphic_field_path(queryset_model: type[models.Model], field_p
         except FieldDoesNotExist:
             pass
 
-        model = _map_queryname_to_class(queryset_model, classname)
+    model = _get_polymorphic_path_model(queryset_model, classname)
 
     basepath = _create_base_path(queryset_model, model)
 
@@ -202,6 +251,47 @@ def translate_polymorphic_field_path(queryset_model: type[models.Model], field_p
     return newpath
 
 
+def _get_polymorphic_path_model(
+    queryset_model: type[models.Model], classname: str
+) -> type[models.Model]:
+    """
+    Return the model named by the class part of a ``ClassName___field`` path, which may
+    be prefixed with the app label (``app_label__ClassName___field``).
+    """
+    if "__" in classname:
+        # the user has app label prepended to class name via __ => use Django's get_model function
+        appname, sep, classname = classname.partition("__")
+        try:
+            model = apps.get_model(appname, classname)
+        except LookupError as le:
+            raise FieldError(f"Model {appname}.{classname} does not exist") from le
+        if not issubclass(model, queryset_model):
+            raise FieldError(
+                f"{model._meta.label} is not derived from {queryset_model._meta.label}"
+            )
+        return model
+
+    # the user has only given us the class name via ___
+    # => select the model from the sub models of the queryset base model
+    return _map_queryname_to_class(queryset_model, classname)
+
+
+def resolve_polymorphic_field_name(
+    queryset_model: type[models.Model], field_name: str
+) -> tuple[type[models.Model] | None, str]:
+    """
+    Split a field name as accepted by PolymorphicQuerySet.update()-like functions into
+    the model it applies to and the name of the field on that model.
+
+    E.g.: "ModelC___field3" is resolved to (ModelC, "field3"). Plain field names are
+    returned with None as the model.
+    """
+    classname, sep, pure_field_name = field_name.partition("___")
+    if not sep or not classname:
+        return None, field_name
+    return _get_polymorphic_path_model(queryset_model, classname), pure_field_name
+
+
 def _create_base_path(baseclass: type[models.Model], myclass: type[models.Model]) -> str:
     # create new field path for expressions, e.g. for baseclass=ModelA, myclass=ModelC
     # 'modelb__modelc" is returned
@@ -239,10 +329,9 @@ def create_instanceof_q(
     including all subclasses of these models (as we want to do the same
     as pythons isinstance() ).
     .
-    We recursively collect all __subclasses__(), create a Q filter for each,
-    and or-combine these Q objects. This could be done much more
-    efficiently however (regarding the resulting sql), should an optimization
-    be needed.
+    If the hierarchy has a ``polymorphic_type_path``, the models are matched by the
+    prefix of their type path. Otherwise the content types of the models and all their
+    descendants are matched.
     """
     if not modellist:
         return None
@@ -258,7 +347,12 @@ def create_instanceof_q(
                 "models or a single (polymorphic) model"
             )
 
-    lazy_cts, ct_ids = _get_mro_content_type_ids(modellist, using)
+    type_paths = _get_instance_of_type_paths(tuple(modellist))
+    if type_paths is not None:
+        q = reduce(or_, (Q(polymorphic_type_path__startswith=path) for path in type_paths))
+        return ~q if not_instance_of else q
+
+    lazy_cts, ct_ids = _get_instance_of_content_type_ids(tuple(modellist), using)
     q = Q()
     if lazy_cts:
         q |= Q(
@@ -268,12 +362,84 @@ def create_instanceof_q(
             )
         )
     if ct_ids:
-        q |= Q(polymorphic_ctype__in=ct_ids)
+        q |= _content_type_ids_q(ct_ids)
     if not_instance_of:
         q = ~q
     return q
 
 
+def _content_type_ids_q(ct_ids: list[int]) -> Q:
+    """
+    Return the smallest filter for a sorted list of unique content type ids: an equality
+    for a single id, a range for contiguous ids if the ``POLYMORPHIC_INSTANCE_OF_RANGES``
+    setting is enabled, otherwise ``IN``.
+    """
+    if len(ct_ids) == 1:
+        return Q(polymorphic_ctype=ct_ids[0])
+    if (
+        len(ct_ids) > 2
+        and ct_ids[-1] - ct_ids[0] + 1 == len(ct_ids)
+        and getattr(settings, "POLYMORPHIC_INSTANCE_OF_RANGES", False)
+    ):
+        return Q(polymorphic_ctype_id__range=(ct_ids[0], ct_ids[-1]))
+    return Q(polymorphic_ctype__in=ct_ids)
+
+
+@lru_cache(maxsize=1024)
+def _get_instance_of_type_paths(models: tuple[type[models.Model], ...]) -> list[str] | None:
+    """
+    Return the type path prefixes that match the models and their descendants, or None
+    if the content types have to be matched instead: if the hierarchy has no
+    ``polymorphic_type_path`` or a descendant with several polymorphic parents is not
+    below the type path of one of the models.
+    """
+    paths: list[str] = []
+    for model in models:
+        path = get_polymorphic_type_path(model)
+        if path is None:
+            return None
+        for descendant in concrete_descendants(model, include_proxy=True):
+            descendant_path = get_polymorphic_type_path(descendant)
+            if descendant_path is None or not descendant_path.startswith(path):
+                return None
+        paths.append(path)
+    # paths below another path are already matched by it
+    return [
+        path
+        for path in sorted(set(paths))
+        if not any(path != other and path.startswith(other) for other in paths)
+    ]
+
+
+# the resolved content type ids of instance_of filters per models and database, with the
+# per database content type cache they were resolved from
+_instance_of_ids: dict[
+    tuple[tuple[type[models.Model], ...], str], tuple[dict[Any, ContentType], list[int]]
+] = {}
+
+
+def _get_instance_of_content_type_ids(
+    models: tuple[type[models.Model], ...], using: str
+) -> tuple[list[Q], list[int]]:
+    """
+    Return the lookups of the content types that are not cached yet and the sorted ids of
+    the cached content types of the models and their descendants.
+
+    The ids are cached as long as the content type cache they were resolved from is not
+    cleared and no polymorphic model is created.
+    """
+    ctype_cache = ContentType.objects._cache.get(using)  # type: ignore[attr-defined]
+    entry = _instance_of_ids.get((models, using))
+    if entry is not None and entry[0] is ctype_cache:
+        return [], entry[1]
+
+    lazy, ids = _get_mro_content_type_ids(models, using)
+    ids = sorted(set(ids))
+    if not lazy and ctype_cache is not None:
+        _instance_of_ids[models, using] = (ctype_cache, ids)
+    return lazy, ids
+
+
 def _get_mro_content_type_ids(
     models: list[type[models.Model]] | tuple[type[models.Model], ...], using: str
 ) -> tuple[list[Q], list[int]]:
@@ -286,3 +452,11 @@ def _get_mro_content_type_ids(
             cid = _lazy_ctype(descendent, using=using)
             ids.append(cid.pk) if isinstance(cid, ContentType) else lazy.append(cid)
     return lazy, ids
+
+
+def _clear_translation_caches() -> None:
+    """Clear the caches of the field path, Q object and instance_of translations."""
+    _translate_polymorphic_field_path.cache_clear()
+    _translate_q_lookups.cache_clear()
+    _instance_of_ids.clear()
+    _get_instance_of_type_paths.cache_clear()
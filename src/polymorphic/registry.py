@@ -0,0 +1,238 @@
+"""
+A static registry of the content type ids of the polymorphic models.
+
+Every process looks up the content types of the polymorphic models it uses in the
+database. The :ref:`polymorphic_ctype_registry <polymorphic_ctype_registry>` command
+writes their ids per database into a Python module at deploy time. If the
+``POLYMORPHIC_CONTENT_TYPE_REGISTRY`` setting names that module, the
+:class:`~django.contrib.contenttypes.models.ContentType` cache is filled from it when
+the app registry is ready, so the content types of polymorphic models are never queried.
+When the first connection of the process to a database is opened, the registry is compared
+with the content types of that database.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Q
+
+from .utils import _cache_content_types
+
+__all__ = [
+    "build_registry",
+    "check_registry",
+    "check_registry_on_connect",
+    "get_registry",
+    "load_registry",
+    "missing_from_registry",
+    "render_registry",
+]
+
+#: The content type ids by ``(app_label, model)`` per database alias, None for models
+#: without a content type.
+Registry = dict[str, dict[tuple[str, str], int | None]]
+
+
+def registry_keys() -> list[tuple[str, str]]:
+    """
+    Return the ``(app_label, model)`` keys of all polymorphic models, including proxy
+    models, in sorted order.
+    """
+    from .models import PolymorphicModel
+
+    return sorted(
+        {
+            (model._meta.app_label, model._meta.model_name)  # type: ignore[misc]
+            for model in apps.get_models()
+            if issubclass(model, PolymorphicModel)
+        }
+    )
+
+
+def build_registry(*aliases: str) -> Registry:
+    """
+    Read the content type ids of all polymorphic models from the given databases, with
+    one query per database. Models without a content type are mapped to None.
+    """
+    keys = registry_keys()
+    condition = Q.create(  # type: ignore[attr-defined]
+        [Q(app_label=app_label, model=model) for app_label, model in keys], connector=Q.OR
+    )
+    registry: Registry = {}
+    for using in aliases or (DEFAULT_DB_ALIAS,):
+        rows = (
+            ContentType.objects.db_manager(using)
+            .filter(condition)
+            .values_list("app_label", "model", "pk")
+        )
+        registry[using] = dict.fromkeys(keys)
+        registry[using].update(
+            {(app_label, model): pk for app_label, model, pk in rows}  # type: ignore[misc]
+        )
+    return registry
+
+
+def render_registry(registry: Registry) -> str:
+    """Return the source of a registry module for ``registry``."""
+    lines = [
+        '"""',
+        "Content type ids of the polymorphic models, generated by the polymorphic_ctype_registry",
+        "management command. Do not edit.",
+        '"""',
+        "",
+        "CONTENT_TYPES = {",
+    ]
+    for using, entries in sorted(registry.items()):
+        lines.append(f"    {using!r}: {{")
+        for key, pk in sorted(entries.items()):
+            lines.append(f"        {key!r}: {pk!r},")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def get_registry() -> Registry | None:
+    """
+    Return the registry of the module named by the ``POLYMORPHIC_CONTENT_TYPE_REGISTRY``
+    setting, or None if it is not set.
+    """
+    path = getattr(settings, "POLYMORPHIC_CONTENT_TYPE_REGISTRY", None)
+    if not path:
+        return None
+    try:
+        return import_module(path).CONTENT_TYPES  # type: ignore[no-any-return]
+    except (ImportError, AttributeError) as err:
+        raise ImproperlyConfigured(
+            f"POLYMORPHIC_CONTENT_TYPE_REGISTRY: {path} is not a content type registry module."
+        ) from err
+
+
+def load_registry(registry: Registry | None = None) -> int:
+    """
+    Fill the :class:`~django.contrib.contenttypes.models.ContentType` cache from a
+    registry without querying the database. The entries are pinned, so they are kept
+    when ``ContentType.objects.clear_cache()`` is called. Polymorphic models that are
+    missing from the registry, e.g. models added since it was generated, are looked up
+    in the database as usual and reported by the ``polymorphic.W003`` system check.
+
+    :param registry: The registry to load, defaults to :func:`get_registry`.
+    :return: The number of loaded content types.
+    """
+    if registry is None:
+        registry = get_registry()
+        if registry is None:
+            return 0
+    loaded = 0
+    for using, entries in registry.items():
+        ctypes = []
+        for (app_label, model), pk in entries.items():
+            if pk is None:
+                continue
+            ctype = ContentType(pk=pk, app_label=app_label, model=model)
+            ctype._state.adding = False
+            ctype._state.db = using
+            ctypes.append(ctype)
+        _cache_content_types(ctypes, using=using, pin=True)
+        loaded += len(ctypes)
+    return loaded
+
+
+def missing_from_registry(registry: Registry) -> dict[str, list[tuple[str, str]]]:
+    """
+    Return the keys of the polymorphic models that are missing from a registry, per
+    database alias, for the aliases that miss any.
+    """
+    keys = registry_keys()
+    missing = {
+        using: [key for key in keys if key not in entries] for using, entries in registry.items()
+    }
+    return {using: missing_keys for using, missing_keys in missing.items() if missing_keys}
+
+
+def check_registry(
+    registry: Registry, using: str = DEFAULT_DB_ALIAS, include_missing: bool = True
+) -> list[str]:
+    """
+    Compare a registry with the content types in a database and return a description
+    of every difference. Pass ``include_missing=False`` to leave out the models that
+    are missing from the registry.
+    """
+    expected = registry.get(using)
+    if expected is None:
+        return [f"The content type registry has no entries for the {using!r} database."]
+    actual = build_registry(using)[using]
+    problems = []
+    for key in registry_keys():
+        label = ".".join(key)
+        if key not in expected:
+            if include_missing:
+                problems.append(f"{label} is missing from the content type registry.")
+        elif actual[key] is None and expected[key] is not None:
+            problems.append(f"{label} has no content type in the {using!r} database.")
+        elif expected[key] != actual[key]:
+            problems.append(
+                f"{label} has content type id {actual[key]} in the {using!r} database, "
+                f"but {expected[key]} in the content type registry."
+            )
+    return problems
+
+
+#: The databases the registry was compared with in this process.
+_checked_aliases: set[str] = set()
+
+
+def check_registry_on_connect(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Compare the registry with the content types of a database when the first connection
+    of the process to it is opened. Connected to
+    :data:`~django.db.backends.signals.connection_created`, so stale registries are found
+    by every process, not only by the ``polymorphic.E003`` system check.
+
+    Only content types that exist in both the registry and the database are compared,
+    as the content types of new models are created by :django-admin:`migrate`.
+
+    :raises ~django.core.exceptions.ImproperlyConfigured: If a content type has a
+        different id in the database than in the registry. The check is repeated for
+        every new connection until the registry is fixed.
+    """
+    using = connection.alias
+    if using in _checked_aliases or not getattr(
+        settings, "POLYMORPHIC_CONTENT_TYPE_REGISTRY_CHECK", True
+    ):
+        return
+    registry = get_registry()
+    expected = None if registry is None else registry.get(using)
+    if expected is None:
+        return
+    # mark the database first, the comparison opens no new connection but queries it
+    _checked_aliases.add(using)
+    try:
+        actual = build_registry(using)[using]
+    except DatabaseError:
+        # the content types table may not exist yet, e.g. before the first migrate
+        _checked_aliases.discard(using)
+        return
+    conflicts = [
+        f"{'.'.join(key)} has content type id {actual[key]} in the database, but "
+        f"{expected[key]} in the registry"
+        for key in sorted(actual)
+        if actual[key] is not None
+        and expected.get(key) is not None
+        and actual[key] != expected[key]
+    ]
+    if conflicts:
+        # close the connection, so the next query connects and fails again
+        _checked_aliases.discard(using)
+        connection.close()
+        raise ImproperlyConfigured(
+            f"The content type registry does not match the {using!r} database: "
+            f"{'; '.join(conflicts)}. Run the polymorphic_ctype_registry command to update it."
+        )
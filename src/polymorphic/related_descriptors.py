@@ -37,6 +37,13 @@ class NonPolymorphicReverseOneToOneDescriptor(ReverseOneToOneDescriptor):
     in multi-table polymorphic models.
     """
 
+    def __get__(self, instance: Any, cls: Any = None) -> Any:
+        if instance is not None and not self.related.is_cached(instance):
+            from .debug import record_child_link
+
+            record_child_link(self, instance)
+        return super().__get__(instance, cls)
+
     def get_queryset(self, **hints: Any) -> QuerySet[Any]:
         return cast(
             QuerySet[Any],
@@ -0,0 +1,16 @@
+"""
+Signals sent by django-polymorphic.
+"""
+
+from django.dispatch import Signal
+
+polymorphic_downcast = Signal()
+"""
+Sent when a polymorphic queryset has been evaluated, or
+:meth:`~polymorphic.managers.PolymorphicQuerySet.get_real_instances` has been called. The
+``sender`` is the model of the queryset. The receivers get the ``queryset`` and its
+:class:`~polymorphic.query.PolymorphicStats` as ``stats``.
+
+Querysets that are only partially iterated with
+:meth:`~django.db.models.query.QuerySet.iterator` do not send it.
+"""
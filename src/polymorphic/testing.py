@@ -0,0 +1,154 @@
+"""
+Test helpers for asserting the number of queries polymorphic querysets issue.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import ContextDecorator
+from types import TracebackType
+from typing import Any
+
+from django.db import models
+
+from .query import PolymorphicStats
+from .signals import polymorphic_downcast
+
+__all__ = ("PolymorphicQueryBudget", "assert_polymorphic_queries")
+
+
+class PolymorphicQueryBudget(ContextDecorator):
+    """
+    A context manager and decorator that collects the
+    :class:`~polymorphic.query.PolymorphicStats` of every polymorphic queryset evaluated
+    inside it, and fails with an :class:`AssertionError` if they issued more queries than
+    allowed. Use :func:`assert_polymorphic_queries` to create one.
+
+    Only the queries of polymorphic querysets that are iterated to the end are counted,
+    see :data:`~polymorphic.signals.polymorphic_downcast`.
+    """
+
+    def __init__(
+        self,
+        max_queries: int | None = None,
+        base: int | None = None,
+        subclass: int | None = None,
+        using: str | None = None,
+    ) -> None:
+        self.max_queries = max_queries
+        self.base = base
+        self.subclass = subclass
+        self.using = using
+        self.stats: list[PolymorphicStats] = []
+
+    @property
+    def base_queries(self) -> int:
+        """The number of base queries issued."""
+        return sum(stats.base_queries for stats in self.stats)
+
+    @property
+    def subclass_queries(self) -> int:
+        """The number of subclass queries issued."""
+        return sum(stats.subclass_queries for stats in self.stats)
+
+    @property
+    def queries(self) -> int:
+        """The number of base and subclass queries issued."""
+        return self.base_queries + self.subclass_queries
+
+    @property
+    def subclass_queries_per_model(self) -> Counter[type[models.Model]]:
+        """The number of subclass queries issued for each concrete model."""
+        counts: Counter[type[models.Model]] = Counter()
+        for stats in self.stats:
+            counts.update(stats.subclass_queries_per_model)
+        return counts
+
+    @property
+    def rows_per_type(self) -> Counter[type[models.Model]]:
+        """The number of objects returned of each model."""
+        counts: Counter[type[models.Model]] = Counter()
+        for stats in self.stats:
+            counts.update(stats.rows_per_type)
+        return counts
+
+    def _receiver(
+        self, sender: type[models.Model], stats: PolymorphicStats, **kwargs: Any
+    ) -> None:
+        if self.using is None or stats.using == self.using:
+            self.stats.append(stats)
+
+    def __enter__(self) -> PolymorphicQueryBudget:
+        self.stats = []
+        polymorphic_downcast.connect(self._receiver, dispatch_uid=id(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        polymorphic_downcast.disconnect(dispatch_uid=id(self))
+        if exc_type is None:
+            self.check()
+
+    def check(self) -> None:
+        """
+        Raise an :class:`AssertionError` with a breakdown of the queries per model if
+        the budget is exceeded.
+        """
+        exceeded = [
+            f"{count} {label}, more than the budget of {budget}"
+            for label, count, budget in (
+                ("queries", self.queries, self.max_queries),
+                ("base queries", self.base_queries, self.base),
+                ("subclass queries", self.subclass_queries, self.subclass),
+            )
+            if budget is not None and count > budget
+        ]
+        if not exceeded:
+            return
+
+        rows_per_type = self.rows_per_type
+        lines = [f"Polymorphic querysets issued {' and '.join(exceeded)}:"]
+        lines.append(f"  {self.base_queries} base queries for {sum(rows_per_type.values())} rows")
+        for model, count in self.subclass_queries_per_model.most_common():
+            lines.append(f"  {model._meta.label}: {count} subclass queries")
+        lines.append(
+            "Objects returned per model: "
+            + ", ".join(
+                f"{model._meta.label}: {count}" for model, count in rows_per_type.most_common()
+            )
+        )
+        raise AssertionError("\n".join(lines))
+
+
+def assert_polymorphic_queries(
+    max_queries: int | None = None,
+    *,
+    base: int | None = None,
+    subclass: int | None = None,
+    using: str | None = None,
+) -> PolymorphicQueryBudget:
+    """
+    Assert an upper bound on the queries polymorphic querysets issue in a block or test:
+
+    .. code-block:: python
+
+        from polymorphic.testing import assert_polymorphic_queries
+
+        def test_page(client):
+            with assert_polymorphic_queries(3):
+                client.get("/projects/")
+
+        @assert_polymorphic_queries(base=1, subclass=2)
+        def test_listing():
+            list(Project.objects.all())
+
+    :param max_queries: The maximum number of base and subclass queries.
+    :param base: The maximum number of base queries.
+    :param subclass: The maximum number of subclass queries.
+    :param using: Only count the querysets of this database alias. Defaults to all.
+    """
+    return PolymorphicQueryBudget(max_queries, base=base, subclass=subclass, using=using)
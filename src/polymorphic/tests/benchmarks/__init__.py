@@ -0,0 +1,9 @@
+"""
+Benchmarks of polymorphic querysets against plain multi-table inheritance.
+
+They are deselected by default and need pytest-benchmark:
+
+.. code-block:: bash
+
+    just benchmark
+"""
@@ -0,0 +1,55 @@
+from django.contrib.admin import ModelAdmin, register
+from django.contrib.admin import site as admin_site
+
+from polymorphic.admin import (
+    PolymorphicChildModelAdmin,
+    PolymorphicChildModelFilter,
+    PolymorphicParentModelAdmin,
+)
+
+from .models import (
+    DeepA,
+    DeepB,
+    DeepC,
+    DeepD,
+    DeepE,
+    PlainDeepA,
+    PlainWideBase,
+    Wide1,
+    Wide2,
+    Wide3,
+    Wide4,
+    Wide5,
+    Wide6,
+    Wide7,
+    Wide8,
+    WideBase,
+)
+
+
+@register(DeepA)
+class DeepAAdmin(PolymorphicParentModelAdmin):
+    list_display = ("pk", "field_a")
+    list_filter = (PolymorphicChildModelFilter,)
+    child_models = (DeepA, DeepB, DeepC, DeepD, DeepE)
+
+
+@register(WideBase)
+class WideBaseAdmin(PolymorphicParentModelAdmin):
+    list_display = ("pk", "name")
+    list_filter = (PolymorphicChildModelFilter,)
+    child_models = (Wide1, Wide2, Wide3, Wide4, Wide5, Wide6, Wide7, Wide8)
+
+
+for model in (DeepB, DeepC, DeepD, DeepE, Wide1, Wide2, Wide3, Wide4, Wide5, Wide6, Wide7, Wide8):
+    admin_site.register(model, PolymorphicChildModelAdmin)
+
+
+@register(PlainDeepA)
+class PlainDeepAAdmin(ModelAdmin):
+    list_display = ("pk", "field_a")
+
+
+@register(PlainWideBase)
+class PlainWideBaseAdmin(ModelAdmin):
+    list_display = ("pk", "name")
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
+from .utils import traced_peak
+
+_peaks: list[tuple[str, int]] = []
+
+
+@pytest.fixture
+def peak_memory(request: pytest.FixtureRequest, benchmark: Any) -> Callable[..., int]:
+    """
+    Return a function that measures the peak memory ``func`` allocates with
+    :mod:`tracemalloc`, stores it in the ``extra_info`` of the benchmark and times one
+    further call of ``func`` without tracing.
+    """
+
+    def measure(func: Callable[[], Any]) -> int:
+        peak = traced_peak(func)
+        benchmark.extra_info["peak_memory"] = peak
+        _peaks.append((request.node.name, peak))
+        benchmark.pedantic(func, rounds=1, iterations=1)
+        return peak
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not _peaks:
+        return
+    terminalreporter.section("peak memory")
+    width = max(len(name) for name, _ in _peaks)
+    for name, peak in sorted(_peaks):
+        terminalreporter.write_line(f"{name:<{width}}  {peak / 1024:>10,.0f} KiB")
@@ -0,0 +1,280 @@
+# Generated by Django 4.2 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeepA',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_a', models.CharField(max_length=30)),
+                ('polymorphic_ctype', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='polymorphic_%(app_label)s.%(class)s_set+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PlainDeepA',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_a', models.CharField(max_length=30)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PlainWideBase',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WideBase',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30)),
+                ('polymorphic_ctype', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='polymorphic_%(app_label)s.%(class)s_set+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DeepB',
+            fields=[
+                ('deepa_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.deepa')),
+                ('field_b', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.deepa',),
+        ),
+        migrations.CreateModel(
+            name='PlainDeepB',
+            fields=[
+                ('plaindeepa_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plaindeepa')),
+                ('field_b', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plaindeepa',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide1',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value1', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide2',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value2', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide3',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value3', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide4',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value4', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide5',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value5', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide6',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value6', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide7',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value7', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='PlainWide8',
+            fields=[
+                ('plainwidebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plainwidebase')),
+                ('value8', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plainwidebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide1',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value1', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide2',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value2', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide3',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value3', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide4',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value4', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide5',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value5', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide6',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value6', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide7',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value7', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='Wide8',
+            fields=[
+                ('widebase_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.widebase')),
+                ('value8', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.widebase',),
+        ),
+        migrations.CreateModel(
+            name='DeepC',
+            fields=[
+                ('deepb_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.deepb')),
+                ('field_c', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.deepb',),
+        ),
+        migrations.CreateModel(
+            name='PlainDeepC',
+            fields=[
+                ('plaindeepb_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plaindeepb')),
+                ('field_c', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plaindeepb',),
+        ),
+        migrations.CreateModel(
+            name='DeepD',
+            fields=[
+                ('deepc_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.deepc')),
+                ('field_d', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.deepc',),
+        ),
+        migrations.CreateModel(
+            name='PlainDeepD',
+            fields=[
+                ('plaindeepc_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plaindeepc')),
+                ('field_d', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plaindeepc',),
+        ),
+        migrations.CreateModel(
+            name='DeepE',
+            fields=[
+                ('deepd_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.deepd')),
+                ('field_e', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('benchmarks.deepd',),
+        ),
+        migrations.CreateModel(
+            name='PlainDeepE',
+            fields=[
+                ('plaindeepd_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='benchmarks.plaindeepd')),
+                ('field_e', models.CharField(max_length=30)),
+            ],
+            bases=('benchmarks.plaindeepd',),
+        ),
+    ]
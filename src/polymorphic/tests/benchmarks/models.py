@@ -0,0 +1,119 @@
+"""
+Deep and wide hierarchies, each as polymorphic models and as plain multi-table inheritance.
+"""
+
+from django.db import models
+
+from polymorphic.models import PolymorphicModel
+
+
+class DeepA(PolymorphicModel):
+    field_a = models.CharField(max_length=30)
+
+
+class DeepB(DeepA):
+    field_b = models.CharField(max_length=30)
+
+
+class DeepC(DeepB):
+    field_c = models.CharField(max_length=30)
+
+
+class DeepD(DeepC):
+    field_d = models.CharField(max_length=30)
+
+
+class DeepE(DeepD):
+    field_e = models.CharField(max_length=30)
+
+
+class PlainDeepA(models.Model):
+    field_a = models.CharField(max_length=30)
+
+
+class PlainDeepB(PlainDeepA):
+    field_b = models.CharField(max_length=30)
+
+
+class PlainDeepC(PlainDeepB):
+    field_c = models.CharField(max_length=30)
+
+
+class PlainDeepD(PlainDeepC):
+    field_d = models.CharField(max_length=30)
+
+
+class PlainDeepE(PlainDeepD):
+    field_e = models.CharField(max_length=30)
+
+
+class WideBase(PolymorphicModel):
+    name = models.CharField(max_length=30)
+
+
+class Wide1(WideBase):
+    value1 = models.CharField(max_length=30)
+
+
+class Wide2(WideBase):
+    value2 = models.CharField(max_length=30)
+
+
+class Wide3(WideBase):
+    value3 = models.CharField(max_length=30)
+
+
+class Wide4(WideBase):
+    value4 = models.CharField(max_length=30)
+
+
+class Wide5(WideBase):
+    value5 = models.CharField(max_length=30)
+
+
+class Wide6(WideBase):
+    value6 = models.CharField(max_length=30)
+
+
+class Wide7(WideBase):
+    value7 = models.CharField(max_length=30)
+
+
+class Wide8(WideBase):
+    value8 = models.CharField(max_length=30)
+
+
+class PlainWideBase(models.Model):
+    name = models.CharField(max_length=30)
+
+
+class PlainWide1(PlainWideBase):
+    value1 = models.CharField(max_length=30)
+
+
+class PlainWide2(PlainWideBase):
+    value2 = models.CharField(max_length=30)
+
+
+class PlainWide3(PlainWideBase):
+    value3 = models.CharField(max_length=30)
+
+
+class PlainWide4(PlainWideBase):
+    value4 = models.CharField(max_length=30)
+
+
+class PlainWide5(PlainWideBase):
+    value5 = models.CharField(max_length=30)
+
+
+class PlainWide6(PlainWideBase):
+    value6 = models.CharField(max_length=30)
+
+
+class PlainWide7(PlainWideBase):
+    value7 = models.CharField(max_length=30)
+
+
+class PlainWide8(PlainWideBase):
+    value8 = models.CharField(max_length=30)
@@ -0,0 +1,154 @@
+"""
+Benchmarks of polymorphic querysets against plain multi-table inheritance.
+
+Each benchmark runs for a deep hierarchy (five levels) and a wide one (a base model with
+eight children) and, where plain Django can do the same, for the plain multi-table
+inheritance models as well. The number of queries of one call is stored in the
+``extra_info`` of the benchmark, so it shows up in saved runs next to the timings.
+
+Run them with ``just benchmark`` or
+``pytest -m benchmark src/polymorphic/tests/benchmarks``. The number of rows defaults to
+1000 and is set with the ``POLYMORPHIC_BENCHMARK_ROWS`` environment variable.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Length
+from django.test.utils import CaptureQueriesContext
+
+from .models import DeepA, DeepC, PlainDeepA, PlainWideBase, Wide1, Wide2, WideBase
+from .utils import HIERARCHIES, ROWS, make_objects, populate
+
+pytestmark = pytest.mark.django_db
+
+hierarchies = pytest.mark.parametrize("hierarchy", ["deep", "wide"])
+kinds = pytest.mark.parametrize("kind", ["plain", "polymorphic"])
+
+
+def run(benchmark: Any, group: str, func: Callable[[], Any]) -> Any:
+    """
+    Benchmark ``func`` in ``group`` and record the number of queries of a single call.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    benchmark.group = group
+    benchmark.extra_info["queries"] = len(queries.captured_queries)
+    benchmark.extra_info["rows"] = ROWS
+    benchmark.extra_info["vendor"] = connection.vendor
+    return benchmark(func)
+
+
+@hierarchies
+@kinds
+def test_create(benchmark, hierarchy, kind):
+    classes = HIERARCHIES[hierarchy, kind]
+
+    def create():
+        for obj in make_objects(classes, 100):
+            obj.save()
+
+    run(benchmark, f"create 100 ({hierarchy})", create)
+
+
+@hierarchies
+def test_bulk_create(benchmark, hierarchy):
+    """Only polymorphic models can be bulk created across tables."""
+    classes = HIERARCHIES[hierarchy, "polymorphic"]
+
+    def bulk_create():
+        classes[0].objects.bulk_create(make_objects(classes, 100))
+
+    run(benchmark, f"create 100 ({hierarchy})", bulk_create)
+
+
+@hierarchies
+@kinds
+def test_iterate(benchmark, hierarchy, kind):
+    base = populate(hierarchy, kind)
+    result = run(benchmark, f"iterate ({hierarchy})", lambda: list(base.objects.all()))
+    assert len(result) == ROWS
+
+
+@hierarchies
+def test_iterate_non_polymorphic(benchmark, hierarchy):
+    base = populate(hierarchy, "polymorphic")
+    result = run(
+        benchmark,
+        f"iterate ({hierarchy})",
+        lambda: list(base.objects.non_polymorphic()),  # type: ignore[attr-defined]
+    )
+    assert len(result) == ROWS
+
+
+@pytest.mark.parametrize("chunk_size", [100, 2000])
+@hierarchies
+@kinds
+def test_iterator(benchmark, hierarchy, kind, chunk_size):
+    base = populate(hierarchy, kind)
+    result = run(
+        benchmark,
+        f"iterator ({hierarchy})",
+        lambda: list(base.objects.iterator(chunk_size=chunk_size)),
+    )
+    assert len(result) == ROWS
+
+
+@hierarchies
+@kinds
+def test_instance_of(benchmark, hierarchy, kind):
+    base = populate(hierarchy, kind)
+    if hierarchy == "deep":
+        queryset = (
+            DeepA.objects.instance_of(DeepC)
+            if kind == "polymorphic"
+            else PlainDeepA.objects.filter(plaindeepb__plaindeepc__isnull=False)
+        )
+    else:
+        queryset = (
+            WideBase.objects.instance_of(Wide1, Wide2)
+            if kind == "polymorphic"
+            else PlainWideBase.objects.filter(
+                Q(plainwide1__isnull=False) | Q(plainwide2__isnull=False)
+            )
+        )
+    result = run(benchmark, f"instance_of ({hierarchy})", lambda: list(queryset.all()))
+    assert 0 < len(result) < ROWS
+    assert base.objects.count() == ROWS
+
+
+@kinds
+def test_lookup(benchmark, kind):
+    populate("deep", kind)
+    queryset = (
+        DeepA.objects.filter(DeepE___field_e__endswith="4")
+        if kind == "polymorphic"
+        else PlainDeepA.objects.filter(
+            plaindeepb__plaindeepc__plaindeepd__plaindeepe__field_e__endswith="4"
+        )
+    )
+    result = run(benchmark, "lookup (deep)", lambda: list(queryset.all()))
+    assert result
+
+
+@hierarchies
+@kinds
+def test_annotate_defer(benchmark, hierarchy, kind):
+    base = populate(hierarchy, kind)
+    field = "field_a" if hierarchy == "deep" else "name"
+    queryset = base.objects.annotate(length=Length(field)).defer(field)
+    result = run(benchmark, f"annotate and defer ({hierarchy})", lambda: list(queryset.all()))
+    assert len(result) == ROWS
+
+
+@hierarchies
+@kinds
+def test_admin_changelist(benchmark, admin_client, hierarchy, kind):
+    base = populate(hierarchy, kind)
+    url = f"/admin/benchmarks/{base._meta.model_name}/"
+    response = run(benchmark, f"admin changelist ({hierarchy})", lambda: admin_client.get(url))
+    assert response.status_code == 200
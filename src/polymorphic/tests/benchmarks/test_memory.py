@@ -0,0 +1,81 @@
+"""
+Peak memory of polymorphic querysets, measured with :mod:`tracemalloc`.
+
+Full evaluation and :meth:`~django.db.models.query.QuerySet.iterator` with different chunk
+sizes are measured for both hierarchies at several row counts, set as a comma separated
+list with the ``POLYMORPHIC_BENCHMARK_MEMORY_ROWS`` environment variable (default
+``1000,5000``). The peaks are stored in the ``extra_info`` of the benchmarks and listed at
+the end of the run.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+
+import pytest
+
+from .utils import populate
+
+pytestmark = pytest.mark.django_db
+
+MEMORY_ROWS = [
+    int(rows)
+    for rows in os.environ.get("POLYMORPHIC_BENCHMARK_MEMORY_ROWS", "1000,5000").split(",")
+]
+
+
+def consume(iterable) -> int:
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+@pytest.mark.parametrize("mode", ["all", "iterator-100", "iterator-2000"])
+@pytest.mark.parametrize("rows", MEMORY_ROWS)
+@pytest.mark.parametrize("hierarchy", ["deep", "wide"])
+@pytest.mark.parametrize("kind", ["plain", "polymorphic"])
+def test_memory(benchmark, peak_memory, kind, hierarchy, rows, mode):
+    base = populate(hierarchy, kind, rows)
+    if mode == "all":
+
+        def func():
+            assert len(list(base.objects.all())) == rows
+    else:
+        chunk_size = int(mode.split("-")[1])
+
+        def func():
+            assert consume(base.objects.iterator(chunk_size=chunk_size)) == rows
+
+    benchmark.group = f"memory {mode} ({hierarchy})"
+    benchmark.extra_info["rows"] = rows
+    peak_memory(func)
+
+
+@pytest.mark.parametrize("hierarchy", ["deep", "wide"])
+def test_iterator_memory_is_bounded(hierarchy):
+    """
+    The memory iterator() keeps alive depends on the chunk size, not on the number of rows
+    iterated so far. It grows if objects are retained after they have been handed out.
+
+    The peak memory does grow with the rows, because the querysets of every chunk leave
+    reference cycles behind that are only freed by the garbage collector, so the live
+    memory is measured after collecting them.
+    """
+    rows = max(MEMORY_ROWS)
+    base = populate(hierarchy, "polymorphic", rows)
+    checkpoints = {rows // 5 + 50, rows - 50}
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        live = []
+        for idx, _ in enumerate(base.objects.order_by("pk").iterator(chunk_size=100)):
+            if idx in checkpoints:
+                gc.collect()
+                live.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    assert live[1] < live[0] * 1.5, live
@@ -0,0 +1,113 @@
+"""
+The hierarchies the benchmarks run on and helpers to fill them.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+from typing import Any, Callable
+
+from django.db import models
+
+from .models import (
+    DeepA,
+    DeepB,
+    DeepC,
+    DeepD,
+    DeepE,
+    PlainDeepA,
+    PlainDeepB,
+    PlainDeepC,
+    PlainDeepD,
+    PlainDeepE,
+    PlainWide1,
+    PlainWide2,
+    PlainWide3,
+    PlainWide4,
+    PlainWide5,
+    PlainWide6,
+    PlainWide7,
+    PlainWide8,
+    PlainWideBase,
+    Wide1,
+    Wide2,
+    Wide3,
+    Wide4,
+    Wide5,
+    Wide6,
+    Wide7,
+    Wide8,
+    WideBase,
+)
+
+ROWS = int(os.environ.get("POLYMORPHIC_BENCHMARK_ROWS", "1000"))
+
+HIERARCHIES: dict[tuple[str, str], tuple[type[models.Model], ...]] = {
+    ("deep", "plain"): (PlainDeepA, PlainDeepB, PlainDeepC, PlainDeepD, PlainDeepE),
+    ("deep", "polymorphic"): (DeepA, DeepB, DeepC, DeepD, DeepE),
+    ("wide", "plain"): (
+        PlainWideBase,
+        PlainWide1,
+        PlainWide2,
+        PlainWide3,
+        PlainWide4,
+        PlainWide5,
+        PlainWide6,
+        PlainWide7,
+        PlainWide8,
+    ),
+    ("wide", "polymorphic"): (
+        WideBase,
+        Wide1,
+        Wide2,
+        Wide3,
+        Wide4,
+        Wide5,
+        Wide6,
+        Wide7,
+        Wide8,
+    ),
+}
+
+
+def make_objects(classes: tuple[type[models.Model], ...], count: int) -> list[models.Model]:
+    """Return ``count`` unsaved objects, evenly spread over ``classes``."""
+    objs = []
+    for idx in range(count):
+        model = classes[idx % len(classes)]
+        objs.append(
+            model(
+                **{
+                    field.attname: f"{field.name}{idx}"
+                    for field in model._meta.concrete_fields
+                    if isinstance(field, models.CharField)
+                }
+            )
+        )
+    return objs
+
+
+def populate(hierarchy: str, kind: str, rows: int = ROWS) -> type[models.Model]:
+    """Create ``rows`` objects of the hierarchy and return its base model."""
+    classes = HIERARCHIES[hierarchy, kind]
+    objs = make_objects(classes, rows)
+    if kind == "polymorphic":
+        classes[0].objects.bulk_create(objs)
+    else:
+        # Django can not bulk create multi-table inherited models
+        for obj in objs:
+            obj.save()
+    return classes[0]
+
+
+def traced_peak(func: Callable[[], Any]) -> int:
+    """Return the peak memory in bytes that ``func`` allocates, traced with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
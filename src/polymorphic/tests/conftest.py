@@ -4,6 +4,7 @@ import pathlib
 import pytest
 
 INTEGRATION_DIR = pathlib.Path(__file__).resolve().parent / "examples" / "integrations"
+BENCHMARK_DIR = pathlib.Path(__file__).resolve().parent / "benchmarks"
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
@@ -12,3 +13,5 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         p = pathlib.Path(str(getattr(item, "path", item.fspath))).resolve()
         if INTEGRATION_DIR in p.parents:
             item.add_marker(pytest.mark.integration)
+        elif BENCHMARK_DIR in p.parents:
+            item.add_marker(pytest.mark.benchmark)
@@ -813,3 +813,176 @@ class TestDeletion(TestCase):
         assert Normal3.objects.count() == 4
         assert Normal3.objects.get(pk=b1_pk).__class__ is Normal3
         assert not Poly3.objects.filter(pk=b1_pk).exists()
+
+    def test_queryset_delete_keep_parents(self):
+        """
+        Test that QuerySet.delete(keep_parents=True) deletes the child rows and upcasts
+        the parent rows with one update per polymorphic parent, with and without the
+        set based deletion.
+        """
+        from .models import Poly3, A3, B3, Normal3, Normal2, Poly2, A2, B2
+
+        a1, a2, b1 = A3.objects.create(), A3.objects.create(), B3.objects.create()
+        assert A3.objects.filter(pk=a1.pk).delete(keep_parents=True) == (
+            1,
+            {"deletion.A3": 1},
+        )
+        assert list(Poly3.objects.order_by("pk")) == [Poly3(pk=a1.pk), a2, b1]
+        assert type(Poly3.objects.get(pk=a1.pk)) is Poly3
+
+        # deleting from the base model keeps the non polymorphic parent rows
+        assert Poly3.objects.filter(pk__in=[a2.pk, b1.pk]).delete(keep_parents=True) == (
+            4,
+            {"deletion.A3": 1, "deletion.B3": 1, "deletion.Poly3": 2},
+        )
+        assert Normal3.objects.count() == 3
+        assert Poly3.objects.count() == 1
+
+        normal = Normal2.objects.create()
+        a3 = A2.objects.create(normal=normal)
+        b2, b3, b4 = (B2.objects.create(normal=normal) for _ in range(3))
+        with CaptureQueriesContext(connection) as ctx:
+            result = B2.objects.exclude(pk=b4.pk).delete(keep_parents=True, fast=True)
+        assert result == (2, {"deletion.B2": 2})
+        # one select for the primary keys, one delete per table and one update
+        assert [
+            q["sql"].split()[0] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]
+        ] == [
+            "SELECT",
+            "DELETE",
+            "UPDATE",
+        ]
+        assert list(Poly2.objects.order_by("pk")) == [a3, Poly2(pk=b2.pk), Poly2(pk=b3.pk), b4]
+
+    def test_delete_preview(self):
+        """
+        Test that delete_preview() counts the rows delete() deletes with one count query
+        per model and without loading objects.
+        """
+        from .models import Normal1, Poly1, A1, B1, Normal4, Poly4, A4, A_540, B_540, Poly3, A3
+
+        a1, b1 = A1.objects.create(), B1.objects.create()
+        Normal1.objects.create(poly=a1)
+        Normal1.objects.create(poly=b1)
+        with CaptureQueriesContext(connection) as ctx:
+            preview = Poly1.objects.filter(pk=a1.pk).delete_preview()
+        assert preview == (3, {"deletion.A1": 1, "deletion.Normal1": 1, "deletion.Poly1": 1})
+        assert all("COUNT(*)" in q["sql"] for q in ctx.captured_queries)
+        assert Poly1.objects.filter(pk=a1.pk).delete() == preview
+
+        n1 = Normal4.objects.create()
+        p4, a4 = Poly4.objects.create(), A4.objects.create()
+        n1.polies.add(p4, a4)
+        preview = A4.objects.all().delete_preview()
+        assert preview == (
+            3,
+            {"deletion.A4": 1, "deletion.Poly4": 1, "deletion.Poly4_normals": 1},
+        )
+        assert A4.objects.all().delete() == preview
+
+        # self referential relations are followed until no new rows are reached
+        root = A_540.objects.create()
+        child = B_540.objects.create(self_referential=root, name="child")
+        B_540.objects.create(self_referential=child, name="grandchild")
+        A_540.objects.create()
+        preview = A_540.objects.filter(pk=root.pk).delete_preview()
+        assert preview == (5, {"deletion.A_540": 3, "deletion.B_540": 2})
+        assert A_540.objects.filter(pk=root.pk).delete() == preview
+
+        a3 = A3.objects.create()
+        preview = Poly3.objects.all().delete_preview(keep_parents=True)
+        assert preview == (2, {"deletion.A3": 1, "deletion.Poly3": 1})
+        assert Poly3.objects.all().delete(keep_parents=True) == preview
+        assert Poly3.objects.non_polymorphic().filter(pk=a3.pk).count() == 0
+
+    def test_fast_delete(self):
+        """
+        Test that delete(fast=True) deletes set based when nothing needs to be
+        collected and gives the same results as the regular deletion.
+        """
+        from .models import Normal2, Poly2, A2, B2, Normal4, Poly4, A4, B4
+
+        normal = Normal2.objects.create()
+        p1 = Poly2.objects.create(normal=normal)
+        a1 = A2.objects.create(normal=normal)
+        b1 = B2.objects.create(normal=normal)
+        B2.objects.create(normal=normal)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = Poly2.objects.exclude(pk=b1.pk).delete(fast=True)
+        assert result == (
+            5,
+            {"deletion.A2": 1, "deletion.B2": 1, "deletion.Poly2": 3},
+        )
+        # one select for the primary keys, no objects are loaded
+        selects = [q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        assert len(selects) == 1
+        assert list(Poly2.objects.all()) == [b1]
+        assert not A2.objects.filter(pk=a1.pk).exists()
+        assert not Poly2.objects.filter(pk=p1.pk).exists()
+
+        # many to many rows are removed as well
+        n1 = Normal4.objects.create()
+        p4, a4, b4 = Poly4.objects.create(), A4.objects.create(), B4.objects.create()
+        n1.polies.add(p4, a4, b4)
+        assert A4.objects.all().delete(fast=True) == (
+            3,
+            {"deletion.Poly4_normals": 1, "deletion.A4": 1, "deletion.Poly4": 1},
+        )
+        assert set(n1.polies.all()) == {p4, b4}
+
+    def test_fast_delete_fallback(self):
+        """
+        Test that delete(fast=True) falls back to the regular deletion if on_delete
+        handlers or signal receivers apply.
+        """
+        from django.db.models.signals import pre_delete
+
+        from polymorphic.deletion import fast_delete
+
+        from .models import Normal1, Poly1, A1, Normal2, Poly2, A2
+
+        a1 = A1.objects.create()
+        Normal1.objects.create(poly=a1)
+        assert fast_delete(Poly1.objects.all()) is None
+        assert Poly1.objects.all().delete(fast=True) == (
+            3,
+            {"deletion.Normal1": 1, "deletion.A1": 1, "deletion.Poly1": 1},
+        )
+
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance)
+
+        pre_delete.connect(receiver, sender=A2)
+        try:
+            assert fast_delete(Poly2.objects.all()) is None
+            A2.objects.create(normal=Normal2.objects.create())
+            Poly2.objects.all().delete(fast=True)
+            assert [type(obj) for obj in deleted] == [A2]
+        finally:
+            pre_delete.disconnect(receiver, sender=A2)
+
+    def test_fast_delete_disparate_keys(self):
+        """
+        Test that delete(fast=True) falls back to the regular deletion if a parent link
+        is not the primary key, so the rows of the other tables are found.
+        """
+        from polymorphic.deletion import fast_delete
+        from polymorphic.tests.models import DisparateKeysChild2, DisparateKeysParent
+
+        keep = DisparateKeysParent.objects.create(text="keep-me-1")
+        DisparateKeysParent.objects.create(text="keep-me-2")
+        child = DisparateKeysChild2.objects.create(text="child", text_child2="c", key=keep.pk)
+        assert child.pk == keep.pk and child.id != keep.pk
+
+        assert fast_delete(DisparateKeysChild2.objects.filter(pk=child.pk)) is None
+        assert DisparateKeysChild2.objects.filter(pk=child.pk).delete(fast=True) == (
+            2,
+            {"tests.DisparateKeysChild2": 1, "tests.DisparateKeysParent": 1},
+        )
+        assert sorted(DisparateKeysParent.objects.values_list("text", flat=True)) == [
+            "keep-me-1",
+            "keep-me-2",
+        ]
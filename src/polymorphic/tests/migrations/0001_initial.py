@@ -4,6 +4,7 @@ from django.conf import settings
 from django.db import migrations, models
 import django.db.models.deletion
 import django.db.models.manager
+import polymorphic.models
 import polymorphic.showfields
 import polymorphic.tests.models
 import uuid
@@ -1888,4 +1889,60 @@ class Migration(migrations.Migration):
             },
             bases=('tests.uuidartprojectc',),
         ),
+        migrations.CreateModel(
+            name='TypePathA',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('polymorphic_type_path', polymorphic.models.PolymorphicTypePathField(db_index=True, default='', editable=False, max_length=255)),
+                ('field1', models.CharField(max_length=30)),
+                ('polymorphic_ctype', models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='polymorphic_%(app_label)s.%(class)s_set+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TypePathB',
+            fields=[
+                ('typepatha_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='tests.typepatha')),
+                ('field2', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('tests.typepatha',),
+        ),
+        migrations.CreateModel(
+            name='TypePathD',
+            fields=[
+                ('typepatha_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='tests.typepatha')),
+                ('field4', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('tests.typepatha',),
+        ),
+        migrations.CreateModel(
+            name='TypePathC',
+            fields=[
+                ('typepathb_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='tests.typepathb')),
+                ('field3', models.CharField(max_length=30)),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('tests.typepathb',),
+        ),
+        migrations.CreateModel(
+            name='TypePathProxyB',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('tests.typepathb',),
+        ),
     ]
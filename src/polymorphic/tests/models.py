@@ -11,7 +11,7 @@ from django.db.models.functions import Upper
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 
 from polymorphic.managers import PolymorphicManager
-from polymorphic.models import PolymorphicModel
+from polymorphic.models import PolymorphicModel, PolymorphicTypePathField
 from polymorphic.query import PolymorphicQuerySet
 from polymorphic.showfields import ShowFieldContent, ShowFieldType, ShowFieldTypeAndContent
 
@@ -1126,3 +1126,26 @@ class PolymorphicTagB(PolymorphicTagBase):
     """Second child of PolymorphicTagBase with a different extra field."""
 
     color = models.CharField(max_length=20, default="")
+
+
+# Models for testing the materialized type path
+class TypePathA(PolymorphicModel):
+    polymorphic_type_path = PolymorphicTypePathField()
+    field1 = models.CharField(max_length=30)
+
+
+class TypePathB(TypePathA):
+    field2 = models.CharField(max_length=30)
+
+
+class TypePathC(TypePathB):
+    field3 = models.CharField(max_length=30)
+
+
+class TypePathProxyB(TypePathB):
+    class Meta:
+        proxy = True
+
+
+class TypePathD(TypePathA):
+    field4 = models.CharField(max_length=30)
@@ -114,6 +114,7 @@ INSTALLED_APPS = [
     "polymorphic.tests.deletion",
     "polymorphic.tests.other",
     "polymorphic.tests.test_migrations",
+    "polymorphic.tests.benchmarks",
     "polymorphic.tests.examples.views",
     "polymorphic",
     "django.contrib.staticfiles",
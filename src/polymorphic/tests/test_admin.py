@@ -1503,6 +1503,40 @@ class PolymorphicAdminCoverageTests(AdminTestCase):
         obj = qs.first()
         assert isinstance(obj, Model2B)
 
+    def test_get_deleted_objects_preview(self):
+        """get_deleted_objects() summarizes large selections with delete_preview()."""
+
+        @self.register(Model2A)
+        class Model2Admin(PolymorphicParentModelAdmin):
+            base_model = Model2A
+            child_models = (Model2B, Model2C)
+            delete_preview_threshold = 1
+
+        @self.register(Model2B)
+        @self.register(Model2C)
+        class Model2ChildAdmin(PolymorphicChildModelAdmin):
+            base_model = Model2A
+
+        Model2A.objects.create(field1="A1")
+        Model2C.objects.create(field1="C1", field2="C2", field3="C3")
+        admin_instance = self.get_admin_instance(Model2A)
+        request = self.create_admin_request("get", self.get_changelist_url(Model2A))
+        qs = admin_instance.get_queryset(request)
+
+        deleted_objects, model_count, perms_needed, protected = admin_instance.get_deleted_objects(
+            qs, request
+        )
+        assert model_count == {"model2as": 2, "model2bs": 1, "model2cs": 1}
+        assert "Model2cs: 1" in deleted_objects
+        assert not perms_needed and not protected
+
+        # small selections and single objects list every object
+        deleted_objects, model_count, _, _ = admin_instance.get_deleted_objects(
+            qs.filter(field1="A1"), request
+        )
+        assert model_count == {"model2as": 1}
+        assert len(deleted_objects) == 1 and "/change/" in deleted_objects[0]
+
     def test_get_child_type_choices_skips_no_permission(self):
         """get_child_type_choices() skips child models the user cannot add."""
 
@@ -0,0 +1,506 @@
+"""
+Tests for the polymorphic management commands.
+"""
+
+import csv
+import json
+import pytest
+import sys
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.core.management import call_command
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, connections
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from polymorphic.bulk import bulk_load
+
+from polymorphic.tests.models import (
+    Model2A,
+    Model2B,
+    Model2C,
+    Model2D,
+    PlainA,
+    TypePathA,
+    TypePathB,
+    TypePathC,
+    TypePathProxyB,
+)
+from .utils import is_sqlite_in_memory
+
+
+@pytest.fixture
+def model2_objects(db):
+    return (
+        Model2A.objects.create(field1="A1"),
+        Model2B.objects.create(field1="B1", field2="B2"),
+        Model2C.objects.create(field1="C1", field2="C2", field3="C3"),
+        Model2D.objects.create(field1="D1", field2="D2", field3="D3", field4="D4"),
+    )
+
+
+def read_jsonl(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_jsonl(model2_objects):
+    a, b, c, d = model2_objects
+    out = StringIO()
+    call_command("polymorphic_export", "tests.Model2A", stdout=out)
+    records = read_jsonl(out.getvalue())
+    assert [(r["model"], r["pk"]) for r in records] == [
+        ("tests.model2a", a.pk),
+        ("tests.model2b", b.pk),
+        ("tests.model2c", c.pk),
+        ("tests.model2d", d.pk),
+    ]
+    assert records[3]["fields"] == {
+        "id": d.pk,
+        "polymorphic_ctype_id": d.polymorphic_ctype_id,
+        "field1": "D1",
+        "model2a_ptr_id": d.pk,
+        "field2": "D2",
+        "model2b_ptr_id": d.pk,
+        "field3": "D3",
+        "model2c_ptr_id": d.pk,
+        "field4": "D4",
+    }
+
+    out = StringIO()
+    call_command("polymorphic_export", "tests.Model2B", pk_min=c.pk, chunk_size=1, stdout=out)
+    assert [(r["model"], r["pk"]) for r in read_jsonl(out.getvalue())] == [
+        ("tests.model2c", c.pk),
+        ("tests.model2d", d.pk),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_csv(model2_objects, tmp_path):
+    call_command("polymorphic_export", "tests.Model2A", format="csv", output=str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "tests.model2a.csv",
+        "tests.model2b.csv",
+        "tests.model2c.csv",
+        "tests.model2d.csv",
+    ]
+    with open(tmp_path / "tests.model2c.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["field3"] == "C3"
+    assert rows[0]["model2b_ptr_id"] == str(model2_objects[2].pk)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_errors(db):
+    with pytest.raises(CommandError):
+        call_command("polymorphic_export", "tests.DoesNotExist")
+    with pytest.raises(CommandError):
+        call_command("polymorphic_export", "tests.PlainA")
+    with pytest.raises(CommandError):
+        call_command("polymorphic_export", "tests.Model2A", format="csv")
+    with pytest.raises(CommandError):
+        call_command("polymorphic_export", "tests.Model2A", workers=2)
+
+
+@pytest.mark.skipif(
+    is_sqlite_in_memory(),
+    reason="Worker processes cannot share an in-memory sqlite test database",
+)
+@pytest.mark.django_db(transaction=True)
+def test_export_workers(model2_objects, tmp_path):
+    output = tmp_path / "export.jsonl"
+    call_command("polymorphic_export", "tests.Model2A", workers=2, output=str(output))
+    assert [r["pk"] for r in read_jsonl(output.read_text())] == [o.pk for o in model2_objects]
+    assert [p.name for p in tmp_path.iterdir()] == ["export.jsonl"]
+
+
+@pytest.fixture
+def file_database(db, tmp_path):
+    """
+    A migrated sqlite database in a file that only exists as a connection, so worker
+    processes can only reach it with the settings of the connection.
+    """
+    alias = "file_export"
+    connections.settings[alias] = {
+        **connections["default"].settings_dict,
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(tmp_path / "db.sqlite3"),
+    }
+    # dynamically created connections are allowed in tests
+    connections[alias] = connections.create_connection(alias)
+    del connections.settings[alias]
+    try:
+        call_command("migrate", database=alias, verbosity=0)
+        yield alias
+    finally:
+        connections[alias].close()
+        del connections[alias]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_workers_csv(file_database, tmp_path):
+    objs = [
+        Model2A.objects.db_manager(file_database).create(field1="A1"),
+        Model2B.objects.db_manager(file_database).create(field1="B1", field2="B2"),
+        Model2C.objects.db_manager(file_database).create(field1="C1", field2="C2", field3="C3"),
+        Model2B.objects.db_manager(file_database).create(field1="B3", field2="B4"),
+    ]
+    output = tmp_path / "export"
+    # files of an earlier export are replaced
+    for _ in range(2):
+        call_command(
+            "polymorphic_export",
+            "tests.Model2A",
+            format="csv",
+            workers=3,
+            database=file_database,
+            output=str(output),
+        )
+    assert sorted(p.name for p in output.iterdir()) == [
+        "tests.model2a.csv",
+        "tests.model2b.csv",
+        "tests.model2c.csv",
+    ]
+    with open(output / "tests.model2b.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["field1"], row["field2"]) for row in rows] == [("B1", "B2"), ("B3", "B4")]
+    assert [row["model2a_ptr_id"] for row in rows] == [str(objs[1].pk), str(objs[3].pk)]
+    assert not list(tmp_path.glob("export.part*"))
+
+
+def dump_model2(path):
+    call_command(
+        "dumpdata",
+        "tests.Model2A",
+        "tests.Model2B",
+        "tests.Model2C",
+        "tests.Model2D",
+        natural_foreign=True,
+        output=str(path),
+    )
+    Model2A.objects.all().delete()
+    assert not Model2A.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_loaddata(model2_objects, tmp_path):
+    fixture = tmp_path / "model2.json"
+    dump_model2(fixture)
+
+    saved = []
+
+    def receiver(sender, raw, **kwargs):
+        assert raw
+        saved.append(sender)
+
+    post_save.connect(receiver)
+    try:
+        with CaptureQueriesContext(connection) as ctx:
+            call_command("polymorphic_loaddata", str(fixture), verbosity=0)
+    finally:
+        post_save.disconnect(receiver)
+
+    # one insert per table instead of one per object and table
+    inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 4
+    assert sorted(m.__name__ for m in saved) == ["Model2A"] * 4 + ["Model2B"] * 3 + [
+        "Model2C"
+    ] * 2 + ["Model2D"]
+
+    assert list(Model2A.objects.order_by("pk")) == list(model2_objects)
+    assert Model2D.objects.get().field4 == "D4"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_loaddata_error(model2_objects, tmp_path):
+    fixture = tmp_path / "model2.json"
+    dump_model2(fixture)
+    call_command("polymorphic_loaddata", str(fixture), verbosity=0)
+    pks = ", ".join(str(obj.pk) for obj in model2_objects)
+
+    # the rows exist already, the error names the fixture and the objects of the batch
+    for batch_size in (1000, 4):
+        with pytest.raises(IntegrityError) as exc_info:
+            call_command("polymorphic_loaddata", str(fixture), verbosity=0, batch_size=batch_size)
+        message = str(exc_info.value)
+        assert message.startswith("Problem installing fixture '")
+        assert str(fixture.stem) in message
+        assert f"Could not load tests.Model2A(pk={pks}): " in message
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_load(model2_objects, tmp_path):
+    fixture = tmp_path / "model2.json"
+    dump_model2(fixture)
+
+    saved = []
+
+    def receiver(sender, **kwargs):
+        saved.append(sender)
+
+    post_save.connect(receiver)
+    try:
+        with open(fixture) as f:
+            assert (
+                bulk_load(serializers.deserialize("json", f), batch_size=3, send_signals=False)
+                == 10
+            )
+    finally:
+        post_save.disconnect(receiver)
+
+    assert not saved
+    assert list(Model2A.objects.order_by("pk")) == list(model2_objects)
+    assert [o.field3 for o in Model2C.objects.order_by("pk")] == ["C3", "D3"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_reset_ctype(model2_objects, tmp_path):
+    Model2A.objects.all().update(polymorphic_ctype_id=None)
+    checkpoint = tmp_path / "checkpoint"
+    checkpoint.write_text(str(model2_objects[1].pk))
+
+    out = StringIO()
+    call_command(
+        "polymorphic_reset_ctype",
+        "tests.Model2A",
+        batch_size=1,
+        checkpoint_file=str(checkpoint),
+        verbosity=2,
+        stdout=out,
+    )
+    assert not checkpoint.exists()
+    assert f"Resuming after primary key {model2_objects[1].pk}." in out.getvalue()
+    assert "2 rows processed" in out.getvalue()
+    assert list(
+        Model2A.objects.non_polymorphic()
+        .order_by("pk")
+        .values_list("polymorphic_ctype", flat=True)
+    )[:2] == [None, None]
+
+    call_command("polymorphic_reset_ctype", "tests.Model2A", verbosity=0)
+    assert list(Model2A.objects.order_by("pk")) == list(model2_objects)
+
+    with pytest.raises(CommandError):
+        call_command("polymorphic_reset_ctype", "tests.PlainA")
+    with pytest.raises(CommandError):
+        call_command("polymorphic_reset_ctype", "tests.Model2A", batch_size=0)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_check(model2_objects):
+    a, b, c, d = model2_objects
+    ctype_b = ContentType.objects.get_for_model(Model2B)
+    gone = ContentType.objects.create(app_label="tests", model="gone")
+    Model2A.objects.filter(pk=a.pk).update(polymorphic_ctype=ctype_b)
+    Model2A.objects.filter(pk=b.pk).update(polymorphic_ctype=None)
+    Model2A.objects.filter(pk=c.pk).update(polymorphic_ctype=gone)
+    Model2A.objects.filter(pk=d.pk).update(polymorphic_ctype=ctype_b)
+
+    out = StringIO()
+    with pytest.raises(CommandError, match="Found 4 broken rows"):
+        call_command("polymorphic_check", "tests.Model2C", batch_size=3, stdout=out)
+    output = out.getvalue()
+    assert f"tests.Model2A: 1 rows without a polymorphic_ctype (e.g. pk {b.pk})" in output
+    assert (
+        f"tests.Model2A: 1 tests.Model2B rows without a row in tests_model2b (e.g. pk {a.pk})"
+        in output
+    )
+    assert f"1 tests.Model2B rows with a row in tests_model2c (e.g. pk {d.pk})" in output
+    assert "1 rows with a polymorphic_ctype that is not a model derived from tests.Model2A" in (
+        output
+    )
+    assert "content type tests.gone no longer exists" in output
+
+    out = StringIO()
+    call_command("polymorphic_check", "tests.Model2A", repair=True, batch_size=3, stdout=out)
+    assert "Repaired 4 of 4 broken rows." in out.getvalue()
+    assert list(Model2A.objects.order_by("pk")) == list(model2_objects)
+
+    out = StringIO()
+    call_command("polymorphic_check", "tests.Model2A", stdout=out)
+    assert out.getvalue() == "No problems found.\n"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_check_type_path():
+    a = TypePathA.objects.create(field1="A1")
+    proxy = TypePathProxyB.objects.create(field1="P1", field2="P2")
+    c = TypePathC.objects.create(field1="C1", field2="C2", field3="C3")
+    TypePathA.objects.filter(pk__in=[a.pk, proxy.pk]).update(polymorphic_type_path="")
+    TypePathA.objects.filter(pk=c.pk).update(
+        polymorphic_ctype=ContentType.objects.get_for_model(TypePathB)
+    )
+
+    out = StringIO()
+    with pytest.raises(CommandError, match="Found 3 broken rows"):
+        call_command("polymorphic_check", "tests.TypePathA", stdout=out)
+    output = out.getvalue()
+    assert f"1 tests.TypePathA rows with a wrong polymorphic_type_path (e.g. pk {a.pk})" in (
+        output
+    )
+    assert (
+        f"1 tests.TypePathProxyB rows with a wrong polymorphic_type_path (e.g. pk {proxy.pk})"
+        in (output)
+    )
+    assert f"1 tests.TypePathB rows with a row in tests_typepathc (e.g. pk {c.pk})" in output
+
+    out = StringIO()
+    call_command("polymorphic_check", "tests.TypePathA", repair=True, stdout=out)
+    assert "Repaired 3 of 3 broken rows." in out.getvalue()
+    assert list(TypePathA.objects.order_by("pk")) == [a, proxy, c]
+    assert list(
+        TypePathA.objects.order_by("pk").values_list("polymorphic_type_path", flat=True)
+    ) == [
+        "/tests.typepatha/",
+        "/tests.typepatha/tests.typepathb/tests.typepathproxyb/",
+        "/tests.typepatha/tests.typepathb/tests.typepathc/",
+    ]
+
+    out = StringIO()
+    call_command("polymorphic_check", "tests.TypePathA", stdout=out)
+    assert out.getvalue() == "No problems found.\n"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_ctype_registry(tmp_path):
+    from polymorphic.registry import check_registry, load_registry
+    from polymorphic.utils import _lazy_ctype
+
+    output = tmp_path / "ctypes.py"
+    call_command("polymorphic_ctype_registry", output=str(output), verbosity=0)
+    call_command("polymorphic_ctype_registry", output=str(output), check=True)
+    namespace = {}
+    exec(output.read_text(), namespace)
+    registry = namespace["CONTENT_TYPES"]
+    ctype = ContentType.objects.get_for_model(Model2B)
+    assert registry["default"]["tests", "model2b"] == ctype.pk
+    assert check_registry(registry) == []
+
+    try:
+        ContentType.objects.clear_cache()
+        with CaptureQueriesContext(connection) as ctx:
+            assert load_registry(registry) == len(
+                [pk for pk in registry["default"].values() if pk is not None]
+            )
+            assert _lazy_ctype(Model2B) == ctype
+            assert ContentType.objects.get_for_id(ctype.pk).model_class() is Model2B
+        assert not ctx.captured_queries
+    finally:
+        ContentType.objects._cache = {}
+
+    registry["default"]["tests", "model2b"] += 1000
+    del registry["default"]["tests", "model2c"]
+    assert check_registry(registry) == [
+        f"tests.model2b has content type id {ctype.pk} in the 'default' database, but "
+        f"{ctype.pk + 1000} in the content type registry.",
+        "tests.model2c is missing from the content type registry.",
+    ]
+    assert check_registry(registry, include_missing=False) == [
+        f"tests.model2b has content type id {ctype.pk} in the 'default' database, but "
+        f"{ctype.pk + 1000} in the content type registry.",
+    ]
+
+    # missing models do not stop the startup, they are looked up in the database
+    registry["default"]["tests", "model2b"] = ctype.pk
+    try:
+        ContentType.objects.clear_cache()
+        load_registry(registry)
+        with CaptureQueriesContext(connection) as ctx:
+            assert ContentType.objects.get_for_model(Model2B) == ctype
+        assert not ctx.captured_queries
+        assert not isinstance(_lazy_ctype(Model2C), ContentType)
+        with CaptureQueriesContext(connection) as ctx:
+            assert ContentType.objects.get_for_model(Model2C).model == "model2c"
+        assert len(ctx.captured_queries) == 1
+    finally:
+        ContentType.objects._cache = {}
+
+    output.write_text("")
+    with pytest.raises(CommandError, match="out of date"):
+        call_command("polymorphic_ctype_registry", output=str(output), check=True)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_ctype_registry_startup_check(monkeypatch):
+    import types
+
+    from django.db.backends.signals import connection_created
+    from django.test import override_settings
+
+    from polymorphic import registry as registry_module
+    from polymorphic.registry import build_registry, check_registry_on_connect
+
+    registry = build_registry("default")
+    module = types.ModuleType("polymorphic_ctypes")
+    module.CONTENT_TYPES = registry
+    monkeypatch.setitem(sys.modules, "polymorphic_ctypes", module)
+    monkeypatch.setattr(registry_module, "_checked_aliases", set())
+    ctype = ContentType.objects.get_for_model(Model2B)
+
+    with override_settings(POLYMORPHIC_CONTENT_TYPE_REGISTRY="polymorphic_ctypes"):
+        # a registry that matches the database passes and is only checked once
+        check_registry_on_connect(connection)
+        assert registry_module._checked_aliases == {"default"}
+        registry["default"]["tests", "model2b"] = ctype.pk + 1000
+        check_registry_on_connect(connection)
+
+        # new connections fail until the registry is fixed
+        registry_module._checked_aliases.clear()
+        for _ in range(2):
+            with pytest.raises(ImproperlyConfigured, match="tests.model2b has content type id"):
+                connection_created.send(sender=type(connection), connection=connection)
+        assert "default" not in registry_module._checked_aliases
+
+        # content types that are not in the database yet are not compared
+        registry["default"]["tests", "model2c"] = None
+        ContentType.objects.filter(pk=ctype.pk).update(model="renamed")
+        check_registry_on_connect(connection)
+        ContentType.objects.filter(pk=ctype.pk).update(model="model2b")
+
+        with override_settings(POLYMORPHIC_CONTENT_TYPE_REGISTRY_CHECK=False):
+            registry_module._checked_aliases.clear()
+            registry["default"]["tests", "model2a"] = -1
+            check_registry_on_connect(connection)
+            assert not registry_module._checked_aliases
+
+        # the command that updates the registry is not stopped by it
+        call_command("polymorphic_ctype_registry", verbosity=0, stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_polymorphic_ctype_registry_system_checks(monkeypatch):
+    import types
+
+    from django.test import override_settings
+
+    from polymorphic.apps import (
+        check_content_type_registry,
+        check_content_type_registry_entries,
+    )
+    from polymorphic.registry import build_registry
+
+    registry = build_registry("default")
+    module = types.ModuleType("polymorphic_ctypes")
+    module.CONTENT_TYPES = registry
+    monkeypatch.setitem(sys.modules, "polymorphic_ctypes", module)
+
+    with override_settings(POLYMORPHIC_CONTENT_TYPE_REGISTRY="polymorphic_ctypes"):
+        assert check_content_type_registry_entries(None) == []
+        assert check_content_type_registry(None, databases=["default"]) == []
+
+        # a model added since the registry was generated is a warning, not an error
+        del registry["default"]["tests", "model2c"]
+        (warning,) = check_content_type_registry_entries(None)
+        assert warning.id == "polymorphic.W003"
+        assert "tests.model2c" in warning.msg
+        assert check_content_type_registry(None, databases=["default"]) == []
+
+        registry["default"]["tests", "model2b"] = -1
+        (error,) = check_content_type_registry(None, databases=["default"])
+        assert error.id == "polymorphic.E003"
+        assert "tests.model2b" in error.msg
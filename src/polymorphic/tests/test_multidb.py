@@ -369,3 +369,44 @@ class MultipleDatabasesTests(TestCase):
         # The write should have landed in "default" (the write database).
         self.assertTrue(Model2B.objects.using("default").filter(field1="modified").exists())
         self.assertFalse(Model2B.objects.using("secondary").filter(field1="modified").exists())
+
+    def test_bulk_create_respects_db_for_write_router(self):
+        """
+        bulk_create() should look up content types on the router's write database,
+        not on its read database.
+        """
+        from unittest import mock
+
+        class ReadWriteSplitRouter:
+            def db_for_read(self, model, **hints):
+                return "secondary"
+
+            def db_for_write(self, model, **hints):
+                return "default"
+
+            def allow_relation(self, obj1, obj2, **hints):
+                return True
+
+            def allow_migrate(self, db, app_label, **hints):
+                return True
+
+        objs = [Model2A(field1="A1"), Model2B(field1="B1", field2="B2")]
+        with self.settings(DATABASE_ROUTERS=[ReadWriteSplitRouter()]):
+            with mock.patch.object(
+                Model2A,
+                "pre_save_polymorphic",
+                autospec=True,
+                side_effect=Model2A.pre_save_polymorphic,
+            ) as pre_save_polymorphic:
+                Model2A.objects.bulk_create(objs)
+
+        assert [call.kwargs["using"] for call in pre_save_polymorphic.call_args_list] == [
+            "default",
+            "default",
+        ]
+        self.assertQuerySetEqual(
+            Model2A.objects.using("default").order_by("pk"),
+            [Model2A, Model2B],
+            transform=lambda o: o.__class__,
+        )
+        assert not Model2A.objects.using("secondary").exists()
@@ -6,9 +6,11 @@ import django
 from packaging.version import Version
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import models, connection
 from django.db.models import (
     Case,
+    F,
     Count,
     FilteredRelation,
     Q,
@@ -17,6 +19,7 @@ from django.db.models import (
     Exists,
     OuterRef,
     Subquery,
+    Value,
 )
 from django.db.utils import IntegrityError, NotSupportedError
 from django.test import TransactionTestCase
@@ -67,6 +70,7 @@ from polymorphic.tests.models import (
     ModelX,
     ModelY,
     MRODerived,
+    MultiTableBase,
     MultiTableDerived,
     MyManager,
     MyManagerQuerySet,
@@ -100,6 +104,11 @@ from polymorphic.tests.models import (
     SubclassSelectorProxyBaseModel,
     SubclassSelectorProxyConcreteModel,
     ParentLinkAndRelatedName,
+    TypePathA,
+    TypePathB,
+    TypePathC,
+    TypePathD,
+    TypePathProxyB,
     UUIDArtProject,
     UUIDArtProjectA,
     UUIDArtProjectB,
@@ -417,6 +426,141 @@ class PolymorphicTests(TransactionTestCase):
         objects = Model2A.objects.get_real_instances([])
         self.assertQuerySetEqual(objects, [], transform=lambda o: o.__class__)
 
+    def test_polymorphic_stats(self):
+        from polymorphic.signals import polymorphic_downcast
+
+        a, b, c, d = self.create_model2abcd()
+        events = []
+
+        def receiver(sender, queryset, stats, **kwargs):
+            events.append((sender, queryset, stats))
+
+        polymorphic_downcast.connect(receiver)
+        try:
+            qs = Model2A.objects.order_by("pk")
+            assert qs.polymorphic_stats is None
+            list(qs)
+            stats = qs.polymorphic_stats
+            assert events == [(Model2A, qs, stats)]
+            assert (stats.base_rows, stats.chunks, stats.subclass_queries) == (4, 1, 3)
+            assert stats.rows_per_type == {Model2A: 1, Model2B: 1, Model2C: 1, Model2D: 1}
+            assert stats.types == 4
+            assert (stats.stale_rows, stats.retried_rows) == (0, 0)
+            assert {"base_query", "classify", "subclass_queries"} <= set(stats.timings)
+            assert qs.all().polymorphic_stats is None
+
+            # the D row is missing from its table and fetched as a C
+            Model2A.objects.filter(pk=c.pk).update(
+                polymorphic_ctype=ContentType.objects.get_for_model(Model2D)
+            )
+            qs = Model2A.objects.order_by("pk")
+            list(qs.iterator(chunk_size=2))
+            stats = qs.polymorphic_stats
+            assert (stats.base_rows, stats.chunks, stats.subclass_queries) == (4, 2, 3)
+            assert stats.rows_per_type == {Model2A: 1, Model2B: 1, Model2C: 1, Model2D: 1}
+            assert stats.retried_rows == 1
+            assert len(events) == 2
+
+            qs = Model2A.objects.non_polymorphic()
+            list(qs)
+            assert qs.polymorphic_stats is None
+            assert len(events) == 2
+
+            qs.get_real_instances()
+            assert qs.polymorphic_stats.rows_per_type[Model2D] == 1
+            assert events[-1] == (Model2A, qs, qs.polymorphic_stats)
+        finally:
+            polymorphic_downcast.disconnect(receiver)
+
+    def test_tracing(self):
+        from contextlib import contextmanager
+
+        from polymorphic.tracing import NoOpTracer, get_tracer, set_tracer
+
+        class Span:
+            def __init__(self, name):
+                self.name = name
+                self.attributes = {}
+
+            def is_recording(self):
+                return True
+
+            def set_attribute(self, key, value):
+                self.attributes[key] = value
+
+        class Tracer:
+            spans = []
+
+            @contextmanager
+            def start_as_current_span(self, name, attributes=None, **kwargs):
+                span = Span(name)
+                self.spans.append(span)
+                yield span
+
+        a, b, c, d = self.create_model2abcd()
+        Model2A.objects.filter(pk=c.pk).update(
+            polymorphic_ctype=ContentType.objects.get_for_model(Model2D)
+        )
+        assert isinstance(get_tracer(), NoOpTracer)
+        set_tracer(Tracer())
+        try:
+            list(Model2A.objects.order_by("pk").annotate(one=Value(1)))
+        finally:
+            set_tracer(None)
+        assert isinstance(get_tracer(), NoOpTracer)
+
+        spans = {span.name: span.attributes for span in Tracer.spans}
+        assert list(spans) == [
+            "polymorphic base query",
+            "polymorphic subclass fetch tests.Model2D",
+            "polymorphic annotation copy",
+            "polymorphic stale retry tests.Model2C",
+            "polymorphic subclass fetch tests.Model2B",
+        ]
+        assert spans["polymorphic base query"]["polymorphic.rows"] == 4
+        assert spans["polymorphic base query"]["polymorphic.db_alias"] == "default"
+        assert spans["polymorphic base query"]["db.system"] == connection.vendor
+        assert "tests_model2a" in spans["polymorphic base query"]["db.statement"]
+        assert spans["polymorphic subclass fetch tests.Model2D"]["polymorphic.rows"] == 1
+        assert "tests_model2d" in spans["polymorphic subclass fetch tests.Model2D"]["db.statement"]
+        assert spans["polymorphic stale retry tests.Model2C"]["polymorphic.rows"] == 1
+
+    def test_polymorphic_plan(self):
+        a, b, c, d = self.create_model2abcd()
+        Model2D.objects.create(field1="D1", field2="D2", field3="D3", field4="D4")
+        qs = Model2A.objects.filter(Q(field1__startswith="D") | Q(pk__in=[a.pk, b.pk])).order_by(
+            "pk"
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            plan = qs.polymorphic_plan(chunk_size=2)
+        # one GROUP BY and one query for the primary keys of each subclass
+        assert len(ctx.captured_queries) == 3
+        assert (plan.model, plan.using, plan.rows, plan.chunk_size) == (Model2A, "default", 4, 2)
+        assert plan.sql == str(qs.query)
+        assert plan.explain is None
+        assert [
+            (query.model, query.rows, query.queries, query.joins)
+            for query in plan.subclass_queries
+        ] == [
+            (Model2D, 2, 2, ["tests_model2c", "tests_model2b", "tests_model2a"]),
+            (Model2B, 1, 1, ["tests_model2a"]),
+        ]
+        assert "tests_model2d" in plan.subclass_queries[0].sql
+        assert "Model2D: 2 rows in up to 2 queries joining tests_model2c" in str(plan)
+
+        list(qs.iterator(chunk_size=2))
+        assert qs.polymorphic_stats.subclass_queries <= sum(
+            query.queries for query in plan.subclass_queries
+        )
+
+        plan = qs.polymorphic_plan(explain=True)
+        assert plan.explain
+        assert all(query.explain for query in plan.subclass_queries)
+
+        assert not qs.non_polymorphic().polymorphic_plan().subclass_queries
+        assert qs[:1].polymorphic_plan().rows == 1
+
     def test_queryset_missing_derived(self):
         a = Model2A.objects.create(field1="A1")
         b = Model2B.objects.create(field1="B1", field2="B2")
@@ -490,6 +634,137 @@ class PolymorphicTests(TransactionTestCase):
         assert q.children[1][0] == "polymorphic_ctype__in"
         assert set(q.children[1][1]) == set(expected_cached)
 
+    def test_instance_of_content_type_ids_cache(self):
+        from unittest import mock
+
+        from django.test import override_settings
+
+        from polymorphic.utils import concrete_descendants
+
+        a, b, c, d = self.create_model2abcd()
+        hierarchy = [Model2A, *concrete_descendants(Model2A, include_proxy=True)]
+
+        def warm():
+            ContentType.objects.get_for_models(*hierarchy, for_concrete_models=False)
+
+        ContentType.objects.clear_cache()
+        warm()
+        ids = sorted(
+            ContentType.objects.get_for_model(model, for_concrete_model=False).pk
+            for model in hierarchy
+            if issubclass(model, Model2B)
+        )
+
+        with mock.patch.object(
+            query_translate,
+            "_get_mro_content_type_ids",
+            wraps=query_translate._get_mro_content_type_ids,
+        ) as resolve:
+            # descendants are only listed once
+            q = query_translate.create_instanceof_q([Model2C, Model2B])
+            assert q.children == [("polymorphic_ctype__in", ids)]
+            assert query_translate.create_instanceof_q((Model2C, Model2B)).children == q.children
+            assert resolve.call_count == 1
+            assert set(Model2A.objects.instance_of(Model2C, Model2B)) == {b, c, d}
+            assert resolve.call_count == 1
+
+            # a single content type is compared for equality
+            q = query_translate.create_instanceof_q(Model2D, not_instance_of=True)
+            assert q.negated
+            assert q.children == [
+                ("polymorphic_ctype", ContentType.objects.get_for_model(Model2D).pk)
+            ]
+            assert set(Model2A.objects.not_instance_of(Model2D)) == {a, b, c}
+            assert '"polymorphic_ctype_id" = ' in str(Model2A.objects.instance_of(Model2D).query)
+
+            # clearing the content type cache invalidates the ids
+            ContentType.objects.clear_cache()
+            assert set(Model2A.objects.instance_of(Model2D)) == {d}
+            warm()
+            assert set(Model2A.objects.instance_of(Model2D)) == {d}
+            calls = resolve.call_count
+            assert set(Model2A.objects.instance_of(Model2D)) == {d}
+            assert resolve.call_count == calls
+
+        assert query_translate._content_type_ids_q([3, 4, 5]).children == [
+            ("polymorphic_ctype__in", [3, 4, 5])
+        ]
+        with override_settings(POLYMORPHIC_INSTANCE_OF_RANGES=True):
+            assert query_translate._content_type_ids_q([3, 4, 5]).children == [
+                ("polymorphic_ctype_id__range", (3, 5))
+            ]
+            assert query_translate._content_type_ids_q([3, 5, 6]).children == [
+                ("polymorphic_ctype__in", [3, 5, 6])
+            ]
+            if ids == list(range(ids[0], ids[-1] + 1)):
+                assert "BETWEEN" in str(Model2A.objects.instance_of(Model2B).query)
+            assert set(Model2A.objects.instance_of(Model2B)) == {b, c, d}
+
+    def test_type_path(self):
+        from polymorphic.utils import (
+            get_polymorphic_type_path,
+            reset_polymorphic_ctype,
+            reset_polymorphic_type_path,
+        )
+
+        path_a = "/tests.typepatha/"
+        path_b = "/tests.typepatha/tests.typepathb/"
+        path_c = "/tests.typepatha/tests.typepathb/tests.typepathc/"
+        path_proxy = "/tests.typepatha/tests.typepathb/tests.typepathproxyb/"
+        path_d = "/tests.typepatha/tests.typepathd/"
+        assert get_polymorphic_type_path(TypePathProxyB) == path_proxy
+        assert get_polymorphic_type_path(Model2B) is None
+
+        def paths():
+            return dict(TypePathA.objects.values_list("pk", "polymorphic_type_path"))
+
+        a = TypePathA.objects.create(field1="A1")
+        b = TypePathB.objects.create(field1="B1", field2="B2")
+        c = TypePathC.objects.create(field1="C1", field2="C2", field3="C3")
+        proxy = TypePathProxyB.objects.create(field1="P1", field2="P2")
+        (d,) = TypePathA.objects.bulk_create([TypePathD(field1="D1", field4="D4")])
+        assert paths() == {
+            a.pk: path_a,
+            b.pk: path_b,
+            c.pk: path_c,
+            proxy.pk: path_proxy,
+            d.pk: path_d,
+        }
+
+        # instance_of matches the type path prefixes
+        q = query_translate.create_instanceof_q([TypePathC, TypePathB])
+        assert q.children == [("polymorphic_type_path__startswith", path_b)]
+        with CaptureQueriesContext(connection) as queries:
+            assert set(TypePathA.objects.instance_of(TypePathB)) == {b, c, proxy}
+        assert "LIKE" in queries.captured_queries[0]["sql"]
+        assert "polymorphic_ctype_id" not in queries.captured_queries[0]["sql"].split("WHERE")[1]
+        assert set(TypePathA.objects.instance_of(TypePathC, TypePathD)) == {c, d}
+        assert set(TypePathA.objects.not_instance_of(TypePathB)) == {a, d}
+        assert set(TypePathB.objects.instance_of(TypePathProxyB)) == {proxy}
+        assert set(TypePathA.objects.filter(Q(instance_of=TypePathD) | Q(field1="A1"))) == {a, d}
+
+        # the type path follows the set based operations that change the content type
+        TypePathC.objects.convert_from(TypePathA.objects.filter(pk=a.pk))
+        TypePathA.objects.filter(pk=c.pk).demote_to(TypePathA)
+        assert paths()[a.pk] == path_c
+        assert paths()[c.pk] == path_a
+        TypePathB.objects.get(pk=b.pk).delete(keep_parents=True)
+        assert paths()[b.pk] == path_a
+        TypePathD.objects.create_from_super(TypePathA.objects.get(pk=b.pk), field4="D4")
+        assert paths()[b.pk] == path_d
+
+        # the rows are backfilled from their content type
+        TypePathA.objects.update(polymorphic_type_path="")
+        assert not TypePathA.objects.instance_of(TypePathA).exists()
+        assert reset_polymorphic_type_path(TypePathA, pk__in=[a.pk, b.pk]) == 2
+        assert reset_polymorphic_type_path(TypePathA) == 3
+        assert reset_polymorphic_type_path(TypePathA) == 0
+        assert reset_polymorphic_type_path(Model2A) == 0
+        TypePathA.objects.update(polymorphic_type_path="")
+        reset_polymorphic_ctype(TypePathA, TypePathB, TypePathC, TypePathD)
+        assert paths()[a.pk] == path_c
+        assert paths()[d.pk] == path_d
+
     def test_instance_of_single_lazy_query(self):
         a = Model2A.objects.create(field1="A1")
         b = Model2B.objects.create(field1="B1", field2="B2")
@@ -1369,11 +1644,412 @@ class PolymorphicTests(TransactionTestCase):
             "rubberduck2",
         ]
 
-    def test_bulk_create_unsupported_multi_table_inheritance(self):
+    def test_bulk_create_multi_table_inheritance(self):
+        objs = MultiTableDerived.objects.bulk_create(
+            [
+                MultiTableDerived(field1="field1", field2="field2"),
+                MultiTableDerived(field1="field3", field2="field4"),
+            ]
+        )
+        assert all(obj.pk is not None and not obj._state.adding for obj in objs)
+        assert list(MultiTableBase.objects.order_by("pk")) == objs
+        assert list(MultiTableDerived.objects.order_by("pk").values_list("field1", "field2")) == [
+            ("field1", "field2"),
+            ("field3", "field4"),
+        ]
+
+    def test_bulk_create_mixed_multi_table_inheritance(self):
+        objs = [
+            Model2D(field1="D1", field2="D2", field3="D3", field4="D4"),
+            Model2A(field1="A1"),
+            Model2C(field1="C1", field2="C2", field3="C3"),
+            Model2B(field1="B1", field2="B2"),
+            Model2D(field1="D5", field2="D6", field3="D7", field4="D8"),
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            created = Model2A.objects.bulk_create(objs)
+        assert created == objs
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        if connection.features.can_return_rows_from_bulk_insert:
+            # one insert per table
+            assert len(inserts) == 4
+
+        assert list(Model2A.objects.order_by("pk")) == objs
+        d = Model2D.objects.get(pk=objs[0].pk)
+        assert (d.field1, d.field2, d.field3, d.field4) == ("D1", "D2", "D3", "D4")
+        assert objs[2].model2b_ptr_id == objs[2].model2a_ptr_id == objs[2].pk
+        assert Model2B.objects.count() == 4
+
+        # explicit primary keys are propagated to the parent tables
+        pk = max(obj.pk for obj in objs) + 100
+        Model2B.objects.bulk_create([Model2C(pk=pk, field1="C8", field2="C9", field3="C10")])
+        assert Model2A.objects.get(pk=pk).field3 == "C10"
+
+    def test_bulk_create_multi_table_batch_size(self):
+        objs = [Model2B(field1=f"B{idx}", field2=f"B{idx}") for idx in range(5)]
+        with CaptureQueriesContext(connection) as ctx:
+            Model2B.objects.bulk_create(objs, batch_size=2)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        if connection.features.can_return_rows_from_bulk_insert:
+            assert len(inserts) == 6
+        assert list(Model2A.objects.order_by("pk")) == objs
+
         with pytest.raises(ValueError):
-            MultiTableDerived.objects.bulk_create(
-                [MultiTableDerived(field1="field1", field2="field2")]
+            Model2B.objects.bulk_create([Model2B()], batch_size=0)
+        with pytest.raises(ValueError):
+            Model2B.objects.bulk_create([Model2B()], ignore_conflicts=True)
+
+    def test_bulk_update_mixed(self):
+        self.create_model2abcd()
+        objs = list(Model2A.objects.order_by("pk"))
+        for obj in objs:
+            obj.field1 = f"{obj.field1}x"
+            if isinstance(obj, Model2B):
+                obj.field2 = f"{obj.field2}y"
+            if isinstance(obj, Model2D):
+                obj.field4 = f"{obj.field4}z"
+
+        with CaptureQueriesContext(connection) as ctx:
+            counts = Model2A.objects.bulk_update_counts(objs, ["field1", "Model2D___field4"])
+        # field2 is not updated and there is one update per table
+        assert counts == {Model2A: 4, Model2D: 1}
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]) == 2
+
+        assert list(Model2A.objects.order_by("pk").values_list("field1", flat=True)) == [
+            "A1x",
+            "B1x",
+            "C1x",
+            "D1x",
+        ]
+        assert list(Model2B.objects.order_by("pk").values_list("field2", flat=True)) == [
+            "B2",
+            "C2",
+            "D2",
+        ]
+        assert Model2D.objects.get().field4 == "D4z"
+
+        # plain names are resolved on the real class of each object
+        counts = Model2A.objects.bulk_update_counts(objs, ["field2"], batch_size=2)
+        assert counts == {Model2B: 3}
+
+        # like Django, the number of matched objects is returned, each object counted once
+        assert Model2A.objects.bulk_update(objs, ["field1", "field2", "Model2D___field4"]) == 4
+        assert Model2A.objects.bulk_update(objs, ["Model2D___field4", "field2"]) == 3
+        assert list(Model2B.objects.order_by("pk").values_list("field2", flat=True)) == [
+            "B2y",
+            "C2y",
+            "D2y",
+        ]
+
+        with pytest.raises(FieldDoesNotExist):
+            Model2A.objects.bulk_update(objs, ["nope"])
+        with pytest.raises(FieldDoesNotExist):
+            Model2A.objects.bulk_update(objs, ["Model2B___nope"])
+        with pytest.raises(ValueError):
+            Model2A.objects.bulk_update(objs, ["id"])
+        with pytest.raises(ValueError):
+            Model2A.objects.bulk_update(objs, [])
+        assert Model2A.objects.bulk_update([], ["field1"]) == 0
+        assert Model2A.objects.bulk_update_counts([], ["field1"]) == {}
+
+    def test_bulk_update_disparate_keys(self):
+        from polymorphic.tests.models import (
+            DisparateKeysChild2,
+            DisparateKeysGrandChild2,
+            DisparateKeysParent,
+        )
+
+        p1 = DisparateKeysParent.objects.create(text="p1")
+        p2 = DisparateKeysParent.objects.create(text="p2")
+        # the primary keys of the child tables are those of the other parent rows
+        DisparateKeysChild2.objects.create(text="c", text_child2="c2", key=p2.pk)
+        DisparateKeysGrandChild2.objects.create(
+            text="g", text_child2="g2", text_grand_child="g3", key=p1.pk
+        )
+
+        objs = list(DisparateKeysParent.objects.order_by("pk"))
+        for obj in objs:
+            obj.text = f"{obj.text}x"
+            if isinstance(obj, DisparateKeysChild2):
+                obj.text_child2 = f"{obj.text_child2}y"
+            if isinstance(obj, DisparateKeysGrandChild2):
+                obj.text_grand_child = f"{obj.text_grand_child}z"
+
+        counts = DisparateKeysParent.objects.bulk_update_counts(
+            objs, ["text", "text_child2", "text_grand_child"]
+        )
+        assert counts == {
+            DisparateKeysParent: 4,
+            DisparateKeysChild2: 2,
+            DisparateKeysGrandChild2: 1,
+        }
+        assert [
+            obj.text for obj in DisparateKeysParent.objects.non_polymorphic().order_by("pk")
+        ] == ["p1x", "p2x", "cx", "gx"]
+        assert sorted(
+            DisparateKeysChild2.objects.non_polymorphic().values_list("key", "text_child2")
+        ) == [(p1.pk, "g2y"), (p2.pk, "c2y")]
+        assert DisparateKeysGrandChild2.objects.get().text_grand_child == "g3z"
+
+    def test_update_subclass_fields(self):
+        self.create_model2abcd()
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert (
+                Model2A.objects.filter(field1__in=["A1", "C1", "D1"]).update(Model2C___field3="x")
+                == 3
             )
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert list(Model2C.objects.order_by("pk").values_list("field3", flat=True)) == [
+            "x",
+            "x",
+        ]
+
+        # assignments to several tables are applied to the same rows
+        assert Model2A.objects.filter(field1="B1").update(field1="y", Model2B___field2="y") == 1
+        b = Model2B.objects.get(field1="y")
+        assert (b.field1, b.field2) == ("y", "y")
+        assert Model2B.objects.filter(field2="y").count() == 1
+
+        assert Model2B.objects.all().update(tests__Model2D___field4="z") == 3
+        assert Model2D.objects.get().field4 == "z"
+
+        # plain updates are passed on to Django
+        assert Model2A.objects.all().update(field1="all") == 4
+
+        # a field of a parent table is only updated on instances of ClassName
+        assert Model2A.objects.all().update(Model2C___field1="c") == 4
+        assert list(Model2A.objects.order_by("pk").values_list("field1", flat=True)) == [
+            "all",
+            "all",
+            "c",
+            "c",
+        ]
+        assert Model2A.objects.all().update(Model2C___field1="x", Model2B___field2="x") == 4
+        assert list(Model2A.objects.order_by("pk").values_list("field1", flat=True)) == [
+            "all",
+            "all",
+            "x",
+            "x",
+        ]
+        assert Model2B.objects.filter(field2="x").count() == 3
+
+        with pytest.raises(FieldDoesNotExist):
+            Model2A.objects.update(Model2B___nope=1)
+        with pytest.raises(FieldError):
+            Model2A.objects.update(Model2B___id=1)
+
+    def test_update_subclass_fields_disparate_keys(self):
+        from polymorphic.tests.models import (
+            DisparateKeysChild2,
+            DisparateKeysGrandChild2,
+            DisparateKeysParent,
+        )
+
+        p1 = DisparateKeysParent.objects.create(text="p1")
+        p2 = DisparateKeysParent.objects.create(text="p2")
+        # the primary keys of the child tables are those of the other parent rows
+        c = DisparateKeysChild2.objects.create(text="c", text_child2="c2", key=p2.pk)
+        g = DisparateKeysGrandChild2.objects.create(
+            text="g", text_child2="g2", text_grand_child="g3", key=p1.pk
+        )
+
+        assert (
+            DisparateKeysParent.objects.filter(pk=c.id).update(
+                DisparateKeysChild2___text_child2="x"
+            )
+            == 1
+        )
+        assert DisparateKeysChild2.objects.get(pk=c.pk).text_child2 == "x"
+        assert DisparateKeysChild2.objects.get(pk=g.pk).text_child2 == "g2"
+
+        assert (
+            DisparateKeysParent.objects.filter(pk=g.id).update(
+                text="y", DisparateKeysGrandChild2___text_grand_child="y"
+            )
+            == 1
+        )
+        g.refresh_from_db()
+        assert (g.text, g.text_child2, g.text_grand_child) == ("y", "g2", "y")
+        assert [obj.text for obj in DisparateKeysParent.objects.order_by("pk")] == [
+            "p1",
+            "p2",
+            "c",
+            "y",
+        ]
+
+        assert (
+            DisparateKeysChild2.objects.all().update(
+                DisparateKeysGrandChild2___text_grand_child="z"
+            )
+            == 2
+        )
+        assert DisparateKeysGrandChild2.objects.get().text_grand_child == "z"
+
+    def test_update_subclass_fields_f_expressions(self):
+        from django.db.models.functions import Concat
+
+        self.create_model2abcd()
+
+        assert (
+            Model2A.objects.all().update(
+                Model2B___field2=Concat(F("Model2B___field2"), Value("!"))
+            )
+            == 4
+        )
+        assert list(Model2B.objects.order_by("pk").values_list("field2", flat=True)) == [
+            "B2!",
+            "C2!",
+            "D2!",
+        ]
+        assert Model2B.objects.update(Model2C___field3=F("Model2C___field3")) == 3
+
+        # F() can only refer to the fields of the table that is updated
+        with pytest.raises(FieldError):
+            Model2A.objects.update(Model2C___field3=F("Model2B___field2"))
+        with pytest.raises(FieldError):
+            Model2A.objects.update(field1=F("Model2B___field2"))
+
+    def test_convert_from(self):
+        a1 = Model2A.objects.create(field1="A1")
+        a2 = Model2A.objects.create(field1="A2")
+        b = Model2B.objects.create(field1="B1", field2="B2")
+        c = Model2C.objects.create(field1="C1", field2="C2", field3="C3")
+
+        with CaptureQueriesContext(connection) as ctx:
+            converted = Model2C.objects.convert_from(
+                Model2A.objects.exclude(pk=a2.pk), defaults={"field2": "new2", "field3": "new3"}
+            )
+        assert converted == 2
+        # inserts into the Model2B and Model2C tables and one content type update
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]) == 2
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]) == 1
+
+        assert list(Model2A.objects.order_by("pk")) == [
+            Model2C(pk=a1.pk),
+            a2,
+            Model2C(pk=b.pk),
+            c,
+        ]
+        objs = list(Model2C.objects.order_by("pk"))
+        assert [(o.field1, o.field2, o.field3) for o in objs] == [
+            ("A1", "new2", "new3"),
+            ("B1", "B2", "new3"),
+            ("C1", "C2", "C3"),
+        ]
+
+        with pytest.raises(TypeError):
+            Model2C.objects.convert_from(Model2D.objects.all())
+        with pytest.raises(TypeError):
+            # a Model2C object can not be converted to Model2B
+            Model2B.objects.convert_from(Model2A.objects.all())
+
+    def test_demote_to(self):
+        a, b, c, d = self.create_model2abcd()
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert Model2B.objects.filter(field2__in=["C2", "D2"]).demote_to(Model2B) == 2
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("DELETE")]) == 2
+        assert list(Model2A.objects.order_by("pk")) == [a, b, Model2B(pk=c.pk), Model2B(pk=d.pk)]
+        assert not Model2C.objects.exists()
+        assert Model2B.objects.get(pk=d.pk).field2 == "D2"
+
+        assert Model2A.objects.all().demote_to(Model2A) == 3
+        assert list(Model2A.objects.order_by("pk").values_list("field1", flat=True)) == [
+            "A1",
+            "B1",
+            "C1",
+            "D1",
+        ]
+        assert all(type(o) is Model2A for o in Model2A.objects.all())
+        assert not Model2B.objects.exists()
+
+        with pytest.raises(TypeError):
+            Model2A.objects.all().demote_to(Model2B)
+
+    def test_demote_to_disparate_keys(self):
+        from polymorphic.tests.models import (
+            DisparateKeysChild2,
+            DisparateKeysGrandChild2,
+            DisparateKeysParent,
+        )
+
+        p1 = DisparateKeysParent.objects.create(text="keep-1")
+        p2 = DisparateKeysParent.objects.create(text="keep-2")
+        # the primary keys of the child tables are those of the other parent rows
+        c = DisparateKeysChild2.objects.create(text="c", text_child2="c2", key=p1.pk)
+        g = DisparateKeysGrandChild2.objects.create(
+            text="g", text_child2="g2", text_grand_child="g3", key=p2.pk
+        )
+
+        assert DisparateKeysChild2.objects.filter(pk=c.pk).demote_to(DisparateKeysParent) == 1
+        assert DisparateKeysParent.objects.get(pk=c.id).__class__ is DisparateKeysParent
+        assert list(DisparateKeysChild2.objects.all()) == [g]
+
+        assert DisparateKeysParent.objects.all().demote_to(DisparateKeysParent) == 1
+        assert not DisparateKeysChild2.objects.non_polymorphic().exists()
+        assert not DisparateKeysGrandChild2.objects.non_polymorphic().exists()
+        assert [(type(obj), obj.text) for obj in DisparateKeysParent.objects.order_by("pk")] == [
+            (DisparateKeysParent, "keep-1"),
+            (DisparateKeysParent, "keep-2"),
+            (DisparateKeysParent, "c"),
+            (DisparateKeysParent, "g"),
+        ]
+
+    def test_clone(self):
+        a, b, c, d = self.create_model2abcd()
+
+        with CaptureQueriesContext(connection) as ctx:
+            mapping = Model2A.objects.exclude(pk=b.pk).clone(
+                overrides={"field1": "copy", "Model2C___field3": "C3 copy"}, batch_size=2
+            )
+        # 2 root inserts with returning and one insert ... select per table and batch
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 2 + 1 + 1 + 1
+        assert set(mapping) == {a.pk, c.pk, d.pk}
+        assert Model2A.objects.count() == 7
+
+        copies = [Model2A.objects.get(pk=mapping[obj.pk]) for obj in (a, c, d)]
+        assert [type(obj) for obj in copies] == [Model2A, Model2C, Model2D]
+        assert all(obj.field1 == "copy" for obj in copies)
+        assert (copies[1].field2, copies[1].field3) == ("C2", "C3 copy")
+        assert (copies[2].field3, copies[2].field4) == ("C3 copy", "D4")
+        # the originals are unchanged
+        assert Model2D.objects.get(pk=d.pk).field3 == "D3"
+
+        ((old, new),) = Model2C.objects.filter(pk=c.pk).clone().items()
+        assert old == c.pk
+        assert Model2A.objects.get(pk=new) == Model2C(
+            pk=new, field1="C1", field2="C2", field3="C3"
+        )
+        assert Model2C.objects.count() == 5
+
+        # a field of a parent table is only overridden on instances of ClassName
+        mapping = Model2A.objects.filter(pk__in=[a.pk, b.pk, c.pk, d.pk]).clone(
+            overrides={"Model2C___field1": "C copy", "Model2D___field2": "D copy"}
+        )
+        copies = [Model2A.objects.get(pk=mapping[obj.pk]) for obj in (a, b, c, d)]
+        assert [obj.field1 for obj in copies] == ["A1", "B1", "C copy", "C copy"]
+        assert [obj.field2 for obj in copies[1:]] == ["B2", "C2", "D copy"]
+
+        with pytest.raises(FieldError):
+            Model2A.objects.all().clone(overrides={"id": 1})
+
+    def test_clone_disparate_keys(self):
+        from polymorphic.tests.models import DisparateKeysChild2, DisparateKeysParent
+
+        p = DisparateKeysParent.objects.create(text="p")
+        DisparateKeysChild2.objects.create(text="c", text_child2="c2", key=100)
+
+        # the child rows can not be copied with the primary keys of the copied parent rows
+        with pytest.raises(TypeError):
+            DisparateKeysParent.objects.all().clone()
+        assert DisparateKeysParent.objects.count() == 2
+
+        ((old, new),) = DisparateKeysParent.objects.filter(pk=p.pk).clone().items()
+        assert old == p.pk
+        assert DisparateKeysParent.objects.get(pk=new) == DisparateKeysParent(pk=new, text="p")
 
     def test_bulk_create_ignore_conflicts(self):
         try:
@@ -1668,6 +2344,91 @@ class PolymorphicTests(TransactionTestCase):
         # issues/615 fixes following line:
         assert pur.home == "Duckburg"
 
+    def test_to_columns(self):
+        a, b, c, d = self.create_model2abcd()
+        b2 = Model2B.objects.create(field1="B3", field2="B4")
+
+        with CaptureQueriesContext(connection) as ctx:
+            blocks = list(Model2A.objects.order_by("pk").to_columns())
+
+        # one base query and one per subclass table
+        assert len(ctx.captured_queries) == 4
+        assert [model for model, _ in blocks] == [Model2A, Model2B, Model2C, Model2D]
+        columns = dict(blocks)
+        assert columns[Model2A] == {
+            "id": [a.pk],
+            "polymorphic_ctype_id": [a.polymorphic_ctype_id],
+            "field1": ["A1"],
+        }
+        assert columns[Model2B]["field1"] == ["B1", "B3"]
+        assert columns[Model2B]["field2"] == ["B2", "B4"]
+        assert columns[Model2B]["model2a_ptr_id"] == [b.pk, b2.pk]
+        assert columns[Model2C]["field3"] == ["C3"]
+        assert columns[Model2D]["field4"] == ["D4"]
+        assert columns[Model2D]["id"] == [d.pk]
+
+        # filters are applied to the base query and batches split the stream
+        blocks = list(Model2A.objects.filter(field1__startswith="B").to_columns(batch_size=1))
+        assert [(model, cols["field2"]) for model, cols in blocks] == [
+            (Model2B, ["B2"]),
+            (Model2B, ["B4"]),
+        ]
+
+        blocks = list(Model2A.objects.non_polymorphic().order_by("pk").to_columns())
+        assert len(blocks) == 1
+        assert blocks[0][0] is Model2A
+        assert blocks[0][1]["field1"] == ["A1", "B1", "C1", "D1", "B3"]
+
+    def test_to_columns_missing_derived(self):
+        a, b, c, d = self.create_model2abcd()
+        stale_ct = ContentType.objects.create(app_label="tests", model="nonexisting")
+        Model2A.objects.filter(pk=a.pk).update(polymorphic_ctype=stale_ct)
+        d.delete(keep_parents=True)
+        # d's ctype still points to Model2D, so it should be fetched as a Model2C
+        Model2A.objects.non_polymorphic().filter(pk=d.pk).update(
+            polymorphic_ctype=ContentType.objects.get_for_model(Model2D)
+        )
+
+        columns = dict(Model2A.objects.order_by("pk").to_columns())
+        assert set(columns) == {Model2B, Model2C}
+        assert columns[Model2C]["field1"] == ["C1", "D1"]
+
+    def test_to_columns_disparate_keys(self):
+        from polymorphic.tests.models import (
+            DisparateKeysChild2,
+            DisparateKeysGrandChild2,
+            DisparateKeysParent,
+        )
+
+        p1 = DisparateKeysParent.objects.create(text="p1")
+        p2 = DisparateKeysParent.objects.create(text="p2")
+        # the primary keys of the child tables are those of the other parent rows
+        c = DisparateKeysChild2.objects.create(text="c", text_child2="c2", key=p2.pk)
+        g = DisparateKeysGrandChild2.objects.create(
+            text="g", text_child2="g2", text_grand_child="g3", key=p1.pk
+        )
+
+        columns = dict(DisparateKeysParent.objects.order_by("pk").to_columns())
+        assert set(columns) == {DisparateKeysParent, DisparateKeysChild2, DisparateKeysGrandChild2}
+        assert columns[DisparateKeysParent]["text"] == ["p1", "p2"]
+        assert columns[DisparateKeysChild2]["id"] == [c.id]
+        assert columns[DisparateKeysChild2]["key"] == [p2.pk]
+        assert columns[DisparateKeysChild2]["text_child2"] == ["c2"]
+        assert columns[DisparateKeysGrandChild2]["id"] == [g.id]
+        assert columns[DisparateKeysGrandChild2]["text_grand_child"] == ["g3"]
+
+        # querysets of a subclass match the rows by the subclass primary key
+        columns = dict(DisparateKeysChild2.objects.order_by("pk").to_columns())
+        assert columns[DisparateKeysChild2]["text"] == ["c"]
+        assert columns[DisparateKeysGrandChild2]["text"] == ["g"]
+
+    def test_to_columns_numpy(self):
+        np = pytest.importorskip("numpy")
+        self.create_model2abcd()
+        columns = dict(Model2A.objects.all().to_columns(numpy=True))
+        assert isinstance(columns[Model2B]["field2"], np.ndarray)
+        assert list(columns[Model2B]["field2"]) == ["B2"]
+
     def test_subqueries(self):
         pa1 = PlainA.objects.create(field1="plain1")
         PlainA.objects.create(field1="plain2")
@@ -1,9 +1,13 @@
-from django.test import TransactionTestCase
+import gc
+import weakref
+
+from django.test import RequestFactory, TransactionTestCase
 from polymorphic.tests.models import (
     Model2A,
     Model2B,
     Model2C,
     Model2D,
+    ModelWithPolyFK,
 )
 
 
@@ -32,3 +36,111 @@ class PerformanceTests(TransactionTestCase):
 
         with self.assertNumQueries(1):
             list(Model2D.objects.all().order_by("pk"))
+
+    def test_iterator_releases_objects(self):
+        """
+        iterator() must not keep the objects it has handed out alive until the end of the
+        chunk, or the memory of a chunked iteration grows with the chunk size.
+        """
+        for idx in range(3):
+            Model2A.objects.create(field1=f"A{idx}")
+            Model2B.objects.create(field1=f"A{idx}", field2=f"B{idx}")
+
+        objects = Model2A.objects.order_by("pk").iterator(chunk_size=100)
+        refs = []
+        for obj in objects:
+            refs.append(weakref.ref(obj))
+            del obj
+            gc.collect()
+            assert [ref() for ref in refs] == [None] * len(refs)
+        assert len(refs) == 6
+
+    def test_assert_polymorphic_queries(self):
+        from polymorphic.testing import assert_polymorphic_queries
+
+        Model2A.objects.create(field1="A")
+        Model2B.objects.create(field1="A", field2="B")
+        Model2C.objects.create(field1="A", field2="B", field3="C")
+
+        with assert_polymorphic_queries(3, base=1, subclass=2) as budget:
+            list(Model2A.objects.all())
+            list(Model2A.objects.non_polymorphic())
+        assert (budget.base_queries, budget.subclass_queries) == (1, 2)
+        assert budget.subclass_queries_per_model == {Model2B: 1, Model2C: 1}
+        assert budget.rows_per_type == {Model2A: 1, Model2B: 1, Model2C: 1}
+
+        @assert_polymorphic_queries(subclass=1)
+        def listing():
+            list(Model2B.objects.all())
+
+        listing()
+
+        with self.assertRaises(AssertionError) as cm:
+            with assert_polymorphic_queries(4):
+                for obj in Model2A.objects.non_polymorphic():
+                    list(Model2A.objects.filter(pk=obj.pk))
+                list(Model2A.objects.iterator(chunk_size=1))
+        assert str(cm.exception) == (
+            "Polymorphic querysets issued 8 queries, more than the budget of 4:\n"
+            "  4 base queries for 6 rows\n"
+            "  tests.Model2B: 2 subclass queries\n"
+            "  tests.Model2C: 2 subclass queries\n"
+            "Objects returned per model: tests.Model2A: 2, tests.Model2B: 2, tests.Model2C: 2"
+        )
+        with self.assertRaises(AssertionError):
+            with assert_polymorphic_queries(base=0, using="default"):
+                list(Model2A.objects.all())
+        with assert_polymorphic_queries(0, using="secondary"):
+            list(Model2A.objects.all())
+
+    def test_detect_n_plus_one(self):
+        from polymorphic.debug import (
+            PolymorphicNPlusOneError,
+            PolymorphicNPlusOneMiddleware,
+            PolymorphicNPlusOneWarning,
+            detect_n_plus_one,
+        )
+
+        for idx in range(3):
+            ModelWithPolyFK.objects.create(
+                name=f"{idx}", poly_fk=Model2B.objects.create(field1=f"A{idx}", field2=f"B{idx}")
+            )
+
+        with self.assertWarns(PolymorphicNPlusOneWarning) as cm:
+            with detect_n_plus_one(threshold=3):
+                for obj in Model2A.objects.non_polymorphic():
+                    obj.get_real_instance()
+        assert str(cm.warning).startswith(
+            "tests.Model2A: get_real_instance() downcast 3 objects one by one at "
+        )
+        assert "get_real_instances()" in str(cm.warning)
+        assert cm.filename == __file__
+
+        with detect_n_plus_one(threshold=4, action="raise") as detector:
+            for obj in Model2A.objects.non_polymorphic():
+                obj.get_real_instance()
+        assert list(detector.counts.values()) == [3]
+
+        with self.assertRaisesMessage(
+            PolymorphicNPlusOneError, "tests.ModelWithPolyFK.poly_fk: related object access"
+        ):
+            with detect_n_plus_one(threshold=3, action="raise"):
+                for obj in ModelWithPolyFK.objects.all():
+                    obj.poly_fk
+
+        with detect_n_plus_one(threshold=1, action="raise"):
+            for obj in ModelWithPolyFK.objects.select_related("poly_fk"):
+                obj.poly_fk
+            list(Model2A.objects.all())
+
+        def view(request):
+            for obj in Model2A.objects.non_polymorphic():
+                obj.model2b
+
+        with self.settings(
+            POLYMORPHIC_N_PLUS_ONE_THRESHOLD=2, POLYMORPHIC_N_PLUS_ONE_ACTION="raise"
+        ):
+            with self.assertRaisesMessage(
+                PolymorphicNPlusOneError, "tests.Model2B.model2a_ptr: parent to child link access"
+            ):
+                PolymorphicNPlusOneMiddleware(view)(RequestFactory().get("/"))
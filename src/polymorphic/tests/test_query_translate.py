@@ -90,3 +90,43 @@ class QueryTranslateTests(TestCase):
 
         result = _get_query_related_name(SubclassSelectorProxyModel)
         assert result == "subclassselectorproxymodel"
+
+    def test_translation_caches(self):
+        from polymorphic.query_translate import (
+            _translate_polymorphic_field_path,
+            _translate_q_lookups,
+            translate_polymorphic_field_path,
+            translate_polymorphic_Q_object,
+        )
+        from polymorphic.tests.models import Model2A, Model2B, Model2C
+        from polymorphic.utils import _clear_utility_caches
+
+        _clear_utility_caches()
+        assert translate_polymorphic_field_path(Model2A, "field1") == "field1"
+        assert _translate_polymorphic_field_path.cache_info().currsize == 0
+        for _ in range(2):
+            assert (
+                translate_polymorphic_field_path(Model2A, "-Model2C___field3")
+                == "-model2b__model2c__field3"
+            )
+        assert _translate_polymorphic_field_path.cache_info().hits == 1
+
+        # trees without polymorphic lookups are not copied
+        q = Q(field1="A") | ~Q(field1="B", pk__in=[1])
+        assert translate_polymorphic_Q_object(Model2A, q) is q
+
+        # trees of the same structure are translated once, with their own values
+        for value in ("C1", "C2"):
+            q = Q(field1="A") | Q(Model2C___field3=value, instance_of=Model2B)
+            translated = translate_polymorphic_Q_object(Model2A, q)
+            assert q.children[1].children[0] == ("Model2C___field3", value)
+            assert translated.connector == q.connector
+            assert translated.children[0] == ("field1", "A")
+            assert translated.children[1].children[0] == ("model2b__model2c__field3", value)
+            assert isinstance(translated.children[1].children[1], Q)
+        assert _translate_q_lookups.cache_info().hits == 1
+        assert list(Model2A.objects.filter(Q(Model2C___field3="C1") | Q(field1="x"))) == []
+
+        _clear_utility_caches()
+        assert _translate_polymorphic_field_path.cache_info().currsize == 0
+        assert _translate_q_lookups.cache_info().currsize == 0
@@ -17,10 +17,51 @@ from polymorphic.utils import (
     sort_by_subclass,
     route_to_ancestor,
     concrete_descendants,
+    warm_content_type_cache,
+    _lazy_ctype,
 )
 
 
 class UtilsTests(TransactionTestCase):
+    def test_warm_content_type_cache(self):
+        """
+        Test that the content types of all polymorphic models are loaded with one query
+        and are kept on clear_cache() when pinned.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext, override_settings
+
+        from polymorphic.apps import _warm_content_types_on_connect, _warmed_aliases
+
+        ctype = ContentType.objects.get_for_model(Model2D)
+        ContentType.objects.clear_cache()
+        assert not isinstance(_lazy_ctype(Model2D), ContentType)
+        with CaptureQueriesContext(connection) as ctx:
+            assert warm_content_type_cache() > 4
+        assert len(ctx.captured_queries) == 1
+        assert _lazy_ctype(Model2D) == ctype
+        with self.assertNumQueries(0):
+            ContentType.objects.get_for_id(ctype.pk)
+
+        try:
+            assert warm_content_type_cache(Model2D, pin=True) == 1
+            ContentType.objects.clear_cache()
+            assert _lazy_ctype(Model2D) == ctype
+            assert not isinstance(_lazy_ctype(Model2C), ContentType)
+
+            # the connection_created receiver only warms the configured databases once
+            with override_settings(POLYMORPHIC_WARM_CONTENT_TYPES=["other"]):
+                _warm_content_types_on_connect(connection)
+            assert not isinstance(_lazy_ctype(Model2C), ContentType)
+            with override_settings(POLYMORPHIC_WARM_CONTENT_TYPES=True):
+                _warm_content_types_on_connect(connection)
+                assert isinstance(_lazy_ctype(Model2C), ContentType)
+                with self.assertNumQueries(0):
+                    _warm_content_types_on_connect(connection)
+        finally:
+            _warmed_aliases.clear()
+            ContentType.objects._cache = {}
+
     def test_sort_by_subclass(self):
         assert sort_by_subclass(Model2D, Model2B, Model2D, Model2A, Model2C) == [
             Model2A,
@@ -51,6 +92,82 @@ class UtilsTests(TransactionTestCase):
             transform=lambda o: o.__class__,
         )
 
+    def test_reset_polymorphic_ctype_batched(self):
+        objs = [
+            Model2A.objects.create(field1="A1"),
+            Model2D.objects.create(field1="A1", field2="B2", field3="C3", field4="D4"),
+            Model2B.objects.create(field1="A1", field2="B2"),
+            Model2C.objects.create(field1="A1", field2="B2", field3="C3"),
+            Model2B.objects.create(field1="A1", field2="B2"),
+        ]
+        Model2A.objects.all().update(polymorphic_ctype_id=None)
+
+        calls = []
+        reset_polymorphic_ctype(
+            Model2A,
+            Model2B,
+            Model2C,
+            Model2D,
+            batch_size=2,
+            progress=lambda checkpoint, processed: calls.append((checkpoint, processed)),
+        )
+        assert calls == [(objs[1].pk, 2), (objs[3].pk, 4), (objs[4].pk, 5)]
+        self.assertQuerySetEqual(
+            Model2A.objects.order_by("pk"),
+            [Model2A, Model2D, Model2B, Model2C, Model2B],
+            transform=lambda o: o.__class__,
+        )
+
+        # resume after a checkpoint
+        Model2A.objects.all().update(polymorphic_ctype_id=None)
+        reset_polymorphic_ctype(
+            Model2A, Model2B, Model2C, Model2D, batch_size=10, resume_from=objs[2].pk
+        )
+        assert list(
+            Model2A.objects.non_polymorphic()
+            .order_by("pk")
+            .values_list("polymorphic_ctype_id", flat=True)
+        ) == [
+            None,
+            None,
+            None,
+            ContentType.objects.get_for_model(Model2C).pk,
+            ContentType.objects.get_for_model(Model2B).pk,
+        ]
+
+    def test_reset_polymorphic_ctype_batched_hierarchies(self):
+        Model2A.objects.create(field1="A1")
+        Model2C.objects.create(field1="A1", field2="B2", field3="C3")
+        Enhance_Base.objects.create(field_b="b")
+        Enhance_Inherit.objects.create(field_b="b", field_p="p", field_i="i")
+        Enhance_Inherit.objects.create(field_b="b", field_p="p", field_i="i")
+        Model2A.objects.all().update(polymorphic_ctype_id=None)
+        Enhance_Base.objects.all().update(polymorphic_ctype_id=None)
+
+        calls = []
+        reset_polymorphic_ctype(
+            Model2A,
+            Model2C,
+            Enhance_Base,
+            Enhance_Inherit,
+            batch_size=2,
+            progress=lambda checkpoint, processed: calls.append(processed),
+        )
+        # each base table is walked on its own, a full batch of the first table is
+        # followed by the batches of the second one
+        assert len(calls) == 3 and calls[-1] == 5
+        self.assertQuerySetEqual(
+            Model2A.objects.order_by("pk"), [Model2A, Model2C], transform=lambda o: o.__class__
+        )
+        self.assertQuerySetEqual(
+            Enhance_Base.objects.order_by("pk"),
+            [Enhance_Base, Enhance_Inherit, Enhance_Inherit],
+            transform=lambda o: o.__class__,
+        )
+
+        with pytest.raises(ValueError):
+            reset_polymorphic_ctype(Model2A, Enhance_Base, batch_size=2, resume_from=1)
+
     def test_get_base_polymorphic_model(self):
         """
         Test that finding the base polymorphic model works.
@@ -0,0 +1,87 @@
+"""
+Pluggable tracing of the queries polymorphic querysets issue.
+
+The tracer interface is the subset of the OpenTelemetry tracing API that is used here, so
+an OpenTelemetry tracer can be installed directly:
+
+.. code-block:: python
+
+    from opentelemetry import trace
+    from polymorphic.tracing import set_tracer
+
+    set_tracer(trace.get_tracer("django-polymorphic"))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any, ContextManager, Protocol
+
+__all__ = ("Span", "Tracer", "NoOpTracer", "get_tracer", "set_tracer")
+
+
+class Span(Protocol):
+    """The span interface used by django-polymorphic."""
+
+    def is_recording(self) -> bool: ...
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+
+class Tracer(Protocol):
+    """The tracer interface used by django-polymorphic."""
+
+    def start_as_current_span(
+        self, name: str, attributes: Mapping[str, Any] | None = None, **kwargs: Any
+    ) -> ContextManager[Span]: ...
+
+
+class _NoOpSpan:
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> _NoOpSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+class NoOpTracer:
+    """The default tracer, which records nothing."""
+
+    def start_as_current_span(
+        self, name: str, attributes: Mapping[str, Any] | None = None, **kwargs: Any
+    ) -> ContextManager[Span]:
+        return _NO_OP_SPAN
+
+
+_tracer: Tracer = NoOpTracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the installed tracer."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """
+    Install the tracer the spans of polymorphic querysets are started with.
+
+    :param tracer: An OpenTelemetry compatible tracer, or ``None`` to restore the
+        :class:`NoOpTracer`.
+    """
+    global _tracer
+    _tracer = NoOpTracer() if tracer is None else tracer
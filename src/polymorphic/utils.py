@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import time
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, cast
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import FieldError
-from django.db import DEFAULT_DB_ALIAS, models
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import DEFAULT_DB_ALIAS, models, transaction
 from django.db.models import Model, Q, Subquery
 
 
@@ -30,9 +32,27 @@ def reset_polymorphic_ctype(*models: type[models.Model], **filters: Any) -> None
 
     Add ``ignore_existing=True`` to skip models which already
     have a polymorphic content type.
+
+    By default one ``UPDATE`` is issued per model. For large tables pass ``batch_size``
+    to walk the table in primary key order instead, updating ``batch_size`` rows at a
+    time. Each batch is committed in its own transaction, so this should not be run in
+    an atomic block (e.g. use a non-atomic migration). The batched mode accepts:
+
+    * ``sleep``: the number of seconds to wait between batches.
+    * ``resume_from``: a primary key checkpoint; only rows with a larger primary key are
+      updated.
+    * ``progress``: a callable that is called after each batch with the checkpoint
+      (the last primary key that was updated) and the number of rows processed so far.
+
+    Models of different inheritance hierarchies are updated one base table after the
+    other. ``resume_from`` can only be used with models of a single hierarchy.
     """
     using = filters.pop("using", DEFAULT_DB_ALIAS)
     ignore_existing = filters.pop("ignore_existing", False)
+    batch_size = filters.pop("batch_size", None)
+    sleep = filters.pop("sleep", 0)
+    checkpoint = filters.pop("resume_from", None)
+    progress = filters.pop("progress", None)
 
     models_list: list[type[Model]] = sort_by_subclass(*models)
     if ignore_existing:
@@ -40,17 +60,58 @@ def reset_polymorphic_ctype(*models: type[models.Model], **filters: Any) -> None
         # just assigned the an content type to. hence, start with child first.
         models_list = list(reversed(models_list))
 
-    for new_model in models_list:
-        new_ct = ContentType.objects.db_manager(using).get_for_model(
-            new_model, for_concrete_model=False
+    def reset(reset_models: list[type[Model]], **bounds: Any) -> None:
+        for new_model in reset_models:
+            new_ct = ContentType.objects.db_manager(using).get_for_model(
+                new_model, for_concrete_model=False
+            )
+
+            qs = new_model.objects.db_manager(using)  # type: ignore[attr-defined]
+            if ignore_existing:
+                qs = qs.filter(polymorphic_ctype__isnull=True)
+            if filters or bounds:
+                qs = qs.filter(**filters, **bounds)
+            qs.update(polymorphic_ctype=new_ct, **_type_path_update(new_model))
+
+    if not models_list:
+        return
+    if not batch_size:
+        if checkpoint is not None:
+            reset(models_list, pk__gt=checkpoint)
+        else:
+            reset(models_list)
+        return
+
+    # Each inheritance hierarchy has its own base table to walk in primary key order.
+    hierarchies: dict[type[Model], list[type[Model]]] = {}
+    for model in models_list:
+        base_model = get_base_polymorphic_model(model) or model
+        hierarchies.setdefault(base_model, []).append(model)
+    if checkpoint is not None and len(hierarchies) > 1:
+        raise ValueError(
+            "resume_from can only be used with models of a single inheritance hierarchy, "
+            f"got: {', '.join(model.__name__ for model in hierarchies)}"
         )
 
-        qs = new_model.objects.db_manager(using)  # type: ignore[attr-defined]
-        if ignore_existing:
-            qs = qs.filter(polymorphic_ctype__isnull=True)
-        if filters:
-            qs = qs.filter(**filters)
-        qs.update(polymorphic_ctype=new_ct)
+    processed = 0
+    for base_model, hierarchy_models in hierarchies.items():
+        base_qs = base_model._base_manager.db_manager(using).order_by("pk")
+        while True:
+            bounds = {} if checkpoint is None else {"pk__gt": checkpoint}
+            pks = list(base_qs.filter(**bounds).values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            with transaction.atomic(using=using):
+                reset(hierarchy_models, pk__lte=pks[-1], **bounds)
+            checkpoint = pks[-1]
+            processed += len(pks)
+            if progress:
+                progress(checkpoint, processed)
+            if len(pks) < batch_size:
+                break
+            if sleep:
+                time.sleep(sleep)
+        checkpoint = None
 
 
 def _compare_mro(cls1: type, cls2: type) -> int:
@@ -178,6 +239,76 @@ def concrete_descendants(
     return result
 
 
+@lru_cache(maxsize=None)
+def get_polymorphic_type_path(model: type[models.Model]) -> str | None:
+    """
+    Return the materialized type path of a polymorphic model: the lower case labels of
+    the model and its polymorphic ancestors, base model first, e.g.
+    ``/app.modela/app.modelb/`` for ``ModelB(ModelA)``. Models with several polymorphic
+    parents follow the first one. Returns None if the hierarchy of the model has no
+    :class:`~polymorphic.models.PolymorphicTypePathField`. Results are cached.
+    """
+    from polymorphic.models import PolymorphicModel
+
+    try:
+        model._meta.get_field("polymorphic_type_path")
+    except FieldDoesNotExist:
+        return None
+
+    labels: list[str] = []
+    cls: type[models.Model] | None = model
+    while cls is not None:
+        labels.append(cls._meta.label_lower)
+        cls = next(
+            (
+                base
+                for base in cls.__mro__[1:]
+                if issubclass(base, PolymorphicModel)
+                and base is not PolymorphicModel
+                and not base._meta.abstract
+            ),
+            None,
+        )
+    return f"/{'/'.join(reversed(labels))}/"
+
+
+def _type_path_update(model: type[models.Model]) -> dict[str, str]:
+    """
+    The values to update along with the ``polymorphic_ctype`` of ``model``: the type
+    path, if the hierarchy has one.
+    """
+    path = get_polymorphic_type_path(model)
+    return {} if path is None else {"polymorphic_type_path": path}
+
+
+def reset_polymorphic_type_path(
+    base_model: type[models.Model], using: str = DEFAULT_DB_ALIAS, **filters: Any
+) -> int:
+    """
+    Set the ``polymorphic_type_path`` of the rows of a hierarchy to the type path of their
+    ``polymorphic_ctype``, with one ``UPDATE`` per model of the hierarchy. Only rows with
+    a different path are updated. ``filters`` restrict the rows, e.g. ``pk__in=...``.
+
+    :return: The number of updated rows.
+    """
+    if get_polymorphic_type_path(base_model) is None:
+        return 0
+    updated = 0
+    hierarchy = [base_model, *concrete_descendants(base_model, include_proxy=True)]
+    ctypes = ContentType.objects.db_manager(using).get_for_models(
+        *hierarchy, for_concrete_models=False
+    )
+    queryset = base_model._base_manager.db_manager(using).filter(**filters)
+    for model, ctype in ctypes.items():
+        path = get_polymorphic_type_path(model)
+        updated += (
+            queryset.filter(polymorphic_ctype=ctype)
+            .exclude(polymorphic_type_path=path)
+            .update(polymorphic_type_path=path)
+        )
+    return updated
+
+
 def prepare_for_copy(obj: models.Model) -> None:
     """
     Prepare a model instance for copying by resetting all primary keys and parent table
@@ -273,6 +404,86 @@ def lazy_ctype(model: type[models.Model], using: str = DEFAULT_DB_ALIAS) -> Cont
     )
 
 
+class _PinnedContentTypeCache(dict[str, dict[Any, ContentType]]):
+    """
+    A replacement for the cache of the :class:`~django.contrib.contenttypes.models.ContentType`
+    manager that keeps the pinned content types when it is cleared.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.pinned: defaultdict[str, dict[Any, ContentType]] = defaultdict(dict)
+
+    def clear(self) -> None:
+        super().clear()
+        for using, entries in self.pinned.items():
+            self[using] = dict(entries)
+
+
+def warm_content_type_cache(
+    *models: type[models.Model], using: str = DEFAULT_DB_ALIAS, pin: bool | None = None
+) -> int:
+    """
+    Load the content types of polymorphic models into the
+    :class:`~django.contrib.contenttypes.models.ContentType` cache of a database with a
+    single query. Until a content type is cached, every process looks it up on first
+    use and :func:`lazy_ctype` falls back to a subquery. Content types that do not
+    exist yet are skipped, none are created.
+
+    :param models: The models to load the content types of, including their proxy
+        models. Defaults to all polymorphic models.
+    :param using: The database to load the content types from.
+    :param pin: Keep the loaded content types in the cache when
+        ``ContentType.objects.clear_cache()`` is called. Defaults to the
+        ``POLYMORPHIC_PIN_CONTENT_TYPES`` setting.
+    :return: The number of loaded content types.
+    """
+    from django.conf import settings
+
+    from .models import PolymorphicModel
+
+    if not models:
+        models = tuple(model for model in apps.get_models() if issubclass(model, PolymorphicModel))
+    if pin is None:
+        pin = getattr(settings, "POLYMORPHIC_PIN_CONTENT_TYPES", False)
+
+    needed: defaultdict[str, set[str]] = defaultdict(set)
+    for model in models:
+        needed[model._meta.app_label].add(model._meta.model_name)  # type: ignore[arg-type]
+    if not needed:
+        return 0
+    manager = ContentType.objects.db_manager(using)
+    ctypes = list(
+        manager.filter(
+            Q.create(  # type: ignore[attr-defined]
+                [Q(app_label=app_label, model__in=names) for app_label, names in needed.items()],
+                connector=Q.OR,
+            )
+        )
+    )
+
+    _cache_content_types(ctypes, using=using, pin=pin)
+    return len(ctypes)
+
+
+def _cache_content_types(
+    ctypes: Iterable[ContentType], using: str = DEFAULT_DB_ALIAS, pin: bool = False
+) -> None:
+    """
+    Add content types to the cache of the :class:`~django.contrib.contenttypes.models.ContentType`
+    manager, optionally pinning them so they survive ``clear_cache()``.
+    """
+    manager = ContentType.objects
+    if pin and not isinstance(manager._cache, _PinnedContentTypeCache):  # type: ignore[attr-defined]
+        manager._cache = _PinnedContentTypeCache(manager._cache)  # type: ignore[attr-defined]
+    cache = manager._cache  # type: ignore[attr-defined]
+    for ctype in ctypes:
+        manager._add_to_cache(using, ctype)  # type: ignore[attr-defined]
+        if pin:
+            cache.pinned[using][ctype.app_label, ctype.model] = ctype
+            cache.pinned[using][ctype.pk] = ctype
+
+
 @lru_cache(maxsize=None)
 def _map_queryname_to_class(base_model: type[models.Model], qry_name: str) -> type[models.Model]:
     """Try to match a model name in a query to a model class"""
@@ -298,8 +509,12 @@ def _map_queryname_to_class(base_model: type[models.Model], qry_name: str) -> ty
 
 
 def _clear_utility_caches() -> None:
-    """Clear all lru_cache caches in this module."""
+    """Clear all lru_cache caches in this module and the query translation caches."""
+    from .query_translate import _clear_translation_caches
+
     get_base_polymorphic_model.cache_clear()
     route_to_ancestor.cache_clear()
     concrete_descendants.cache_clear()
+    get_polymorphic_type_path.cache_clear()
     _map_queryname_to_class.cache_clear()
+    _clear_translation_caches()